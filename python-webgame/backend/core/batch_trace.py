@@ -0,0 +1,150 @@
+"""
+Batch Trace - 여러 보드의 빛 경로를 NumPy로 한 번에 추적
+"""
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from backend.core.game_engine import (
+    GameEngine, BEAM_COLORS, CELL_CODES, CellType, COLOR_INDEX, DIRECTION_DX, DIRECTION_DY,
+    DIRECTION_INDEX, TRANSITION_TABLE, color_hits
+)
+
+COLOR_COUNT = len(BEAM_COLORS)
+MAX_OUTPUTS = max(len(outputs) for outputs in TRANSITION_TABLE)
+
+# 전이 테이블을 배열로 변환: 상태 키 → 출력 수, 출력별 (방향, 색상)
+OUT_COUNT = np.array([len(outputs) for outputs in TRANSITION_TABLE], dtype=np.int8)
+OUT_DIRECTION = np.zeros((len(TRANSITION_TABLE), MAX_OUTPUTS), dtype=np.int8)
+OUT_COLOR = np.zeros((len(TRANSITION_TABLE), MAX_OUTPUTS), dtype=np.int8)
+for _key, _outputs in enumerate(TRANSITION_TABLE):
+    for _j, (_d, _c) in enumerate(_outputs):
+        OUT_DIRECTION[_key, _j] = _d
+        OUT_COLOR[_key, _j] = _c
+
+DX = np.array(DIRECTION_DX, dtype=np.int64)
+DY = np.array(DIRECTION_DY, dtype=np.int64)
+# (색상 점유 마스크, 요구 색상) → 히트 여부
+HIT_TABLE = np.array([
+    [color_hits(mask, color) for color in BEAM_COLORS]
+    for mask in range(1 << COLOR_COUNT)
+], dtype=bool)
+
+Placements = Dict[Tuple[int, int], str]  # {(x, y): piece_type}
+
+
+class BatchTracer:
+    """같은 레벨의 여러 보드를 한꺼번에 추적하는 추적기
+
+    보드 N개를 (N, 높이, 너비) 셀 코드 배열로 쌓고, 모든 보드의 모든 빔을
+    한 단계씩 함께 진행합니다. 매 단계 전이와 방문 여부는 배열 인덱싱으로
+    조회하므로 파이썬 루프는 가장 긴 빔 길이만큼만 돕니다. 보드마다 하나의
+    방문 배열을 쓰며, 결과(타겟별 색상 점유)는 GameEngine과 같습니다.
+    """
+
+    def __init__(self, level_data: dict, max_states: int = 1 << 26):
+        # 한 번에 추적할 보드 수는 방문 배열 크기(보드 수 × 셀 수 × 4)가 max_states를 넘지 않도록 제한
+        self.max_states = max_states
+        engine = GameEngine()
+        engine.track_changes = False
+        state = engine.start_new_game(level_data)
+        self.width = state.grid.width
+        self.height = state.grid.height
+        self.base_board = np.frombuffer(bytes(state.grid.cells), dtype=np.uint8).reshape(
+            self.height, self.width
+        )
+        self.emitters = [
+            (e.y * self.width + e.x, DIRECTION_INDEX[e.direction.value], COLOR_INDEX[e.color])
+            for e in state.emitters if e.active
+        ]
+        self.target_cells = np.array(
+            [t.y * self.width + t.x for t in state.targets], dtype=np.int64
+        )
+        self.target_colors = np.array(
+            [COLOR_INDEX[t.required_color] for t in state.targets], dtype=np.int64
+        )
+
+    def stack(self, placements: Iterable[Placements]) -> np.ndarray:
+        """배치 목록으로 (N, 높이, 너비) 보드 배열 생성"""
+        placements = list(placements)
+        boards = np.repeat(self.base_board[np.newaxis], len(placements), axis=0)
+        for b, placed in enumerate(placements):
+            for (x, y), piece_type in placed.items():
+                boards[b, y, x] = CELL_CODES[CellType(piece_type)]
+        return boards
+
+    def coverage(self, boards: np.ndarray) -> np.ndarray:
+        """보드별 셀 색상 점유 마스크 (N, 셀 수)"""
+        boards = np.ascontiguousarray(boards, dtype=np.uint8)
+        n = boards.shape[0]
+        cell_count = self.width * self.height
+        chunk = max(1, self.max_states // (cell_count * 4))
+        if n <= chunk:
+            return self._coverage(boards)
+        return np.concatenate([self._coverage(boards[i:i + chunk]) for i in range(0, n, chunk)])
+
+    def _coverage(self, boards: np.ndarray) -> np.ndarray:
+        n = boards.shape[0]
+        width, height = self.width, self.height
+        cell_count = width * height
+        flat_boards = boards.reshape(-1)
+        # 셀별 색상 점유 비트와 (셀, 방향)별 방문한 색상 비트
+        coverage = np.zeros(n * cell_count, dtype=np.uint8)
+        visited = np.zeros(n * cell_count * 4, dtype=np.uint8)
+        if n == 0 or not self.emitters:
+            return coverage.reshape(n, cell_count)
+
+        # 빔 상태: 보드, 셀 인덱스, 방향, 색상 (모든 보드 × 모든 발광기에서 시작)
+        board_ids = np.repeat(np.arange(n, dtype=np.int64), len(self.emitters))
+        emitters = np.array(self.emitters, dtype=np.int64)
+        cells = np.tile(emitters[:, 0], n)
+        directions = np.tile(emitters[:, 1], n)
+        colors = np.tile(emitters[:, 2], n)
+
+        while board_ids.size:
+            # 다음 위치로 이동하고 경계를 벗어난 빔 제거
+            x = cells % width + DX[directions]
+            y = cells // width + DY[directions]
+            inside = (x >= 0) & (x < width) & (y >= 0) & (y < height)
+            board_ids, directions, colors = board_ids[inside], directions[inside], colors[inside]
+            cells = y[inside] * width + x[inside]
+
+            # 이미 확장한 상태와 같은 단계의 중복 상태 제거
+            board_cells = board_ids * cell_count + cells
+            slots = board_cells * 4 + directions
+            bits = (1 << colors).astype(np.uint8)
+            fresh = np.flatnonzero((visited[slots] & bits) == 0)
+            _, first = np.unique(slots[fresh] * COLOR_COUNT + colors[fresh], return_index=True)
+            keep = fresh[first]
+            board_ids, cells, directions, colors = (
+                board_ids[keep], cells[keep], directions[keep], colors[keep]
+            )
+            board_cells, bits = board_cells[keep], bits[keep]
+            np.bitwise_or.at(visited, slots[keep], bits)
+            np.bitwise_or.at(coverage, board_cells, bits)
+
+            # 전이 테이블 조회 후 출력마다 새 빔 생성
+            keys = ((flat_boards[board_cells].astype(np.int64) << 2) | directions) * COLOR_COUNT + colors
+            counts = OUT_COUNT[keys]
+            parts = []
+            for j in range(MAX_OUTPUTS):
+                has_output = counts > j
+                if has_output.any():
+                    k = keys[has_output]
+                    parts.append((board_ids[has_output], cells[has_output],
+                                  OUT_DIRECTION[k, j].astype(np.int64),
+                                  OUT_COLOR[k, j].astype(np.int64)))
+            if not parts:
+                break
+            board_ids, cells, directions, colors = (np.concatenate(p) for p in zip(*parts))
+
+        return coverage.reshape(n, cell_count)
+
+    def trace(self, boards: np.ndarray) -> np.ndarray:
+        """보드별 타겟 히트 여부 (N, 타겟 수)"""
+        masks = self.coverage(boards)[:, self.target_cells]
+        return HIT_TABLE[masks, self.target_colors]
+
+    def solved(self, boards: np.ndarray) -> np.ndarray:
+        """보드별 모든 타겟 히트 여부 (N,)"""
+        return self.trace(boards).all(axis=1)
@@ -2,11 +2,17 @@
 Mirror Maze Game Engine
 핵심 게임 로직 처리
 """
-from typing import List, Dict, Tuple, Optional
+from typing import List, Dict, Tuple, Optional, Set
 from dataclasses import dataclass, field
 from enum import Enum
+from collections import OrderedDict, deque
+from datetime import datetime
+import hashlib
 import math
 
+from backend.core.trace_cache import TraceCache
+from backend.models.game_models import Move
+
 class CellType(Enum):
     EMPTY = "empty"
     WALL = "wall"
@@ -33,6 +39,159 @@ class BeamColor(Enum):
     CYAN = "cyan"       # Blue + Green
     MAGENTA = "magenta" # Red + Blue
 
+MAX_HISTORY = 1000  # 되돌리기 히스토리 최대 노드 수
+PATH_SNAPSHOTS = 16  # 빛 경로를 보관하는 히스토리 노드 수 (최근에 계산한 노드부터)
+# 세션 메모리 추정용 대략의 크기 (바이트, tracemalloc 측정값)
+HISTORY_NODE_BYTES = 900   # 히스토리 노드 하나 (Move 포함)
+TRACED_CELL_BYTES = 180    # 캐시된 추적 결과의 셀 하나 (경로 좌표와 점유 마스크)
+CHANGE_CELL_BYTES = 60     # 델타용 변경 기록의 빔 구간 셀 하나
+
+# 정수 코드 테이블 (추적 루프에서 Enum 비교 대신 사용)
+CELL_TYPES: List[CellType] = list(CellType)
+CELL_CODES: Dict[CellType, int] = {cell: code for code, cell in enumerate(CELL_TYPES)}
+CELL_VALUES: List[str] = [cell.value for cell in CELL_TYPES]
+DIRECTIONS: List[Direction] = list(Direction)
+DIRECTION_INDEX: Dict[Tuple[int, int], int] = {d.value: i for i, d in enumerate(DIRECTIONS)}
+DIRECTION_DX: List[int] = [d.value[0] for d in DIRECTIONS]
+DIRECTION_DY: List[int] = [d.value[1] for d in DIRECTIONS]
+BEAM_COLORS: List[BeamColor] = list(BeamColor)
+COLOR_INDEX: Dict[BeamColor, int] = {color: i for i, color in enumerate(BEAM_COLORS)}
+
+DEFAULT_GRID_SIZE = 10
+MAX_GRID_SIZE = 1000
+
+EMPTY_CODE = CELL_CODES[CellType.EMPTY]
+WALL_CODE = CELL_CODES[CellType.WALL]
+
+# 빔 색상별 RGB 성분 (색 혼합 판정용)
+COLOR_RGB: Dict[BeamColor, int] = {
+    BeamColor.WHITE: 0b111,
+    BeamColor.RED: 0b001,
+    BeamColor.GREEN: 0b010,
+    BeamColor.BLUE: 0b100,
+    BeamColor.YELLOW: 0b011,   # Red + Green
+    BeamColor.CYAN: 0b110,     # Blue + Green
+    BeamColor.MAGENTA: 0b101,  # Red + Blue
+}
+
+def _mix_rgb(mask: int) -> int:
+    """점유 마스크에 포함된 빔 색상들을 더한 RGB 성분"""
+    rgb = 0
+    for color in BEAM_COLORS:
+        if mask >> COLOR_INDEX[color] & 1:
+            rgb |= COLOR_RGB[color]
+    return rgb
+
+# 색상 점유 마스크(셀을 지난 빔 색상마다 1 << 색상 인덱스 비트) → 혼합된 RGB 성분
+MIXED_RGB: List[int] = [_mix_rgb(mask) for mask in range(1 << len(BEAM_COLORS))]
+
+def color_hits(mask: int, required_color: BeamColor) -> bool:
+    """점유 마스크가 요구 색상을 만족하는지 (같은 색 빔 또는 색 혼합)"""
+    return bool(mask >> COLOR_INDEX[required_color] & 1) or MIXED_RGB[mask] == COLOR_RGB[required_color]
+
+Transition = List[Tuple[Direction, BeamColor]]
+
+def _turn_left(direction: Direction) -> Direction:
+    dx, dy = direction.value
+    return Direction((dy, -dx))
+
+def _turn_right(direction: Direction) -> Direction:
+    dx, dy = direction.value
+    return Direction((-dy, dx))
+
+def _filter_rule(filter_color: BeamColor):
+    """같은 색은 통과, 백색광은 필터 색으로 변경, 나머지는 차단"""
+    def rule(direction: Direction, color: BeamColor) -> Transition:
+        if color == filter_color:
+            return [(direction, color)]
+        if color == BeamColor.WHITE:
+            return [(direction, filter_color)]
+        return []
+    return rule
+
+def _prism_rule(direction: Direction, color: BeamColor) -> Transition:
+    """백색광을 빨강(왼쪽), 초록(직진), 파랑(오른쪽)으로 분리"""
+    if color != BeamColor.WHITE:
+        return [(direction, color)]
+    return [
+        (_turn_left(direction), BeamColor.RED),
+        (direction, BeamColor.GREEN),
+        (_turn_right(direction), BeamColor.BLUE),
+    ]
+
+# 셀 종류별 빛 처리 규칙: (입사 방향, 색상) → [(출사 방향, 색상), ...]
+# 새 조각은 이 표에 규칙을 추가하면 추적기 수정 없이 동작합니다.
+PIECE_RULES = {
+    CellType.EMPTY: lambda d, c: [(d, c)],
+    CellType.WALL: lambda d, c: [],
+    CellType.MIRROR_LEFT: lambda d, c: [(Direction((d.value[1], d.value[0])), c)],     # \ 거울
+    CellType.MIRROR_RIGHT: lambda d, c: [(Direction((-d.value[1], -d.value[0])), c)],  # / 거울
+    CellType.SPLITTER: lambda d, c: [(d, c), (_turn_right(d), c)],
+    CellType.FILTER_RED: _filter_rule(BeamColor.RED),
+    CellType.FILTER_BLUE: _filter_rule(BeamColor.BLUE),
+    CellType.FILTER_GREEN: _filter_rule(BeamColor.GREEN),
+    CellType.PRISM: _prism_rule,
+}
+
+# (셀, 방향, 색상) → [(방향, 색상), ...] 전이 테이블 (임포트 시 한 번 생성)
+TRANSITIONS: Dict[Tuple[CellType, Direction, BeamColor], Transition] = {
+    (cell, direction, color): PIECE_RULES[cell](direction, color)
+    for cell in CELL_TYPES
+    for direction in DIRECTIONS
+    for color in BEAM_COLORS
+}
+
+# 추적기용 정수 인덱스 테이블: ((셀 코드 << 2) | 방향) * 색상 수 + 색상 → ((방향, 색상), ...)
+TRANSITION_TABLE: List[Tuple[Tuple[int, int], ...]] = [
+    tuple(
+        (DIRECTION_INDEX[out_direction.value], COLOR_INDEX[out_color])
+        for out_direction, out_color in TRANSITIONS[(cell, direction, color)]
+    )
+    for cell in CELL_TYPES
+    for direction in DIRECTIONS
+    for color in BEAM_COLORS
+]
+
+class Board:
+    """bytearray 기반 게임 보드
+
+    셀을 행 우선 순서의 정수 코드로 저장합니다. 셀당 1바이트만 사용하며
+    추적기는 `cells`를 직접 인덱싱합니다.
+    """
+    __slots__ = ("width", "height", "cells")
+    
+    def __init__(self, width: int, height: int, cells: Optional[bytearray] = None):
+        self.width = width
+        self.height = height
+        self.cells = cells if cells is not None else bytearray(width * height)
+    
+    def get(self, x: int, y: int) -> CellType:
+        return CELL_TYPES[self.cells[y * self.width + x]]
+    
+    def set(self, x: int, y: int, cell: CellType):
+        self.cells[y * self.width + x] = CELL_CODES[cell]
+    
+    def copy(self) -> "Board":
+        return Board(self.width, self.height, bytearray(self.cells))
+    
+    def __getitem__(self, y: int) -> List[CellType]:
+        """행 조회 (grid[y][x] 형태의 읽기 호환용)"""
+        start = y * self.width
+        return [CELL_TYPES[code] for code in self.cells[start:start + self.width]]
+    
+    def __len__(self) -> int:
+        return self.height
+    
+    def to_list(self) -> List[List[str]]:
+        """JSON 직렬화용 중첩 리스트"""
+        values = CELL_VALUES
+        width = self.width
+        cells = self.cells
+        return [
+            [values[code] for code in cells[start:start + width]]
+            for start in range(0, width * self.height, width)
+        ]
+
 @dataclass
 class LightBeam:
     """빛 빔 클래스"""
@@ -60,10 +219,47 @@ class Target:
     required_color: BeamColor
     is_hit: bool = False
 
+@dataclass
+class StateChange:
+    """한 버전에서 바뀐 내용 (델타 응답용)"""
+    version: int
+    cells: Dict[int, str]              # 셀 인덱스 → 새 셀 값
+    paths_added: List[Dict]
+    paths_removed: List[str]           # 빔 구간 ID
+    targets: Dict[int, bool]           # 타겟 인덱스 → 히트 여부
+
+@dataclass
+class HistoryNode:
+    """되돌리기 히스토리 노드
+
+    보드 전체 대신 부모 노드에서 바뀐 셀 하나와 조각 수 변화만 보관하고,
+    이 노드 상태에서 계산한 빛 경로 캐시를 발광기별 리스트 참조로 공유합니다.
+    경로는 최근에 계산한 PATH_SNAPSHOTS개 노드만 보관하며, 나머지 노드로
+    되돌리면 바뀐 셀을 지나는 빔만 다시 추적합니다.
+    """
+    move: Optional[Move] = None
+    index: int = -1                      # 바뀐 셀 인덱스 (루트는 -1)
+    before: int = 0                      # 바뀌기 전/후 셀 코드
+    after: int = 0
+    placed_before: Optional[CellType] = None
+    placed_after: Optional[CellType] = None
+    available: Dict[str, int] = field(default_factory=dict)  # 조각 종류 → 수 변화
+    moves: int = 0
+    # (발광기별 경로, 발광기별 점유 마스크, 타겟 히트 여부)
+    paths: Optional[Tuple[List, List, Tuple[bool, ...]]] = None
+
+@dataclass
+class BatchResult:
+    """여러 액션 일괄 적용 결과"""
+    applied: int
+    failed_index: Optional[int] = None  # 실패한 액션 위치 (실패 시 전체 롤백)
+    error: Optional[str] = None
+    checkpoints: List[Dict] = field(default_factory=list)
+
 @dataclass
 class GameState:
     """게임 상태"""
-    grid: List[List[CellType]]
+    grid: Board
     emitters: List[Emitter]
     targets: List[Target]
     placed_pieces: Dict[Tuple[int, int], CellType]
@@ -73,7 +269,7 @@ class GameState:
     
     def dict(self):
         return {
-            "grid": [[cell.value for cell in row] for row in self.grid],
+            "grid": self.grid.to_list(),
             "emitters": [
                 {"x": e.x, "y": e.y, "direction": e.direction.name, "color": e.color.value}
                 for e in self.emitters
@@ -88,25 +284,76 @@ class GameState:
             "is_complete": self.is_complete
         }
 
+MASK64 = (1 << 64) - 1
+
+def zobrist_key(index: int, code: int) -> int:
+    """(셀 인덱스, 셀 코드)의 64비트 난수 (splitmix64, 표 없이 계산)"""
+    z = ((index << 4 | code) + 1) * 0x9E3779B97F4A7C15 & MASK64
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9 & MASK64
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EB & MASK64
+    return z ^ (z >> 31)
+
+def _level_hash(state: "GameState") -> int:
+    """레벨 배치(ID, 초기 보드, 발광기, 타겟)의 64비트 해시 (보드 해시의 시작값)"""
+    layout = (
+        state.level_id,
+        [(e.x, e.y, e.direction.name, e.color.name, e.active) for e in state.emitters],
+        [(t.x, t.y, t.required_color.name) for t in state.targets],
+    )
+    digest = hashlib.blake2b(bytes(state.grid.cells) + repr(layout).encode(), digest_size=8)
+    return int.from_bytes(digest.digest(), "little")
+
+def _assign_segment_ids(emitter_index: int, paths: List[Dict]):
+    """빔 구간에 내용 기반 ID 부여 (같은 구간은 다시 추적해도 같은 ID)"""
+    for path_data in paths:
+        digest = hashlib.blake2b(
+            repr((path_data["start"], path_data["color"], path_data["path"])).encode(),
+            digest_size=6
+        ).hexdigest()
+        path_data["id"] = f"{emitter_index}-{digest}"
+
 class GameEngine:
     """게임 엔진"""
     
     def __init__(self):
         self.current_state: Optional[GameState] = None
-        self.grid_size = 10
+        self.grid_size = DEFAULT_GRID_SIZE
         self.current_moves = 0
         self.min_moves = 0  # 최소 이동 수 (별점 계산용)
         self.available_pieces = {}  # 사용 가능한 조각들
+        # 발광기별 빛 경로 캐시 (경로, 셀 인덱스 → 색상 점유 마스크)
+        self._emitter_paths: List[Optional[List[Dict]]] = []
+        self._emitter_coverage: List[Dict[int, int]] = []
+        self._dirty_cells: Set[int] = set()
+        # 셀 인덱스 → 해당 위치의 타겟 목록
+        self._target_index: Dict[int, List[Target]] = {}
+        # 상태 버전과 최근 변경 기록 (델타 응답용, 풀이기 등에서는 끌 수 있음)
+        self.track_changes = True
+        self.version = 0
+        self._changes: deque = deque(maxlen=64)
+        # 되돌리기 히스토리 (현재 노드는 _history[_cursor], 그 뒤는 다시 실행용)
+        self._history: List[HistoryNode] = []
+        self._cursor = 0
+        # 빛 경로를 보관 중인 히스토리 노드 (id → 노드, 오래전에 계산한 순)
+        self._path_nodes: "OrderedDict[int, HistoryNode]" = OrderedDict()
+        # 레벨 해시에 바뀐 셀마다 zobrist_key(셀, 이전 코드) ^ zobrist_key(셀, 새 코드)를
+        # XOR한 보드 해시와, 이 해시로 추적 결과를 공유하는 캐시 (None이면 사용 안 함)
+        self.board_hash = 0
+        self.trace_cache: Optional[TraceCache] = None
         
     def start_new_game(self, level_data: dict) -> GameState:
         """새 게임 시작"""
+        grid_size = level_data.get("grid_size", DEFAULT_GRID_SIZE)
+        if not 1 <= grid_size <= MAX_GRID_SIZE:
+            raise ValueError(f"grid_size must be between 1 and {MAX_GRID_SIZE}: {grid_size}")
+        self.grid_size = grid_size
+        
         # 그리드 초기화
-        grid = [[CellType.EMPTY for _ in range(self.grid_size)] 
-                for _ in range(self.grid_size)]
+        grid = Board(grid_size, grid_size)
         
         # 벽 설정
         for wall in level_data.get("walls", []):
-            grid[wall["y"]][wall["x"]] = CellType.WALL
+            grid.cells[wall["y"] * grid.width + wall["x"]] = WALL_CODE
         
         # 발광기 설정
         emitters = []
@@ -128,7 +375,7 @@ class GameEngine:
             ))
         
         # 사용 가능한 조각들
-        self.available_pieces = level_data.get("available_pieces", {})
+        self.available_pieces = dict(level_data.get("available_pieces", {}))
         self.min_moves = level_data.get("min_moves", 10)
         
         self.current_state = GameState(
@@ -139,7 +386,19 @@ class GameEngine:
             level_id=level_data.get("id", 0)
         )
         
+        self._target_index = {}
+        for target in targets:
+            self._target_index.setdefault(target.y * grid.width + target.x, []).append(target)
+        
         self.current_moves = 0
+        self.board_hash = _level_hash(self.current_state)
+        self._reset_path_cache()
+        # 버전은 게임이 바뀌어도 계속 증가시켜 이전 게임 기준의 델타 요청을 막음
+        self.version += 1
+        self._changes.clear()
+        self._history = [HistoryNode()]
+        self._cursor = 0
+        self._path_nodes.clear()
         return self.current_state
     
     def perform_action(self, action: str, x: int, y: int, 
@@ -148,7 +407,35 @@ class GameEngine:
         """액션 수행"""
         if not self.current_state:
             return False
+        if not self.track_changes or not self._is_valid_position(x, y):
+            return self._apply_action(action, x, y, piece_type)
+        
+        state = self.current_state
+        index = y * state.grid.width + x
+        before = state.grid.cells[index]
+        placed_before = state.placed_pieces.get((x, y))
+        available_before = dict(self.available_pieces)
+        if not self._apply_action(action, x, y, piece_type):
+            return False
         
+        available = {
+            piece: count - available_before.get(piece, 0)
+            for piece, count in self.available_pieces.items()
+            if count != available_before.get(piece, 0)
+        }
+        self._push_history(HistoryNode(
+            move=Move(action=action, x=x, y=y, piece_type=piece_type),
+            index=index,
+            before=before,
+            after=state.grid.cells[index],
+            placed_before=placed_before,
+            placed_after=state.placed_pieces.get((x, y)),
+            available=available,
+            moves=self.current_moves
+        ))
+        return True
+    
+    def _apply_action(self, action: str, x: int, y: int, piece_type: Optional[str]) -> bool:
         if action == "place":
             return self._place_piece(x, y, piece_type)
         elif action == "rotate":
@@ -158,12 +445,249 @@ class GameEngine:
         
         return False
     
+    def _push_history(self, node: HistoryNode):
+        """새 노드 추가 (다시 실행할 노드는 버림)"""
+        del self._history[self._cursor + 1:]
+        self._history.append(node)
+        if len(self._history) > MAX_HISTORY:
+            # 가장 오래된 노드를 루트로 만듦
+            del self._history[0]
+            first = self._history[0]
+            self._drop_paths(first)
+            self._history[0] = HistoryNode(moves=first.moves)
+        self._cursor = len(self._history) - 1
+    
+    def can_undo(self) -> bool:
+        return self._cursor > 0
+    
+    def can_redo(self) -> bool:
+        return self._cursor < len(self._history) - 1
+    
+    def undo(self) -> bool:
+        """마지막 액션 되돌리기"""
+        if not self.current_state or not self.can_undo():
+            return False
+        node = self._history[self._cursor]
+        self._cursor -= 1
+        self._restore(node, node.before, node.placed_before, -1)
+        return True
+    
+    def redo(self) -> bool:
+        """되돌린 액션 다시 실행"""
+        if not self.current_state or not self.can_redo():
+            return False
+        self._cursor += 1
+        node = self._history[self._cursor]
+        self._restore(node, node.after, node.placed_after, 1)
+        return True
+    
+    def memory_estimate(self) -> int:
+        """세션이 차지하는 대략의 메모리 (바이트)
+
+        보드, 히스토리 노드, 현재 및 히스토리 노드에 캐시된 빛 경로,
+        델타용 변경 기록의 크기를 더합니다.
+        """
+        if self.current_state is None:
+            return 0
+        coverages = {id(coverage): len(coverage) for coverage in self._emitter_coverage}
+        for node in self._path_nodes.values():
+            if node.paths is not None:
+                for coverage in node.paths[1]:
+                    coverages[id(coverage)] = len(coverage)
+        change_cells = sum(
+            len(path_data["path"]) for change in self._changes for path_data in change.paths_added
+        )
+        return (len(self.current_state.grid.cells)
+                + len(self._history) * HISTORY_NODE_BYTES
+                + sum(coverages.values()) * TRACED_CELL_BYTES
+                + change_cells * CHANGE_CELL_BYTES)
+
+    def get_history(self) -> List[Move]:
+        """현재 노드까지의 액션 목록"""
+        return [node.move for node in self._history[1:self._cursor + 1]]
+
+    def export_session(self) -> Dict:
+        """세션 상태를 다른 프로세스에서 복원할 수 있는 dict로 직렬화
+
+        히스토리 루트 시점의 배치와, 그 뒤의 액션 목록(다시 실행할 노드 포함)을
+        저장합니다. 루트 배치는 현재 상태에서 히스토리 노드를 거꾸로 되돌려 구합니다.
+        """
+        state = self.current_state
+        if state is None:
+            return {"level_id": None, "version": self.version}
+
+        width = state.grid.width
+        cells = {y * width + x: state.grid.cells[y * width + x] for x, y in state.placed_pieces}
+        placed = dict(state.placed_pieces)
+        available = dict(self.available_pieces)
+        for node in reversed(self._history[1:self._cursor + 1]):
+            cells[node.index] = node.before
+            y, x = divmod(node.index, width)
+            if node.placed_before is None:
+                placed.pop((x, y), None)
+            else:
+                placed[(x, y)] = node.placed_before
+            for piece, change in node.available.items():
+                available[piece] -= change
+
+        return {
+            "level_id": state.level_id,
+            "version": self.version,
+            "base": {
+                "cells": sorted(cells.items()),
+                "placed": [[x, y, cell.value] for (x, y), cell in placed.items()],
+                "available": available,
+                "moves": self._history[0].moves
+            },
+            "actions": [
+                [node.move.action, node.move.x, node.move.y, node.move.piece_type,
+                 node.move.timestamp.isoformat()]
+                for node in self._history[1:]
+            ],
+            "cursor": self._cursor
+        }
+
+    def load_session(self, level_data: Optional[Dict], data: Dict):
+        """export_session 결과로 게임 복원 (액션을 다시 실행해 되돌리기 히스토리도 복원)"""
+        if level_data is None or data.get("level_id") is None:
+            self.version = data.get("version", self.version)
+            return
+
+        state = self.start_new_game(level_data)
+        base = data["base"]
+        for index, code in base["cells"]:
+            self._set_code(index, code)
+        state.placed_pieces = {(x, y): CellType(value) for x, y, value in base["placed"]}
+        self.available_pieces = dict(base["available"])
+        self.current_moves = state.moves = self._history[0].moves = base["moves"]
+
+        for action, x, y, piece_type, timestamp in data["actions"]:
+            if not self.perform_action(action, x, y, piece_type):
+                raise ValueError(f"Cannot replay action {action} at ({x}, {y})")
+            self._history[self._cursor].move.timestamp = datetime.fromisoformat(timestamp)
+        while self._cursor > data["cursor"]:
+            self.undo()
+
+        # 이전 버전 기준의 델타 요청은 전체 상태로 응답하도록 변경 기록은 비움
+        self.version = data["version"]
+        self._changes.clear()
+
+    def _restore(self, node: HistoryNode, code: int, placed: Optional[CellType], sign: int):
+        """히스토리 노드의 셀 변경을 적용/취소하고, 캐시된 빛 경로가 있으면 그대로 복원"""
+        state = self.current_state
+        width = state.grid.width
+        self._set_code(node.index, code)
+        y, x = divmod(node.index, width)
+        if placed is None:
+            state.placed_pieces.pop((x, y), None)
+        else:
+            state.placed_pieces[(x, y)] = placed
+        for piece, change in node.available.items():
+            self.available_pieces[piece] += sign * change
+        
+        current = self._history[self._cursor]
+        self.current_moves = state.moves = current.moves
+        
+        if current.paths is not None:
+            # 재추적 없이 캐시 복원
+            self._install_paths(*current.paths)
+    
+    def _install_paths(self, paths, coverage, hits):
+        """저장해 둔 추적 결과를 현재 빛 경로로 사용 (델타 기록은 바뀐 발광기 경로만 비교)"""
+        state = self.current_state
+        previous_hits = [t.is_hit for t in state.targets]
+        retraced = []
+        for i, (old, new) in enumerate(zip(self._emitter_paths, paths)):
+            if old is not new and new is not None:
+                if self.track_changes and new and "id" not in new[0]:
+                    _assign_segment_ids(i, new)
+                retraced.append((old or [], new))
+        self._emitter_paths = list(paths)
+        self._emitter_coverage = list(coverage)
+        for target, hit in zip(state.targets, hits):
+            target.is_hit = hit
+        dirty = self._dirty_cells
+        self._dirty_cells = set()
+        if self.track_changes:
+            self._record_change(dirty, retraced, previous_hits)
+            if self._history:
+                self._remember_paths(paths, coverage, hits)
+    
+    def _remember_paths(self, paths, coverage, hits):
+        """현재 히스토리 노드에 추적 결과 저장 (오래전에 저장한 노드의 경로는 버림)"""
+        node = self._history[self._cursor]
+        node.paths = (list(paths), list(coverage), tuple(hits))
+        self._path_nodes[id(node)] = node
+        self._path_nodes.move_to_end(id(node))
+        while len(self._path_nodes) > PATH_SNAPSHOTS:
+            _, old = self._path_nodes.popitem(last=False)
+            old.paths = None
+    
+    def _drop_paths(self, node: HistoryNode):
+        if self._path_nodes.pop(id(node), None) is not None:
+            node.paths = None
+    
+    def perform_actions(self, actions: List[Dict], checkpoint_every: int = 0) -> BatchResult:
+        """여러 액션을 원자적으로 적용
+
+        하나라도 실패하면 모든 액션을 되돌립니다. 빛 경로는 호출한 쪽에서 마지막에
+        한 번 계산하며, `checkpoint_every`를 주면 그 간격마다 추적하여 중간
+        결과(버전, 히트한 타겟 수, 완료 여부)를 기록합니다.
+        """
+        if not self.current_state:
+            return BatchResult(applied=0, failed_index=0, error="No game in progress")
+        
+        state = self.current_state
+        saved_cells = bytearray(state.grid.cells)
+        saved_placed = dict(state.placed_pieces)
+        saved_available = dict(self.available_pieces)
+        saved_moves = (self.current_moves, state.moves)
+        saved_history = (list(self._history), self._cursor)
+        saved_hash = self.board_hash
+        touched: Set[int] = set()
+        result = BatchResult(applied=0)
+        
+        for i, action in enumerate(actions):
+            try:
+                ok = self.perform_action(
+                    action["action"], action["x"], action["y"],
+                    action.get("piece_type"), action.get("rotation")
+                )
+                error = None if ok else f"Action {action['action']} at ({action['x']}, {action['y']}) failed"
+            except Exception as e:
+                ok, error = False, str(e)
+            
+            if not ok:
+                # 롤백: 바뀐 셀만 더티로 남겨 중간 추적 결과와 무관하게 다시 계산되게 함
+                state.grid.cells[:] = saved_cells
+                state.placed_pieces = saved_placed
+                self.available_pieces = saved_available
+                self.current_moves, state.moves = saved_moves
+                self._history, self._cursor = saved_history
+                self.board_hash = saved_hash
+                self._dirty_cells |= touched
+                return BatchResult(applied=0, failed_index=i, error=error,
+                                   checkpoints=result.checkpoints)
+            
+            touched.add(action["y"] * state.grid.width + action["x"])
+            result.applied += 1
+            if checkpoint_every and result.applied % checkpoint_every == 0 and i < len(actions) - 1:
+                self.calculate_light_paths()
+                result.checkpoints.append({
+                    "index": i,
+                    "version": self.version,
+                    "targets_hit": sum(1 for t in state.targets if t.is_hit),
+                    "is_complete": self.check_victory()
+                })
+        
+        return result
+    
     def _place_piece(self, x: int, y: int, piece_type: str) -> bool:
         """조각 배치"""
         if not self._is_valid_position(x, y):
             return False
         
-        if self.current_state.grid[y][x] != CellType.EMPTY:
+        if self.current_state.grid.get(x, y) != CellType.EMPTY:
             return False
         
         # 사용 가능한 조각 확인
@@ -174,7 +698,7 @@ class GameEngine:
         
         try:
             cell_type = CellType(piece_type)
-            self.current_state.grid[y][x] = cell_type
+            self._set_cell(x, y, cell_type)
             self.current_state.placed_pieces[(x, y)] = cell_type
             self.current_moves += 1
             self.current_state.moves = self.current_moves
@@ -187,15 +711,15 @@ class GameEngine:
         if not self._is_valid_position(x, y):
             return False
         
-        cell = self.current_state.grid[y][x]
+        cell = self.current_state.grid.get(x, y)
         
         # 회전 가능한 조각만 회전
         if cell == CellType.MIRROR_LEFT:
-            self.current_state.grid[y][x] = CellType.MIRROR_RIGHT
+            self._set_cell(x, y, CellType.MIRROR_RIGHT)
             self.current_moves += 1
             return True
         elif cell == CellType.MIRROR_RIGHT:
-            self.current_state.grid[y][x] = CellType.MIRROR_LEFT
+            self._set_cell(x, y, CellType.MIRROR_LEFT)
             self.current_moves += 1
             return True
         
@@ -213,7 +737,7 @@ class GameEngine:
             if piece_type.value in self.available_pieces:
                 self.available_pieces[piece_type.value] += 1
             
-            self.current_state.grid[y][x] = CellType.EMPTY
+            self._set_cell(x, y, CellType.EMPTY)
             del self.current_state.placed_pieces[(x, y)]
             self.current_moves += 1
             return True
@@ -221,142 +745,261 @@ class GameEngine:
         return False
     
     def calculate_light_paths(self) -> List[Dict]:
-        """빛 경로 계산"""
+        """빛 경로 계산
+
+        발광기별로 추적 결과와 경로가 지나는 셀의 색상 점유 마스크를 캐시하고,
+        마지막 계산 이후 변경된 셀을 지나는 발광기의 빔만 다시 추적합니다.
+        """
         if not self.current_state:
             return []
         
+        dirty = self._dirty_cells
+        cache = self.trace_cache
+        if cache is not None and (dirty or None in self._emitter_paths):
+            cached = cache.get(self.board_hash)
+            if cached is not None:
+                self._install_paths(*cached)
+                return [
+                    path_data
+                    for i, emitter in enumerate(self.current_state.emitters) if emitter.active
+                    for path_data in self._emitter_paths[i]
+                ]
+        
         paths = []
+        retraced = []
         
-        for emitter in self.current_state.emitters:
+        for i, emitter in enumerate(self.current_state.emitters):
             if not emitter.active:
                 continue
             
-            beam = LightBeam(
-                x=emitter.x,
-                y=emitter.y,
-                direction=emitter.direction,
-                color=emitter.color
-            )
+            if self._emitter_paths[i] is None or not dirty.isdisjoint(self._emitter_coverage[i]):
+                beam = LightBeam(
+                    x=emitter.x,
+                    y=emitter.y,
+                    direction=emitter.direction,
+                    color=emitter.color
+                )
+                coverage = {}
+                old_paths = self._emitter_paths[i] or []
+                self._emitter_paths[i] = self._trace_beam(beam, coverage)
+                self._emitter_coverage[i] = coverage
+                if self.track_changes:
+                    _assign_segment_ids(i, self._emitter_paths[i])
+                    retraced.append((old_paths, self._emitter_paths[i]))
             
-            beam_paths = self._trace_beam(beam)
-            paths.extend(beam_paths)
+            paths.extend(self._emitter_paths[i])
+        
+        self._dirty_cells = set()
         
         # 타겟 히트 체크
-        self._check_targets_hit(paths)
+        previous_hits = [t.is_hit for t in self.current_state.targets]
+        self._check_targets_hit(self._target_coverage())
+        
+        if self.track_changes and (dirty or retraced):
+            self._record_change(dirty, retraced, previous_hits)
+        if self.track_changes and self._history:
+            self._remember_paths(self._emitter_paths, self._emitter_coverage,
+                                 [t.is_hit for t in self.current_state.targets])
+        if cache is not None and (dirty or retraced):
+            cache.put(self.board_hash, (
+                tuple(self._emitter_paths),
+                tuple(self._emitter_coverage),
+                tuple(t.is_hit for t in self.current_state.targets)
+            ))
         
         return paths
     
-    def _trace_beam(self, beam: LightBeam, depth: int = 0) -> List[Dict]:
-        """빔 추적"""
-        if depth > 100:  # 무한 루프 방지
-            return []
+    def _record_change(self, dirty: Set[int], retraced: List[Tuple[List[Dict], List[Dict]]],
+                       previous_hits: List[bool]):
+        """새 버전의 변경 내용 기록"""
+        cells = self.current_state.grid.cells
+        paths_added = []
+        paths_removed = []
+        for old_paths, new_paths in retraced:
+            old_ids = {path_data["id"] for path_data in old_paths}
+            new_ids = {path_data["id"] for path_data in new_paths}
+            paths_removed.extend(old_ids - new_ids)
+            paths_added.extend(p for p in new_paths if p["id"] not in old_ids)
         
+        self.version += 1
+        self._changes.append(StateChange(
+            version=self.version,
+            cells={index: CELL_VALUES[cells[index]] for index in dirty},
+            paths_added=paths_added,
+            paths_removed=paths_removed,
+            targets={
+                i: target.is_hit
+                for i, target in enumerate(self.current_state.targets)
+                if target.is_hit != previous_hits[i]
+            }
+        ))
+    
+    def get_delta(self, since_version: int) -> Optional[Dict]:
+        """`since_version` 이후의 변경 내용 (기록이 남아 있지 않으면 None)"""
+        if not self.current_state or since_version > self.version:
+            return None
+        changes = [c for c in self._changes if c.version > since_version]
+        if since_version < self.version and (not changes or changes[0].version != since_version + 1):
+            return None
+        
+        cells: Dict[int, str] = {}
+        added: Dict[str, Dict] = {}
+        removed: Set[str] = set()
+        targets: Dict[int, bool] = {}
+        for change in changes:
+            cells.update(change.cells)
+            for path_id in change.paths_removed:
+                if path_id in added:
+                    del added[path_id]
+                else:
+                    removed.add(path_id)
+            for path_data in change.paths_added:
+                # ID가 내용 기반이므로 지웠다 다시 생긴 구간은 변경 없음
+                if path_data["id"] in removed:
+                    removed.discard(path_data["id"])
+                else:
+                    added[path_data["id"]] = path_data
+            targets.update(change.targets)
+        
+        width = self.current_state.grid.width
+        return {
+            "from_version": since_version,
+            "version": self.version,
+            "cells": [
+                {"x": index % width, "y": index // width, "cell": value}
+                for index, value in cells.items()
+            ],
+            "paths_removed": sorted(removed),
+            "paths_added": list(added.values()),
+            "targets": [{"index": i, "is_hit": hit} for i, hit in sorted(targets.items())],
+            "moves": self.current_moves,
+            "is_complete": self.current_state.is_complete
+        }
+    
+    def _reset_path_cache(self):
+        """빛 경로 캐시 초기화"""
+        emitter_count = len(self.current_state.emitters) if self.current_state else 0
+        self._emitter_paths = [None] * emitter_count
+        self._emitter_coverage = [{} for _ in range(emitter_count)]
+        self._dirty_cells = set()
+    
+    def _mark_dirty(self, x: int, y: int):
+        """빛 경로를 다시 계산해야 하는 셀 기록"""
+        self._dirty_cells.add(y * self.current_state.grid.width + x)
+    
+    def _set_cell(self, x: int, y: int, cell: CellType):
+        self._set_code(y * self.current_state.grid.width + x, CELL_CODES[cell])
+    
+    def _set_code(self, index: int, code: int):
+        """셀 변경 (보드 해시를 O(1)로 갱신하고 더티로 기록)"""
+        cells = self.current_state.grid.cells
+        self.board_hash ^= zobrist_key(index, cells[index]) ^ zobrist_key(index, code)
+        cells[index] = code
+        self._dirty_cells.add(index)
+    
+    def lit_cells(self) -> Dict[int, int]:
+        """빛이 지나는 셀 인덱스 → 활성 발광기들의 색상 점유 마스크
+
+        마지막 calculate_light_paths() 결과 기준이며, 발광기별 추적 순서대로
+        처음 도달한 셀부터 나열됩니다.
+        """
+        lit: Dict[int, int] = {}
+        for i, emitter in enumerate(self.current_state.emitters):
+            if emitter.active:
+                for index, mask in self._emitter_coverage[i].items():
+                    lit[index] = lit.get(index, 0) | mask
+        return lit
+    
+    def _target_coverage(self) -> Dict[int, int]:
+        """타겟 셀별로 활성 발광기들의 색상 점유 마스크를 합친 결과"""
+        coverages = [
+            self._emitter_coverage[i]
+            for i, emitter in enumerate(self.current_state.emitters) if emitter.active
+        ]
+        target_coverage = {}
+        for index in self._target_index:
+            mask = 0
+            for coverage in coverages:
+                mask |= coverage.get(index, 0)
+            if mask:
+                target_coverage[index] = mask
+        return target_coverage
+    
+    def _trace_beam(self, beam: LightBeam, coverage: Optional[Dict[int, int]] = None) -> List[Dict]:
+        """빔 추적
+
+        분할기와 프리즘에서 생기는 가지를 재귀 대신 작업 큐로 처리합니다.
+        추적 전체가 하나의 방문 집합을 공유하므로 (x, y, 방향, 색상) 상태는
+        한 번만 확장되고, 작업량은 4 × 셀 수 × 색상 수를 넘지 않습니다.
+        경로는 분할, 색상 변경, 종료 지점마다 끊어서 반환합니다.
+        `coverage`가 주어지면 지나간 셀 인덱스별 색상 점유 마스크를 기록합니다.
+        """
+        if coverage is None:
+            coverage = {}
         paths = []
-        current_path = []
         visited = set()
+        board = self.current_state.grid
+        cells = board.cells
+        width, height = board.width, board.height
+        transitions = TRANSITION_TABLE
+        color_count = len(BEAM_COLORS)
+        queue = deque([(beam.x, beam.y, DIRECTION_INDEX[beam.direction.value], COLOR_INDEX[beam.color])])
         
-        x, y = beam.x, beam.y
-        dx, dy = beam.direction.value
-        color = beam.color
-        
-        while True:
-            # 다음 위치로 이동
-            x += dx
-            y += dy
+        while queue:
+            start_x, start_y, d, color_index = queue.popleft()
+            color_bit = 1 << color_index
+            x, y = start_x, start_y
+            current_path = []
+            branches = ()
             
-            # 경계 체크
-            if not self._is_valid_position(x, y):
-                break
-            
-            # 무한 루프 체크
-            state = (x, y, dx, dy)
-            if state in visited:
-                break
-            visited.add(state)
-            
-            current_path.append((x, y))
-            cell = self.current_state.grid[y][x]
-            
-            # 벽에 부딪힘
-            if cell == CellType.WALL:
-                break
-            
-            # 거울 처리
-            if cell == CellType.MIRROR_LEFT:  # \ 거울
-                if dx == 1:  # 오른쪽으로 가던 빔
-                    dx, dy = 0, 1  # 아래로
-                elif dx == -1:  # 왼쪽으로 가던 빔
-                    dx, dy = 0, -1  # 위로
-                elif dy == 1:  # 아래로 가던 빔
-                    dx, dy = 1, 0  # 오른쪽으로
-                elif dy == -1:  # 위로 가던 빔
-                    dx, dy = -1, 0  # 왼쪽으로
-                    
-            elif cell == CellType.MIRROR_RIGHT:  # / 거울
-                if dx == 1:  # 오른쪽으로 가던 빔
-                    dx, dy = 0, -1  # 위로
-                elif dx == -1:  # 왼쪽으로 가던 빔
-                    dx, dy = 0, 1  # 아래로
-                elif dy == 1:  # 아래로 가던 빔
-                    dx, dy = -1, 0  # 왼쪽으로
-                elif dy == -1:  # 위로 가던 빔
-                    dx, dy = 1, 0  # 오른쪽으로
-            
-            # 분할기 처리
-            elif cell == CellType.SPLITTER:
-                # 현재 빔 계속 진행
-                new_beam1 = LightBeam(x, y, Direction((dx, dy)), color)
-                paths.extend(self._trace_beam(new_beam1, depth + 1))
+            while True:
+                # 다음 위치로 이동
+                x += DIRECTION_DX[d]
+                y += DIRECTION_DY[d]
                 
-                # 90도 회전한 빔 생성
-                new_dx, new_dy = -dy, dx
-                new_beam2 = LightBeam(x, y, Direction((new_dx, new_dy)), color)
-                paths.extend(self._trace_beam(new_beam2, depth + 1))
+                # 경계 체크
+                if not (0 <= x < width and 0 <= y < height):
+                    break
+                
+                # 이미 확장한 상태면 중단 (무한 루프 및 중복 추적 방지)
+                index = y * width + x
+                state = ((index << 2) | d) * color_count + color_index
+                if state in visited:
+                    break
+                visited.add(state)
+                
+                current_path.append((x, y))
+                coverage[index] = coverage.get(index, 0) | color_bit
+                code = cells[index]
+                if code == EMPTY_CODE:
+                    continue
+                
+                # 전이 테이블 조회: 같은 색 하나로 나가면 방향만 바꿔 계속 진행,
+                # 아니면 (분할, 색 변경, 차단) 현재 경로를 끝내고 가지를 큐에 추가
+                outputs = transitions[((code << 2) | d) * color_count + color_index]
+                if len(outputs) == 1 and outputs[0][1] == color_index:
+                    d = outputs[0][0]
+                    continue
+                branches = [(x, y, out_d, out_color) for out_d, out_color in outputs]
                 break
             
-            # 필터 처리
-            elif cell in [CellType.FILTER_RED, CellType.FILTER_BLUE, CellType.FILTER_GREEN]:
-                filter_color = cell.name.split('_')[1].lower()
-                if color == BeamColor.WHITE or color.value == filter_color:
-                    color = BeamColor[filter_color.upper()]
-                else:
-                    break  # 필터를 통과할 수 없음
-            
-            # 프리즘 처리
-            elif cell == CellType.PRISM and color == BeamColor.WHITE:
-                # 백색광을 RGB로 분리
-                for new_color in [BeamColor.RED, BeamColor.GREEN, BeamColor.BLUE]:
-                    angle_offset = [-1, 0, 1][["RED", "GREEN", "BLUE"].index(new_color.name)]
-                    new_dx = dx + angle_offset * dy
-                    new_dy = dy - angle_offset * dx
-                    if new_dx != 0 or new_dy != 0:
-                        new_beam = LightBeam(x, y, Direction((new_dx, new_dy)), new_color)
-                        paths.extend(self._trace_beam(new_beam, depth + 1))
-                break
-        
-        if current_path:
-            paths.append({
-                "path": current_path,
-                "color": color.value,
-                "start": (beam.x, beam.y),
-                "end": current_path[-1] if current_path else (beam.x, beam.y)
-            })
+            if current_path:
+                paths.append({
+                    "path": current_path,
+                    "color": BEAM_COLORS[color_index].value,
+                    "start": (start_x, start_y),
+                    "end": current_path[-1]
+                })
+            queue.extend(branches)
         
         return paths
     
-    def _check_targets_hit(self, paths: List[Dict]):
-        """타겟 히트 체크"""
-        # 모든 타겟 초기화
-        for target in self.current_state.targets:
-            target.is_hit = False
-        
-        # 경로상의 타겟 체크
-        for path_data in paths:
-            for x, y in path_data["path"]:
-                for target in self.current_state.targets:
-                    if target.x == x and target.y == y:
-                        if path_data["color"] == target.required_color.value:
-                            target.is_hit = True
+    def _check_targets_hit(self, coverage: Dict[int, int]):
+        """타겟 히트 체크 (타겟 셀마다 색상 점유 마스크 한 번 조회)"""
+        for index, targets in self._target_index.items():
+            mask = coverage.get(index, 0)
+            for target in targets:
+                target.is_hit = color_hits(mask, target.required_color)
     
     def check_victory(self) -> bool:
         """승리 조건 체크"""
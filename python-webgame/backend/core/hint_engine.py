@@ -0,0 +1,145 @@
+"""
+Hint Engine - 풀이기 기반 힌트 제공
+"""
+from typing import Dict, FrozenSet, Optional, Tuple
+from collections import OrderedDict
+import threading
+
+from backend.core.game_engine import GameEngine
+from backend.core.solver import LevelSolver, Placement
+
+HintKey = Tuple[int, FrozenSet[Tuple[Tuple[int, int], str]], FrozenSet[Tuple[str, int]]]
+# (캐시 키, 놓인 조각 {(x, y): 조각 종류}, 남은 조각 수)
+BoardSnapshot = Tuple[HintKey, Dict[Tuple[int, int], str], Dict[str, int]]
+
+
+class HintEngine:
+    """현재 보드에서 최단 풀이의 다음 수를 알려주는 힌트 엔진
+
+    (레벨 ID, 보드 상태)별 힌트를 모든 세션이 공유하는 LRU 캐시에 보관하므로
+    같은 보드에서의 반복 요청은 딕셔너리 조회 한 번으로 처리됩니다. 풀이를
+    찾으면 풀이 경로상의 이후 보드들에 대한 힌트도 함께 캐시합니다.
+    탐색 한도에 걸린 결과는 캐시하지 않으므로 다음 요청에서 다시 탐색합니다.
+
+    서버는 `snapshot()`과 `lookup()`을 요청 스레드에서 호출하고, 캐시에 없을
+    때만 `compute()`를 스레드 풀에서 실행합니다.
+    """
+
+    def __init__(self, max_entries: int = 50000, max_nodes: int = 20000,
+                 time_limit: float = 0.5):
+        self.max_entries = max_entries
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self._cache: "OrderedDict[HintKey, Optional[Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_hint(self, engine: GameEngine, level_data: dict) -> Optional[Dict]:
+        """다음 수 힌트 반환 (제한 시간 안에 찾지 못하면 None)"""
+        board = self.snapshot(engine)
+        if board is None:
+            return None
+        found, hint = self.lookup(board[0])
+        return hint if found else self.compute(board, level_data)
+
+    def snapshot(self, engine: GameEngine) -> Optional[BoardSnapshot]:
+        """힌트 탐색에 필요한 보드 상태 복사 (게임이 없으면 None)"""
+        state = engine.current_state
+        if not state:
+            return None
+        placed = {cell: state.grid.get(*cell).value for cell in state.placed_pieces}
+        available = {p: c for p, c in engine.available_pieces.items() if c > 0}
+        return self._key(state.level_id, placed, available), placed, available
+
+    def lookup(self, key: HintKey) -> Tuple[bool, Optional[Dict]]:
+        """캐시 조회 (캐시에 있는지, 힌트)"""
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return True, self._cache[key]
+            self.misses += 1
+            return False, None
+
+    def compute(self, board: BoardSnapshot, level_data: dict) -> Optional[Dict]:
+        """풀이 탐색으로 힌트 계산 (탐색을 끝까지 마친 결과만 캐시)"""
+        key, placed, available = board
+        hint, complete = self._compute(key, level_data, placed, available)
+        if complete:
+            self._store(key, hint)
+        return hint
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계"""
+        with self._lock:
+            return {"entries": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+    def clear(self):
+        """캐시 비우기 (레벨이 바뀌었을 때)"""
+        with self._lock:
+            self._cache.clear()
+
+    def _compute(self, key: HintKey, level_data: dict,
+                 placed: Dict[Tuple[int, int], str],
+                 available: Dict[str, int]) -> Tuple[Optional[Dict], bool]:
+        """풀이 탐색으로 (힌트, 탐색 한도에 걸리지 않았는지) 계산"""
+        solver = LevelSolver(level_data, max_nodes=self.max_nodes, time_limit=self.time_limit)
+
+        # 현재 보드에 조각을 더 놓아 풀 수 있으면 최단 풀이의 첫 수
+        result = solver.solve(placed=placed, available_pieces=available)
+        if result.solution:
+            placements = result.solution.placements
+            if not placements:
+                return None, True
+            self._cache_solution_path(key, placed, available, placements)
+            return _place_hint(placements[0], len(placements)), True
+
+        # 더 놓아서는 풀 수 없으면, 빈 보드의 풀이에 없는 조각 제거를 제안
+        if not result.complete:
+            return None, False
+        result = solver.solve()
+        if result.solution:
+            solution = {(x, y): piece_type for x, y, piece_type in result.solution.placements}
+            for (x, y), piece_type in sorted(placed.items()):
+                if solution.get((x, y)) != piece_type:
+                    return {
+                        "hint": f"Remove the {piece_type} at ({x}, {y})",
+                        "move": {"action": "remove", "x": x, "y": y},
+                        "moves_left": None
+                    }, True
+        return None, result.complete
+
+    def _cache_solution_path(self, key: HintKey, placed: Dict[Tuple[int, int], str],
+                             available: Dict[str, int], placements: list):
+        """풀이 경로상의 이후 보드들의 힌트를 미리 캐시"""
+        level_id = key[0]
+        placed = dict(placed)
+        available = dict(available)
+        for i, (x, y, piece_type) in enumerate(placements[:-1]):
+            placed[(x, y)] = piece_type
+            available[piece_type] -= 1
+            if available[piece_type] == 0:
+                del available[piece_type]
+            next_key = self._key(level_id, placed, available)
+            self._store(next_key, _place_hint(placements[i + 1], len(placements) - i - 1))
+
+    def _store(self, key: HintKey, hint: Optional[Dict]):
+        with self._lock:
+            self._cache[key] = hint
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_entries:
+                self._cache.popitem(last=False)
+
+    @staticmethod
+    def _key(level_id: int, placed: Dict[Tuple[int, int], str], available: Dict[str, int]) -> HintKey:
+        return (level_id, frozenset(placed.items()), frozenset(available.items()))
+
+
+def _place_hint(placement: Placement, moves_left: int) -> Dict:
+    x, y, piece_type = placement
+    return {
+        "hint": f"Place a {piece_type} at ({x}, {y})",
+        "move": {"action": "place", "x": x, "y": y, "piece_type": piece_type},
+        "moves_left": moves_left
+    }
@@ -0,0 +1,174 @@
+"""
+Leaderboard - 레벨별 순위표
+"""
+from typing import Callable, Dict, List, Optional, Tuple
+import threading
+import time
+
+from sortedcontainers import SortedList
+
+from backend.core.progress_store import ProgressStore
+
+BOARDS = ("moves", "time")
+NO_TIME = 1 << 62  # 시간 기록이 없는 항목은 같은 이동 수 안에서 가장 뒤
+
+
+class LevelLeaderboard:
+    """한 레벨의 플레이어별 최고 기록과 정렬된 순위 목록
+
+    순위 목록은 (점수, 보조 점수, 플레이어 ID) 튜플의 SortedList이므로
+    기록 갱신, 순위, 백분위 조회는 O(log n), 상위 K명은 O(log n + K)입니다.
+    """
+
+    def __init__(self):
+        self.records: Dict[str, Tuple[int, Optional[int]]] = {}  # 플레이어 → (이동 수, 시간)
+        self.boards = {"moves": SortedList(), "time": SortedList()}
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    @staticmethod
+    def _score(board: str, moves: int, play_time: Optional[int]) -> Optional[Tuple[int, int]]:
+        if board == "moves":
+            return moves, NO_TIME if play_time is None else play_time
+        return None if play_time is None else (play_time, moves)
+
+    def submit(self, player_id: str, moves: int, play_time: Optional[int] = None) -> bool:
+        """기록 제출 (개인 최고 기록이 바뀌면 True)"""
+        old = self.records.get(player_id)
+        if old is not None:
+            moves = min(moves, old[0])
+            if old[1] is not None:
+                play_time = old[1] if play_time is None else min(play_time, old[1])
+            if (moves, play_time) == old:
+                return False
+            for board, entries in self.boards.items():
+                score = self._score(board, *old)
+                if score is not None:
+                    entries.remove(score + (player_id,))
+
+        self.records[player_id] = (moves, play_time)
+        for board, entries in self.boards.items():
+            score = self._score(board, moves, play_time)
+            if score is not None:
+                entries.add(score + (player_id,))
+        return True
+
+    def load(self, records: Dict[str, Tuple[int, Optional[int]]]):
+        """빈 순위표를 기록 전체로 한 번에 구성 (한 번만 정렬)"""
+        self.records = dict(records)
+        self.boards["moves"] = SortedList(
+            (moves, NO_TIME if play_time is None else play_time, player_id)
+            for player_id, (moves, play_time) in self.records.items()
+        )
+        self.boards["time"] = SortedList(
+            (play_time, moves, player_id)
+            for player_id, (moves, play_time) in self.records.items() if play_time is not None
+        )
+
+    def total(self, board: str) -> int:
+        return len(self.boards[board])
+
+    def rank(self, player_id: str, board: str) -> Optional[Tuple[int, int]]:
+        """(순위, 기록이 더 나쁜 플레이어 수) - 같은 점수는 같은 순위 (기록이 없으면 None)"""
+        record = self.records.get(player_id)
+        score = self._score(board, *record) if record else None
+        if score is None:
+            return None
+        entries = self.boards[board]
+        better = entries.bisect_left(score)
+        worse = len(entries) - entries.bisect_left((score[0], score[1] + 1))
+        return better + 1, worse
+
+    def top(self, k: int, board: str) -> List[Dict]:
+        """상위 k개 항목"""
+        result = []
+        previous = None
+        for position, (first, second, player_id) in enumerate(self.boards[board].islice(0, k)):
+            rank = position + 1 if (first, second) != previous else result[-1]["rank"]
+            previous = (first, second)
+            moves, play_time = self.records[player_id]
+            result.append({"rank": rank, "player_id": player_id, "moves": moves, "time": play_time})
+        return result
+
+
+class Leaderboard:
+    """전체 레벨의 순위표
+
+    제출된 기록은 바로 반영하고, 저장소(ProgressStore)의 리더보드 행은
+    `sync_interval`마다 마지막으로 읽은 seq 이후만 읽어 다른 워커
+    프로세스가 기록한 결과도 반영합니다.
+    """
+
+    def __init__(self, store: Optional[ProgressStore] = None, sync_interval: float = 1.0,
+                 clock: Callable[[], float] = time.monotonic):
+        self.store = store
+        self.sync_interval = sync_interval
+        self.clock = clock
+        self._levels: Dict[int, LevelLeaderboard] = {}
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._synced_at: Optional[float] = None
+        self.sync()
+
+    def submit(self, level_id: int, player_id: str, moves: int,
+               play_time: Optional[int] = None) -> bool:
+        """완료 기록 제출 (개인 최고 기록이 바뀌면 True)"""
+        with self._lock:
+            level = self._levels.setdefault(level_id, LevelLeaderboard())
+            return level.submit(player_id, moves, play_time)
+
+    def sync(self, force: bool = False) -> int:
+        """저장소에서 새로 기록된 행 반영 (반영한 행 수)"""
+        if self.store is None:
+            return 0
+        now = self.clock()
+        if not force and self._synced_at is not None and now - self._synced_at < self.sync_interval:
+            return 0
+        self._synced_at = now
+        rows = self.store.get_leaderboard_changes(self._seq)
+        if not rows:
+            return 0
+        by_level: Dict[int, Dict[str, Tuple[int, Optional[int]]]] = {}
+        for level_id, player_id, moves, play_time, _ in rows:
+            by_level.setdefault(level_id, {})[player_id] = (moves, play_time)
+        with self._lock:
+            for level_id, records in by_level.items():
+                level = self._levels.setdefault(level_id, LevelLeaderboard())
+                if not level.records:
+                    level.load(records)
+                    continue
+                for player_id, (moves, play_time) in records.items():
+                    level.submit(player_id, moves, play_time)
+            self._seq = max(self._seq, rows[-1][4])
+        return len(rows)
+
+    def query(self, level_id: int, board: str = "moves", limit: int = 10,
+              player_id: Optional[str] = None) -> Dict:
+        """상위 limit개와 (player_id를 주면) 플레이어의 순위, 백분위"""
+        if board not in BOARDS:
+            raise ValueError(f"Unknown leaderboard: {board}")
+        with self._lock:
+            level = self._levels.get(level_id) or LevelLeaderboard()
+            total = level.total(board)
+            result = {
+                "level_id": level_id,
+                "by": board,
+                "total": total,
+                "top": level.top(limit, board),
+                "player": None
+            }
+            ranked = level.rank(player_id, board) if player_id else None
+            if ranked is not None:
+                rank, worse = ranked
+                moves, play_time = level.records[player_id]
+                result["player"] = {
+                    "player_id": player_id,
+                    "rank": rank,
+                    "moves": moves,
+                    "time": play_time,
+                    # 이 플레이어보다 기록이 나쁜 플레이어 비율, 상위 몇 %인지
+                    "percentile": round(100 * worse / total, 2),
+                    "top_percent": round(100 * rank / total, 2)
+                }
+        return result
@@ -0,0 +1,209 @@
+"""
+Level Generator - 무작위 레벨 생성 및 난이도 추정
+
+    python -m backend.core.level_generator --count 1000 --difficulty Hard --out data/custom_levels
+"""
+from typing import Dict, List, Optional, Tuple
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+import argparse
+import math
+import random
+
+from backend.core.game_engine import GameEngine, EMPTY_CODE
+from backend.core.level_manager import LevelManager
+from backend.core.solver import LevelSolver, changes_beam
+
+DIFFICULTIES = ("Easy", "Medium", "Hard", "Expert")
+
+# 난이도별 생성 설정
+PROFILES: Dict[str, dict] = {
+    "Easy": {
+        "moves": (1, 2), "emitters": (1, 1), "walls": (2, 6), "extra_pieces": 1,
+        "pieces": ["mirror_left", "mirror_right"],
+    },
+    "Medium": {
+        "moves": (2, 3), "emitters": (1, 1), "walls": (4, 8), "extra_pieces": 1,
+        "pieces": ["mirror_left", "mirror_right", "splitter", "filter_red", "filter_blue"],
+    },
+    "Hard": {
+        "moves": (3, 4), "emitters": (1, 2), "walls": (5, 10), "extra_pieces": 2,
+        "pieces": ["mirror_left", "mirror_right", "splitter", "prism",
+                   "filter_red", "filter_green", "filter_blue"],
+    },
+    "Expert": {
+        "moves": (4, 5), "emitters": (2, 2), "walls": (6, 12), "extra_pieces": 2,
+        "pieces": ["mirror_left", "mirror_right", "splitter", "prism",
+                   "filter_red", "filter_green", "filter_blue"],
+    },
+}
+
+# 난이도 점수(최소 이동 수 + log10(탐색 노드 수)) 상한
+DIFFICULTY_THRESHOLDS = (("Easy", 3.5), ("Medium", 6.0), ("Hard", 7.0))
+
+# 가장자리 발광기가 안쪽을 향하는 방향
+_EDGE_DIRECTIONS = ("RIGHT", "LEFT", "DOWN", "UP")
+
+
+def estimate_difficulty(min_moves: int, nodes: int) -> Tuple[str, float]:
+    """풀이기 탐색량으로 난이도 추정"""
+    score = min_moves + math.log10(nodes + 1)
+    for difficulty, limit in DIFFICULTY_THRESHOLDS:
+        if score < limit:
+            return difficulty, score
+    return "Expert", score
+
+
+class LevelGenerator:
+    """역방향 구성으로 풀 수 있는 레벨을 만드는 생성기
+
+    벽과 발광기를 무작위로 놓고, 빛이 지나는 셀에 조각을 차례로 놓아 의도한
+    풀이를 만든 뒤, 조각이 있어야만 빛이 닿는 경로 끝에 타겟을 둡니다.
+    풀이기로 최소 이동 수를 구하고, 탐색량으로 추정한 난이도가 요청과 같은
+    레벨만 반환합니다.
+    """
+
+    def __init__(self, grid_size: int = 10, max_nodes: int = 50000,
+                 max_attempts: int = 200):
+        self.grid_size = grid_size
+        self.max_nodes = max_nodes
+        self.max_attempts = max_attempts
+
+    def generate(self, difficulty: str, seed: int = 0) -> Optional[dict]:
+        """요청 난이도의 레벨 생성 (max_attempts 안에 찾지 못하면 None)"""
+        if difficulty not in PROFILES:
+            raise ValueError(f"Unknown difficulty: {difficulty}")
+        rng = random.Random(seed)
+        for _ in range(self.max_attempts):
+            level = self._candidate(PROFILES[difficulty], rng)
+            if level is None:
+                continue
+            result = LevelSolver(level, max_nodes=self.max_nodes).solve()
+            if not result.complete or result.solution is None:
+                continue
+            min_moves = result.solution.moves
+            if min_moves < PROFILES[difficulty]["moves"][0]:
+                continue
+            estimated, score = estimate_difficulty(min_moves, result.nodes)
+            if estimated != difficulty:
+                continue
+            level.update(
+                name=f"{difficulty} #{seed}",
+                difficulty=difficulty,
+                min_moves=min_moves,
+                difficulty_score=round(score, 2),
+                seed=seed
+            )
+            return level
+        return None
+
+    def _candidate(self, profile: dict, rng: random.Random) -> Optional[dict]:
+        """후보 레벨 하나 구성 (타겟을 둘 곳이 없으면 None)"""
+        size = self.grid_size
+        emitters = []
+        used = set()
+        for _ in range(rng.randint(*profile["emitters"])):
+            side = rng.randrange(4)
+            offset = rng.randrange(1, size - 1)
+            x, y = [(0, offset), (size - 1, offset), (offset, 0), (offset, size - 1)][side]
+            if (x, y) in used:
+                continue
+            used.add((x, y))
+            emitters.append({"x": x, "y": y, "direction": _EDGE_DIRECTIONS[side], "color": "WHITE"})
+
+        walls = []
+        for _ in range(rng.randint(*profile["walls"])):
+            x, y = rng.randrange(1, size - 1), rng.randrange(1, size - 1)
+            if (x, y) not in used:
+                used.add((x, y))
+                walls.append({"x": x, "y": y})
+
+        level = {
+            "id": 0, "name": "", "difficulty": "", "description": "자동 생성된 레벨",
+            "grid_size": size, "min_moves": 0, "walls": walls, "emitters": emitters,
+            "targets": [], "available_pieces": {}
+        }
+        engine = GameEngine()
+        engine.track_changes = False
+        engine.start_new_game(dict(level, available_pieces={p: 99 for p in profile["pieces"]}))
+        engine.calculate_light_paths()
+        base_lit = set(engine.lit_cells())
+
+        # 의도한 풀이: 빛이 지나는 빈 셀에 경로를 바꾸는 조각을 차례로 배치
+        placed: List[str] = []
+        for _ in range(rng.randint(*profile["moves"])):
+            lit = engine.lit_cells()
+            options = [
+                (index, piece_type)
+                for index, mask in lit.items()
+                if engine.current_state.grid.cells[index] == EMPTY_CODE
+                and (index % size, index // size) not in used
+                for piece_type in profile["pieces"]
+                if changes_beam(piece_type, mask)
+            ]
+            if not options:
+                break
+            index, piece_type = rng.choice(options)
+            engine.perform_action("place", index % size, index // size, piece_type)
+            engine.calculate_light_paths()
+            placed.append(piece_type)
+
+        # 타겟: 조각이 있어야만 빛이 닿는 빈 경로 끝 셀
+        ends = set()
+        for path_data in engine.calculate_light_paths():
+            x, y = path_data["end"]
+            index = y * size + x
+            if (index not in base_lit and (x, y) not in used
+                    and engine.current_state.grid.cells[index] == EMPTY_CODE):
+                ends.add((x, y, path_data["color"]))
+        if not placed or not ends:
+            return None
+        targets = rng.sample(sorted(ends), min(len(ends), rng.randint(1, len(emitters) + 1)))
+        level["targets"] = [
+            {"x": x, "y": y, "required_color": color.upper()} for x, y, color in targets
+        ]
+
+        pieces = Counter(placed)
+        for _ in range(profile["extra_pieces"]):
+            pieces[rng.choice(profile["pieces"])] += 1
+        level["available_pieces"] = dict(pieces)
+        return level
+
+
+def _generate_task(args: Tuple[str, int, int, int]) -> Optional[dict]:
+    difficulty, grid_size, max_nodes, seed = args
+    return LevelGenerator(grid_size, max_nodes=max_nodes).generate(difficulty, seed)
+
+
+def generate_levels(count: int, difficulty: str, grid_size: int = 10,
+                    workers: Optional[int] = None, seed: int = 0,
+                    max_nodes: int = 50000) -> List[dict]:
+    """프로세스 풀에서 레벨 여러 개 생성 (시드 seed, seed+1, ...; workers=1이면 현재 프로세스)"""
+    tasks = [(difficulty, grid_size, max_nodes, seed + i) for i in range(count)]
+    if workers == 1:
+        results = map(_generate_task, tasks)
+        return [level for level in results if level]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_generate_task, tasks, chunksize=max(1, count // 64))
+        return [level for level in results if level]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="무작위 레벨 생성")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--difficulty", choices=DIFFICULTIES, default="Medium")
+    parser.add_argument("--grid-size", type=int, default=10)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="data/custom_levels", help="레벨을 저장할 커스텀 레벨 디렉터리")
+    args = parser.parse_args()
+
+    levels = generate_levels(args.count, args.difficulty, args.grid_size, args.workers, args.seed)
+    manager = LevelManager(custom_dir=args.out)
+    for level in levels:
+        manager.save_custom_level(level)
+    print(f"Generated {len(levels)}/{args.count} {args.difficulty} levels into {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,254 +1,246 @@
 """
 Level Manager - 레벨 데이터 관리
 """
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple, Union
+from collections import OrderedDict
+import bisect
 import json
+import os
+import tempfile
+import threading
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+BUILTIN_LEVELS_DIR = Path(__file__).resolve().parent.parent / "levels"
+INDEX_FILE = "index.jsonl"
+SUMMARY_FIELDS = ("id", "name", "difficulty", "description")
+
 class LevelManager:
-    """레벨 관리자"""
-    
-    def __init__(self):
-        self.levels = self._load_levels()
-        
-    def _load_levels(self) -> Dict[int, dict]:
-        """레벨 데이터 로드"""
-        levels = {}
-        
-        # 하드코딩된 레벨 데이터 (나중에 JSON 파일로 분리 가능)
-        levels[1] = {
-            "id": 1,
-            "name": "첫 번째 빛",
-            "difficulty": "Easy",
-            "description": "거울을 사용해 빛을 목표 지점으로 유도하세요",
-            "grid_size": 10,
-            "min_moves": 2,
-            "walls": [
-                {"x": 3, "y": 3}, {"x": 3, "y": 4}, {"x": 3, "y": 5},
-                {"x": 6, "y": 3}, {"x": 6, "y": 4}, {"x": 6, "y": 5}
-            ],
-            "emitters": [
-                {"x": 1, "y": 4, "direction": "RIGHT", "color": "WHITE"}
-            ],
-            "targets": [
-                {"x": 8, "y": 4, "required_color": "WHITE"}
-            ],
-            "available_pieces": {
-                "mirror_left": 1,
-                "mirror_right": 1
-            }
-        }
-        
-        levels[2] = {
-            "id": 2,
-            "name": "색깔 필터",
-            "difficulty": "Easy",
-            "description": "필터를 사용해 올바른 색상의 빛을 만드세요",
-            "grid_size": 10,
-            "min_moves": 3,
-            "walls": [
-                {"x": 4, "y": 2}, {"x": 4, "y": 3}, {"x": 4, "y": 6}, {"x": 4, "y": 7}
-            ],
-            "emitters": [
-                {"x": 1, "y": 5, "direction": "RIGHT", "color": "WHITE"}
-            ],
-            "targets": [
-                {"x": 8, "y": 5, "required_color": "RED"}
-            ],
-            "available_pieces": {
-                "filter_red": 1,
-                "mirror_left": 2
-            }
-        }
-        
-        levels[3] = {
-            "id": 3,
-            "name": "빔 분할",
-            "difficulty": "Medium",
-            "description": "빔 분할기를 사용해 여러 목표를 동시에 맞추세요",
-            "grid_size": 10,
-            "min_moves": 4,
-            "walls": [
-                {"x": 5, "y": 2}, {"x": 5, "y": 7}
-            ],
-            "emitters": [
-                {"x": 0, "y": 4, "direction": "RIGHT", "color": "WHITE"}
-            ],
-            "targets": [
-                {"x": 9, "y": 2, "required_color": "WHITE"},
-                {"x": 9, "y": 7, "required_color": "WHITE"}
-            ],
-            "available_pieces": {
-                "splitter": 1,
-                "mirror_left": 2,
-                "mirror_right": 2
-            }
-        }
-        
-        levels[4] = {
-            "id": 4,
-            "name": "프리즘의 마법",
-            "difficulty": "Medium",
-            "description": "프리즘으로 백색광을 분리하여 색상별 타겟을 맞추세요",
-            "grid_size": 10,
-            "min_moves": 5,
-            "walls": [
-                {"x": 3, "y": 1}, {"x": 3, "y": 2}, {"x": 3, "y": 7}, {"x": 3, "y": 8}
-            ],
-            "emitters": [
-                {"x": 0, "y": 4, "direction": "RIGHT", "color": "WHITE"}
-            ],
-            "targets": [
-                {"x": 9, "y": 2, "required_color": "RED"},
-                {"x": 9, "y": 4, "required_color": "GREEN"},
-                {"x": 9, "y": 6, "required_color": "BLUE"}
-            ],
-            "available_pieces": {
-                "prism": 1,
-                "mirror_left": 3,
-                "mirror_right": 2
-            }
-        }
-        
-        levels[5] = {
-            "id": 5,
-            "name": "복잡한 미로",
-            "difficulty": "Hard",
-            "description": "모든 도구를 활용해 복잡한 퍼즐을 해결하세요",
-            "grid_size": 10,
-            "min_moves": 8,
-            "walls": [
-                {"x": 2, "y": 2}, {"x": 2, "y": 3}, {"x": 2, "y": 6}, {"x": 2, "y": 7},
-                {"x": 4, "y": 1}, {"x": 4, "y": 8}, {"x": 5, "y": 1}, {"x": 5, "y": 8},
-                {"x": 7, "y": 3}, {"x": 7, "y": 4}, {"x": 7, "y": 5}, {"x": 7, "y": 6}
-            ],
-            "emitters": [
-                {"x": 0, "y": 2, "direction": "RIGHT", "color": "WHITE"},
-                {"x": 0, "y": 7, "direction": "RIGHT", "color": "WHITE"}
-            ],
-            "targets": [
-                {"x": 9, "y": 1, "required_color": "RED"},
-                {"x": 9, "y": 4, "required_color": "BLUE"},
-                {"x": 9, "y": 8, "required_color": "GREEN"}
-            ],
-            "available_pieces": {
-                "prism": 1,
-                "splitter": 1,
-                "mirror_left": 4,
-                "mirror_right": 3,
-                "filter_red": 1,
-                "filter_blue": 1,
-                "filter_green": 1
-            }
-        }
-        
-        levels[6] = {
-            "id": 6,
-            "name": "색상 혼합",
-            "difficulty": "Hard",
-            "description": "여러 색상을 혼합하여 새로운 색을 만들어보세요",
-            "grid_size": 10,
-            "min_moves": 6,
-            "walls": [
-                {"x": 5, "y": 3}, {"x": 5, "y": 4}, {"x": 5, "y": 5}, {"x": 5, "y": 6}
-            ],
-            "emitters": [
-                {"x": 0, "y": 2, "direction": "RIGHT", "color": "RED"},
-                {"x": 0, "y": 7, "direction": "RIGHT", "color": "GREEN"}
-            ],
-            "targets": [
-                {"x": 9, "y": 4, "required_color": "YELLOW"}  # Red + Green = Yellow
-            ],
-            "available_pieces": {
-                "mirror_left": 3,
-                "mirror_right": 3,
-                "splitter": 1
-            }
-        }
-        
-        levels[7] = {
-            "id": 7,
-            "name": "정밀한 각도",
-            "difficulty": "Expert",
-            "description": "정확한 거울 배치로 좁은 통로를 통과시키세요",
-            "grid_size": 10,
-            "min_moves": 10,
-            "walls": [
-                # 미로 형태의 벽
-                {"x": 1, "y": 1}, {"x": 2, "y": 1}, {"x": 3, "y": 1}, {"x": 4, "y": 1},
-                {"x": 6, "y": 1}, {"x": 7, "y": 1}, {"x": 8, "y": 1},
-                {"x": 1, "y": 3}, {"x": 3, "y": 3}, {"x": 5, "y": 3}, {"x": 7, "y": 3},
-                {"x": 1, "y": 5}, {"x": 3, "y": 5}, {"x": 5, "y": 5}, {"x": 7, "y": 5},
-                {"x": 1, "y": 7}, {"x": 3, "y": 7}, {"x": 5, "y": 7}, {"x": 7, "y": 7},
-                {"x": 1, "y": 8}, {"x": 2, "y": 8}, {"x": 3, "y": 8}, {"x": 4, "y": 8},
-                {"x": 6, "y": 8}, {"x": 7, "y": 8}, {"x": 8, "y": 8}
-            ],
-            "emitters": [
-                {"x": 0, "y": 0, "direction": "RIGHT", "color": "WHITE"}
-            ],
-            "targets": [
-                {"x": 9, "y": 9, "required_color": "WHITE"}
-            ],
-            "available_pieces": {
-                "mirror_left": 6,
-                "mirror_right": 5
-            }
-        }
-        
-        levels[8] = {
-            "id": 8,
-            "name": "다중 프리즘",
-            "difficulty": "Expert",
-            "description": "여러 프리즘을 연쇄적으로 사용하세요",
-            "grid_size": 10,
-            "min_moves": 12,
-            "walls": [],
-            "emitters": [
-                {"x": 4, "y": 0, "direction": "DOWN", "color": "WHITE"}
-            ],
-            "targets": [
-                {"x": 0, "y": 5, "required_color": "RED"},
-                {"x": 2, "y": 9, "required_color": "GREEN"},
-                {"x": 7, "y": 9, "required_color": "BLUE"},
-                {"x": 9, "y": 5, "required_color": "WHITE"}
-            ],
-            "available_pieces": {
-                "prism": 2,
-                "mirror_left": 5,
-                "mirror_right": 5,
-                "splitter": 2
-            }
-        }
-        
-        return levels
-    
+    """레벨 관리자
+
+    레벨 팩 디렉터리의 인덱스 파일(index.jsonl, 한 줄에 레벨 요약 하나)만
+    시작 시 읽고, 레벨 본문은 처음 요청될 때 파싱하여 LRU 캐시에 보관합니다.
+    커스텀 레벨은 `custom_dir`에 원자적으로 기록되어 재시작 후에도 유지됩니다.
+    여러 워커 프로세스가 같은 `custom_dir`를 쓰면 `refresh()`로 다른 워커가
+    추가한 레벨을 읽어옵니다.
+    """
+
+    def __init__(self, levels_dir: Union[str, Path] = BUILTIN_LEVELS_DIR,
+                 custom_dir: Optional[Union[str, Path]] = None,
+                 cache_size: int = 1024):
+        self.levels_dir = Path(levels_dir)
+        self.custom_dir = Path(custom_dir) if custom_dir else None
+        self.cache_size = cache_size
+        # 레벨 ID → 요약 (레벨 파일 경로 포함)
+        self._index: Dict[int, dict] = {}
+        self._cache: "OrderedDict[int, dict]" = OrderedDict()
+        # custom_dir가 없을 때 저장된 커스텀 레벨 (캐시에서 밀려나지 않도록 별도 보관)
+        self._memory_levels: Dict[int, dict] = {}
+        self._lock = threading.Lock()
+        # 목록 조회용 정렬된 ID (전체, 난이도별)와 목록이 바뀔 때마다 증가하는 버전
+        self._ids: List[int] = []
+        self._ids_by_difficulty: Dict[str, List[int]] = {}
+        self.version = 0
+        # 커스텀 인덱스 파일에서 읽은 바이트 수
+        self._custom_offset = 0
+
+        self._load_index(self.levels_dir)
+        if self.custom_dir:
+            self.custom_dir.mkdir(parents=True, exist_ok=True)
+            self._custom_offset = self._load_index(self.custom_dir)
+        for level_id in sorted(self._index):
+            self._add_to_catalogue(level_id)
+
+    def _load_index(self, pack_dir: Path, offset: int = 0) -> int:
+        """레벨 팩 인덱스를 offset부터 로드하고 읽은 위치 반환
+
+        마지막 줄이 덜 기록된 경우 등 깨진 줄은 무시하며, 줄바꿈으로 끝나지
+        않은 마지막 줄은 다음에 다시 읽습니다.
+        """
+        index_path = pack_dir / INDEX_FILE
+        if not index_path.exists():
+            return offset
+        with open(index_path, "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                try:
+                    entry = json.loads(line)
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    continue
+                entry["path"] = pack_dir / entry.pop("file")
+                self._index[entry["id"]] = entry
+        return offset
+
+    def refresh(self) -> bool:
+        """다른 프로세스가 커스텀 인덱스에 추가한 레벨 반영 (추가된 레벨이 있으면 True)"""
+        if not self.custom_dir:
+            return False
+        try:
+            size = (self.custom_dir / INDEX_FILE).stat().st_size
+        except OSError:
+            return False
+        with self._lock:
+            return self._refresh_locked(size)
+
+    def _refresh_locked(self, size: int) -> bool:
+        if size <= self._custom_offset:
+            return False
+        known = set(self._index)
+        self._custom_offset = self._load_index(self.custom_dir, self._custom_offset)
+        added = sorted(set(self._index) - known)
+        for level_id in added:
+            self._add_to_catalogue(level_id)
+        if added:
+            self.version += 1
+        return bool(added)
+
     def get_level(self, level_id: int) -> Optional[dict]:
         """특정 레벨 데이터 반환"""
-        return self.levels.get(level_id)
-    
+        with self._lock:
+            if level_id in self._cache:
+                self._cache.move_to_end(level_id)
+                return self._cache[level_id]
+            if level_id in self._memory_levels:
+                return self._memory_levels[level_id]
+            entry = self._index.get(level_id)
+        if entry is None and self.refresh():
+            with self._lock:
+                entry = self._index.get(level_id)
+        if entry is None:
+            return None
+
+        try:
+            with open(entry["path"], "r", encoding="utf-8") as f:
+                level = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        self._cache_level(level_id, level)
+        return level
+
+    def _cache_level(self, level_id: int, level: dict):
+        with self._lock:
+            self._cache[level_id] = level
+            self._cache.move_to_end(level_id)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _add_to_catalogue(self, level_id: int):
+        difficulty = self._index[level_id]["difficulty"]
+        for ids in (self._ids, self._ids_by_difficulty.setdefault(difficulty, [])):
+            if not ids or ids[-1] < level_id:
+                ids.append(level_id)
+            else:
+                bisect.insort(ids, level_id)
+
+    def _summary(self, level_id: int) -> dict:
+        entry = self._index[level_id]
+        return {
+            "id": entry["id"],
+            "name": entry["name"],
+            "difficulty": entry["difficulty"],
+            "description": entry["description"],
+            "stars": 0  # 저장된 진행상황에서 가져오기
+        }
+
     def get_all_levels(self) -> List[dict]:
         """모든 레벨 목록 반환"""
-        return [
-            {
-                "id": level["id"],
-                "name": level["name"],
-                "difficulty": level["difficulty"],
-                "description": level["description"],
-                "stars": 0  # 저장된 진행상황에서 가져오기
-            }
-            for level in self.levels.values()
-        ]
-    
+        with self._lock:
+            return [self._summary(level_id) for level_id in self._ids]
+
+    def get_levels_page(self, after: Optional[int] = None, limit: int = 50,
+                        difficulty: Optional[str] = None) -> Tuple[List[dict], Optional[int]]:
+        """ID가 `after`보다 큰 레벨 요약을 최대 `limit`개 반환
+
+        다음 페이지가 있으면 마지막 레벨 ID를 다음 커서로 함께 반환합니다.
+        """
+        with self._lock:
+            ids = self._ids if difficulty is None else self._ids_by_difficulty.get(difficulty, [])
+            start = 0 if after is None else bisect.bisect_right(ids, after)
+            page = ids[start:start + limit]
+            next_cursor = page[-1] if page and start + limit < len(ids) else None
+            return [self._summary(level_id) for level_id in page], next_cursor
+
+    def get_level_ids(self) -> List[int]:
+        """모든 레벨 ID"""
+        with self._lock:
+            return list(self._index)
+
     def get_total_levels(self) -> int:
         """전체 레벨 수 반환"""
-        return len(self.levels)
-    
+        return len(self._index)
+
     def save_custom_level(self, level_data: dict) -> bool:
-        """커스텀 레벨 저장"""
+        """커스텀 레벨 저장
+
+        레벨 파일은 임시 파일에 쓴 뒤 교체하고, 그 다음 인덱스에 한 줄을
+        추가하므로 중간에 중단되어도 인덱스가 없는 파일만 남습니다.
+        """
         try:
-            level_id = max(self.levels.keys()) + 1 if self.levels else 1
-            level_data["id"] = level_id
-            self.levels[level_id] = level_data
+            with self._lock:
+                if self.custom_dir:
+                    self._save_to_pack(level_data)
+                else:
+                    level_id = max(self._index.keys()) + 1 if self._index else 1
+                    level_data["id"] = level_id
+                    self._memory_levels[level_id] = level_data
+                    self._index[level_id] = {field: level_data.get(field, "") for field in SUMMARY_FIELDS}
+                    self._add_to_catalogue(level_id)
+                    self.version += 1
+                level_id = level_data["id"]
+
+            if self.custom_dir:
+                self._cache_level(level_id, level_data)
             return True
-        except:
-            return False
\ No newline at end of file
+        except (OSError, TypeError, ValueError):
+            return False
+
+    def _save_to_pack(self, level_data: dict):
+        """커스텀 레벨 팩에 기록 (인덱스 파일을 잠근 동안 다른 프로세스의 레벨을 읽고 ID 할당)"""
+        with open(self.custom_dir / INDEX_FILE, "ab") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                size = os.fstat(f.fileno()).st_size
+                self._refresh_locked(size)
+                if size > self._custom_offset:
+                    # 덜 기록된 마지막 줄은 줄바꿈으로 끝내 깨진 줄로 건너뜀
+                    f.write(b"\n")
+                    self._custom_offset = size + 1
+                level_id = max(self._index.keys()) + 1 if self._index else 1
+                level_data["id"] = level_id
+                entry = {field: level_data.get(field, "") for field in SUMMARY_FIELDS}
+                filename = f"{level_id}.json"
+                _write_atomic(self.custom_dir / filename, json.dumps(level_data, ensure_ascii=False))
+                line = (json.dumps(dict(entry, file=filename), ensure_ascii=False) + "\n").encode("utf-8")
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+                self._custom_offset += len(line)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        entry["path"] = self.custom_dir / filename
+        self._index[level_id] = entry
+        self._add_to_catalogue(level_id)
+        self.version += 1
+
+
+def _write_atomic(path: Path, content: str):
+    """임시 파일에 기록 후 교체"""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
@@ -0,0 +1,126 @@
+"""
+Payload Cache - 직렬화된 응답 캐시
+"""
+from typing import Any, Callable, Dict, Hashable, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import gzip
+import hashlib
+import json
+import threading
+
+from fastapi import Request, Response
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+MIN_COMPRESS_SIZE = 512  # 이보다 작은 본문은 압축하지 않음
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    """한 번 직렬화(및 압축)해 둔 응답 본문과 ETag"""
+    body: bytes
+    etag: str
+    media_type: str = "application/json"
+    # 콘텐츠 인코딩 → 압축된 본문
+    encoded: Dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def from_json(cls, data: Any, compress: bool = False) -> "CachedPayload":
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return cls.from_bytes(body, compress=compress)
+
+    @classmethod
+    def from_bytes(cls, body: bytes, media_type: str = "application/json",
+                   compress: bool = False) -> "CachedPayload":
+        etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        encoded = {}
+        if compress and len(body) >= MIN_COMPRESS_SIZE:
+            if brotli is not None:
+                encoded["br"] = brotli.compress(body)
+            encoded["gzip"] = gzip.compress(body, mtime=0)
+            encoded = {enc: data for enc, data in encoded.items() if len(data) < len(body)}
+        return cls(body=body, etag=etag, media_type=media_type, encoded=encoded)
+
+    def response(self, request: Request, cache_control: str = "no-cache") -> Response:
+        """If-None-Match가 일치하면 304, 아니면 캐시된 본문 응답
+
+        클라이언트가 받을 수 있으면 압축된 본문을 보내며, 인코딩마다
+        서로 다른 강한 ETag를 사용합니다.
+        """
+        encoding = self._select_encoding(request.headers.get("accept-encoding", ""))
+        etag = self.etag if encoding is None else f'{self.etag[:-1]}-{encoding}"'
+        headers = {"ETag": etag, "Cache-Control": cache_control}
+        if self.encoded:
+            headers["Vary"] = "Accept-Encoding"
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+        if encoding is None:
+            return Response(content=self.body, media_type=self.media_type, headers=headers)
+        headers["Content-Encoding"] = encoding
+        return Response(content=self.encoded[encoding], media_type=self.media_type, headers=headers)
+
+    def _select_encoding(self, accept_encoding: str) -> Optional[str]:
+        if not self.encoded:
+            return None
+        accepted = set()
+        for token in accept_encoding.split(","):
+            name, _, params = token.strip().partition(";")
+            if params.replace(" ", "") not in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+                accepted.add(name.strip().lower())
+        for encoding in ("br", "gzip"):
+            if encoding in self.encoded and encoding in accepted:
+                return encoding
+        return None
+
+
+class PayloadCache:
+    """키별 CachedPayload LRU 캐시"""
+
+    def __init__(self, max_entries: int = 1024, compress: bool = False):
+        self.max_entries = max_entries
+        self.compress = compress
+        self._entries: "OrderedDict[Hashable, CachedPayload]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, build: Callable[[], Any]) -> Optional[CachedPayload]:
+        """캐시된 페이로드 반환 (없으면 build() 결과를 직렬화해 저장, None이면 캐시하지 않음)"""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return payload
+            self.misses += 1
+
+        data = build()
+        if data is None:
+            return None
+        payload = CachedPayload.from_json(data, compress=self.compress)
+        with self._lock:
+            self._entries[key] = payload
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    def clear(self):
+        """캐시 무효화"""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
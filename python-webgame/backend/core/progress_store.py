@@ -0,0 +1,216 @@
+"""
+Progress Store - 플레이어 진행상황 영구 저장
+"""
+from typing import Dict, List, Optional, Tuple, Union
+from pathlib import Path
+import queue
+import sqlite3
+import threading
+import time
+
+from backend.models.game_models import PlayerProgress
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    player_id TEXT NOT NULL,
+    level_id INTEGER NOT NULL,
+    completed INTEGER NOT NULL DEFAULT 0,
+    stars INTEGER NOT NULL DEFAULT 0,
+    moves INTEGER NOT NULL DEFAULT 0,
+    best_moves INTEGER,
+    play_time INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (player_id, level_id)
+);
+CREATE TABLE IF NOT EXISTS player_stats (
+    player_id TEXT PRIMARY KEY,
+    completed_levels INTEGER NOT NULL DEFAULT 0,
+    total_stars INTEGER NOT NULL DEFAULT 0,
+    total_moves INTEGER NOT NULL DEFAULT 0,
+    play_time INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS global_stats (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    players INTEGER NOT NULL DEFAULT 0,
+    completed_levels INTEGER NOT NULL DEFAULT 0,
+    total_stars INTEGER NOT NULL DEFAULT 0,
+    total_moves INTEGER NOT NULL DEFAULT 0,
+    play_time INTEGER NOT NULL DEFAULT 0
+);
+INSERT OR IGNORE INTO global_stats (id) VALUES (1);
+CREATE TABLE IF NOT EXISTS leaderboard (
+    level_id INTEGER NOT NULL,
+    player_id TEXT NOT NULL,
+    best_moves INTEGER NOT NULL,
+    best_time INTEGER,
+    seq INTEGER NOT NULL,
+    PRIMARY KEY (level_id, player_id)
+);
+CREATE INDEX IF NOT EXISTS leaderboard_seq ON leaderboard (seq);
+"""
+
+STAT_FIELDS = ("completed_levels", "total_stars", "total_moves", "play_time")
+
+_STOP = object()
+
+
+class ProgressStore:
+    """SQLite(WAL) 기반 진행상황 저장소
+
+    저장 요청은 큐에 넣고 백그라운드 쓰기 스레드가 모아서 한 트랜잭션으로
+    기록합니다. 기록할 때 기존 행과의 차이만큼 플레이어별/전체 집계 행을
+    함께 갱신하므로, 통계 조회는 진행상황 행 수와 관계없이 한 행만 읽습니다.
+    """
+
+    def __init__(self, path: Union[str, Path], batch_size: int = 500,
+                 flush_interval: float = 0.05):
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue()
+        self._read_lock = threading.Lock()
+        self._reader = self._connect()
+        self._reader.executescript(SCHEMA)
+        self._writer = threading.Thread(target=self._write_loop, name="progress-writer", daemon=True)
+        self._writer.start()
+
+    def save(self, progress: PlayerProgress):
+        """진행상황 저장 요청 (백그라운드에서 기록)"""
+        self._queue.put(progress)
+
+    def flush(self):
+        """대기 중인 저장 요청이 모두 기록될 때까지 대기"""
+        self._queue.join()
+
+    def close(self):
+        """쓰기 스레드 종료"""
+        if self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._reader.close()
+
+    def get_progress(self, player_id: str) -> List[PlayerProgress]:
+        """플레이어의 레벨별 진행상황"""
+        with self._read_lock:
+            rows = self._reader.execute(
+                "SELECT player_id, level_id, completed, stars, moves, best_moves, play_time "
+                "FROM progress WHERE player_id = ? ORDER BY level_id",
+                (player_id,)
+            ).fetchall()
+        return [
+            PlayerProgress(
+                player_id=row[0], level_id=row[1], completed=bool(row[2]), stars=row[3],
+                moves=row[4], best_moves=row[5] or 0, play_time=row[6]
+            )
+            for row in rows
+        ]
+
+    def get_stats(self, player_id: Optional[str] = None) -> Dict[str, int]:
+        """전체 또는 플레이어별 집계 (집계 행 하나만 조회)"""
+        with self._read_lock:
+            if player_id is None:
+                row = self._reader.execute(
+                    f"SELECT players, {', '.join(STAT_FIELDS)} FROM global_stats WHERE id = 1"
+                ).fetchone()
+                return dict(zip(("players",) + STAT_FIELDS, row))
+            row = self._reader.execute(
+                f"SELECT {', '.join(STAT_FIELDS)} FROM player_stats WHERE player_id = ?",
+                (player_id,)
+            ).fetchone()
+        return dict(zip(STAT_FIELDS, row or (0,) * len(STAT_FIELDS)))
+
+    def get_leaderboard_changes(self, after_seq: int = 0) -> List[Tuple[int, str, int, Optional[int], int]]:
+        """seq가 after_seq보다 큰 리더보드 행 (레벨, 플레이어, 최소 이동, 최단 시간, seq) - seq 순"""
+        with self._read_lock:
+            return self._reader.execute(
+                "SELECT level_id, player_id, best_moves, best_time, seq FROM leaderboard "
+                "WHERE seq > ? ORDER BY seq",
+                (after_seq,)
+            ).fetchall()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA busy_timeout=5000")
+        return conn
+
+    def _write_loop(self):
+        """큐의 저장 요청을 모아 한 트랜잭션으로 기록"""
+        conn = self._connect()
+        conn.executescript(SCHEMA)
+        stop = False
+        while not stop:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            items = [item for item in batch if item is not _STOP]
+            stop = len(items) != len(batch)
+            try:
+                if items:
+                    conn.execute("BEGIN IMMEDIATE")
+                    for progress in items:
+                        self._apply(conn, progress)
+                    conn.execute("COMMIT")
+            except sqlite3.Error:
+                # BEGIN이 실패하면(잠금 대기 초과 등) 열린 트랜잭션이 없음
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+        conn.close()
+
+    @staticmethod
+    def _apply(conn: sqlite3.Connection, progress: PlayerProgress):
+        """진행상황 병합 기록 및 집계 증분 갱신"""
+        old = conn.execute(
+            "SELECT completed, stars, best_moves FROM progress WHERE player_id = ? AND level_id = ?",
+            (progress.player_id, progress.level_id)
+        ).fetchone()
+        old_completed, old_stars, old_best = old if old else (0, 0, None)
+
+        completed = int(bool(old_completed) or progress.completed)
+        stars = max(old_stars, progress.stars)
+        best_moves = old_best
+        if progress.completed and progress.best_moves > 0:
+            best_moves = progress.best_moves if old_best is None else min(old_best, progress.best_moves)
+
+        conn.execute(
+            "INSERT INTO progress (player_id, level_id, completed, stars, moves, best_moves, "
+            "play_time, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (player_id, level_id) DO UPDATE SET completed = excluded.completed, "
+            "stars = excluded.stars, moves = excluded.moves, best_moves = excluded.best_moves, "
+            "play_time = progress.play_time + excluded.play_time, updated_at = excluded.updated_at",
+            (progress.player_id, progress.level_id, completed, stars, progress.moves,
+             best_moves, progress.play_time, time.time())
+        )
+
+        deltas = (completed - old_completed, stars - old_stars, progress.moves, progress.play_time)
+        new_player = conn.execute(
+            "INSERT OR IGNORE INTO player_stats (player_id) VALUES (?)", (progress.player_id,)
+        ).rowcount
+        assignments = ", ".join(f"{name} = {name} + ?" for name in STAT_FIELDS)
+        conn.execute(f"UPDATE player_stats SET {assignments} WHERE player_id = ?",
+                     deltas + (progress.player_id,))
+        conn.execute(f"UPDATE global_stats SET players = players + ?, {assignments} WHERE id = 1",
+                     (new_player,) + deltas)
+
+        # 리더보드: 레벨별 개인 최고 기록 (seq는 커밋 순서대로 증가하여 다른 프로세스가 이어 읽음)
+        if progress.completed and progress.best_moves > 0:
+            conn.execute(
+                "INSERT INTO leaderboard (level_id, player_id, best_moves, best_time, seq) "
+                "VALUES (?, ?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM leaderboard)) "
+                "ON CONFLICT (level_id, player_id) DO UPDATE SET "
+                "best_moves = MIN(best_moves, excluded.best_moves), "
+                "best_time = COALESCE(MIN(best_time, excluded.best_time), best_time, excluded.best_time), "
+                "seq = excluded.seq",
+                (progress.level_id, progress.player_id, progress.best_moves, progress.play_time or None)
+            )
@@ -0,0 +1,277 @@
+"""
+Replay - 세션 액션 로그 기록 및 재생 검증
+
+로그 형식 (추가 전용 바이너리):
+    헤더   b"MMR1"
+    시작   0x50, 레벨 ID(varint), 시작 시각(유닉스 초, varint)
+    액션   (액션 코드 << 4) | 조각 코드, x(varint), y(varint)   보통 3바이트
+    되돌리기/다시 실행   (액션 코드 << 4)                       1바이트
+"""
+from typing import Callable, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+import hashlib
+import math
+import re
+import time
+
+from backend.core.game_engine import GameEngine, CELL_CODES, CELL_TYPES, CellType
+from backend.core.level_manager import LevelManager
+
+MAGIC = b"MMR1"
+ACTIONS = ("place", "rotate", "remove", "undo", "redo", "start")
+ACTION_CODES = {action: code for code, action in enumerate(ACTIONS)}
+START_CODE = ACTION_CODES["start"]
+NO_PIECE = 0x0F  # 조각 종류가 없는 액션
+
+PURGE_EVERY = 1000  # 이 횟수만큼 기록할 때마다 오래된 로그 삭제
+
+_SAFE_NAME = re.compile(r"^[0-9A-Za-z_-]{1,64}$")
+
+
+class ReplayEvent(NamedTuple):
+    action: str
+    x: int = 0
+    y: int = 0
+    piece_type: Optional[str] = None
+    level_id: Optional[int] = None   # start 이벤트만
+    started_at: int = 0
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    value = shift = 0
+    while True:
+        byte = data[pos]  # 잘린 로그면 IndexError
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def encode_start(level_id: int, started_at: Optional[float] = None) -> bytes:
+    """새 게임 시작 레코드"""
+    started = int(time.time() if started_at is None else started_at)
+    return bytes([START_CODE << 4]) + _varint(level_id) + _varint(started)
+
+
+def encode_action(action: str, x: int = 0, y: int = 0, piece_type: Optional[str] = None) -> bytes:
+    """액션 레코드 (place/rotate/remove/undo/redo)"""
+    code = ACTION_CODES[action]
+    if action in ("undo", "redo"):
+        return bytes([code << 4])
+    piece = CELL_CODES[CellType(piece_type)] if action == "place" else NO_PIECE
+    return bytes([code << 4 | piece]) + _varint(x) + _varint(y)
+
+
+def decode(data: bytes) -> Iterator[ReplayEvent]:
+    """로그의 이벤트 순회 (덜 기록된 마지막 레코드는 무시)"""
+    if not data.startswith(MAGIC):
+        raise ValueError("Not a replay log")
+    pos = len(MAGIC)
+    end = len(data)
+    while pos < end:
+        op = data[pos]
+        code, piece = op >> 4, op & 0x0F
+        if code >= len(ACTIONS):
+            raise ValueError(f"Unknown record 0x{op:02x} at offset {pos}")
+        action = ACTIONS[code]
+        if piece != NO_PIECE and piece >= len(CELL_TYPES):
+            raise ValueError(f"Unknown piece code {piece} at offset {pos}")
+        try:
+            if code == START_CODE:
+                level_id, next_pos = _read_varint(data, pos + 1)
+                started_at, next_pos = _read_varint(data, next_pos)
+                event = ReplayEvent(action, level_id=level_id, started_at=started_at)
+            elif action in ("undo", "redo"):
+                next_pos = pos + 1
+                event = ReplayEvent(action)
+            else:
+                x, next_pos = _read_varint(data, pos + 1)
+                y, next_pos = _read_varint(data, next_pos)
+                piece_type = CELL_TYPES[piece].value if piece != NO_PIECE else None
+                event = ReplayEvent(action, x, y, piece_type)
+        except IndexError:  # 덜 기록된 마지막 레코드
+            return
+        pos = next_pos
+        yield event
+
+
+def split_games(data: bytes) -> List[List[ReplayEvent]]:
+    """로그를 게임(start 이벤트부터 다음 start 전까지) 단위로 나눔"""
+    games: List[List[ReplayEvent]] = []
+    for event in decode(data):
+        if event.action == "start":
+            games.append([event])
+        elif games:
+            games[-1].append(event)
+    return games
+
+
+@dataclass
+class ReplayResult:
+    """게임 하나를 재생한 결과"""
+    level_id: Optional[int]
+    moves: int = 0
+    stars: int = 0
+    complete: bool = False
+    error: Optional[str] = None  # 재생할 수 없는 로그 (레벨 없음, 불가능한 액션)
+    started_at: int = 0  # 시작 레코드의 시각 (유닉스 초)
+
+    def matches(self, moves: int, stars: int, completed: Optional[bool] = None) -> bool:
+        """제출된 기록이 재생 결과와 같은지"""
+        if self.error is not None:
+            return False
+        if completed is not None and completed != self.complete:
+            return False
+        return moves == self.moves and stars == self.stars
+
+    def play_time(self, now: Optional[float] = None) -> int:
+        """시작 레코드부터 now까지의 플레이 시간 (초, 최소 1)"""
+        now = time.time() if now is None else now
+        return max(1, math.ceil(now - self.started_at))
+
+
+class ReplayVerifier:
+    """로그를 GameEngine으로 다시 실행해 이동 수와 별 개수 계산
+
+    빛 경로는 게임 끝에서 한 번만 계산하며, 되돌리기가 없는 게임은
+    히스토리 기록 없이 재생합니다.
+    """
+
+    def __init__(self, level_loader: Callable[[int], Optional[dict]]):
+        self.level_loader = level_loader
+
+    def replay(self, game: List[ReplayEvent]) -> ReplayResult:
+        """start 이벤트로 시작하는 게임 하나 재생"""
+        level_id, started_at = game[0].level_id, game[0].started_at
+        level = self.level_loader(level_id)
+        if level is None:
+            return ReplayResult(level_id, error="Level not found", started_at=started_at)
+
+        engine = GameEngine()
+        engine.track_changes = any(event.action in ("undo", "redo") for event in game)
+        engine.start_new_game(level)
+        for i, event in enumerate(game[1:], start=1):
+            if event.action == "undo":
+                ok = engine.undo()
+            elif event.action == "redo":
+                ok = engine.redo()
+            else:
+                ok = engine.perform_action(event.action, event.x, event.y, event.piece_type)
+            if not ok:
+                return ReplayResult(level_id, moves=engine.current_moves,
+                                    error=f"Event {i} ({event.action}) cannot be replayed",
+                                    started_at=started_at)
+
+        engine.calculate_light_paths()
+        complete = engine.check_victory()
+        return ReplayResult(
+            level_id,
+            moves=engine.current_moves,
+            stars=engine.calculate_stars() if complete else 0,
+            complete=complete,
+            started_at=started_at
+        )
+
+    def verify(self, data: bytes, level_id: Optional[int] = None) -> Optional[ReplayResult]:
+        """로그의 마지막 게임(level_id를 주면 그 레벨의 마지막 게임) 재생 (없으면 None)"""
+        try:
+            games = split_games(data)
+        except ValueError as e:
+            return ReplayResult(level_id, error=str(e))
+        for game in reversed(games):
+            if level_id is None or game[0].level_id == level_id:
+                return self.replay(game)
+        return None
+
+
+_worker_verifier: Optional[ReplayVerifier] = None
+
+
+def _verify_task(args: Tuple[bytes, Optional[int]]) -> Optional[ReplayResult]:
+    global _worker_verifier
+    if _worker_verifier is None:
+        _worker_verifier = ReplayVerifier(LevelManager().get_level)
+    return _worker_verifier.verify(*args)
+
+
+def verify_logs(logs: Iterable[Tuple[bytes, Optional[int]]],
+                workers: Optional[int] = None) -> List[Optional[ReplayResult]]:
+    """(로그, 레벨 ID) 여러 개를 기본 레벨 팩으로 검증 (workers=1이면 현재 프로세스)"""
+    logs = list(logs)
+    if workers == 1:
+        return [_verify_task(args) for args in logs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_verify_task, logs, chunksize=max(1, len(logs) // 64)))
+
+
+class ReplayStore:
+    """세션별 추가 전용 로그 파일 저장소 ({디렉터리}/{세션 ID}.mmr)
+
+    `ttl_seconds`를 주면 시작할 때와 PURGE_EVERY번 기록할 때마다 그 시간
+    동안 기록이 없던(세션이 만료된) 로그를 삭제합니다. 세션이 제거되면
+    `delete()`로 바로 지웁니다.
+    """
+
+    def __init__(self, directory: Union[str, Path], ttl_seconds: Optional[float] = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self._appends = 0
+        if ttl_seconds is not None:
+            self.purge(ttl_seconds)
+
+    def _path(self, session_id: str) -> Path:
+        if not _SAFE_NAME.match(session_id):
+            session_id = hashlib.blake2b(session_id.encode("utf-8"), digest_size=16).hexdigest()
+        return self.directory / f"{session_id}.mmr"
+
+    def append(self, session_id: Optional[str], *records: bytes):
+        """레코드 추가 (파일이 없으면 헤더부터 기록)"""
+        if not session_id or not records:
+            return
+        with open(self._path(session_id), "ab") as f:
+            if f.tell() == 0:
+                f.write(MAGIC)
+            f.write(b"".join(records))
+        self._appends += 1
+        if self.ttl_seconds is not None and self._appends % PURGE_EVERY == 0:
+            self.purge(self.ttl_seconds)
+
+    def load(self, session_id: str) -> Optional[bytes]:
+        try:
+            return self._path(session_id).read_bytes()
+        except OSError:
+            return None
+
+    def delete(self, session_id: str) -> bool:
+        """세션의 로그 삭제 (있었으면 True)"""
+        try:
+            self._path(session_id).unlink()
+            return True
+        except OSError:
+            return False
+
+    def purge(self, max_age: float) -> int:
+        """max_age초 동안 기록이 없던 로그 삭제 (삭제한 파일 수)"""
+        cutoff = time.time() - max_age
+        removed = 0
+        for path in self.directory.glob("*.mmr"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                continue
+        return removed
@@ -0,0 +1,213 @@
+"""
+Session Manager - 플레이어별 게임 엔진 관리
+"""
+from typing import Callable, Dict, Optional, Tuple
+from collections import OrderedDict
+import json
+import threading
+import time
+import uuid
+
+from backend.core.game_engine import GameEngine
+from backend.core.session_store import SessionConflictError, SessionStore
+
+
+class SessionManager:
+    """세션 ID별 GameEngine 레지스트리
+
+    최근 사용 순서(LRU)로 세션을 보관하며, 유휴 시간(TTL)이 지난 세션과
+    최대 세션 수나 메모리 예산(`max_bytes`)을 넘는 가장 오래된 세션을 제거하여
+    메모리 사용량을 제한합니다. 세션 크기는 엔진의 `memory_estimate()`로
+    세션을 읽거나 저장할 때마다 다시 계산합니다.
+
+    `store`를 주면 세션 상태를 저장소에 기록하여 여러 워커 프로세스가 같은
+    세션을 처리할 수 있습니다. 이때 로컬 엔진은 캐시로만 쓰이며, 저장소의
+    리비전이 로컬 엔진과 다르면(다른 워커가 갱신하면) 저장된 상태로 다시
+    만듭니다. 상태를 바꾼 요청은 끝에 `save()`를 호출해야 합니다.
+
+    `on_evict`는 세션이 없어질 때(제거, 또는 저장소 없이 만료나 LRU로
+    밀려날 때) 세션 ID로 호출됩니다. 저장소가 있으면 로컬 캐시에서만
+    밀려난 세션은 다른 워커가 계속 쓸 수 있으므로 호출하지 않습니다.
+    """
+
+    def __init__(self, max_sessions: int = 10000, ttl_seconds: float = 1800,
+                 max_bytes: Optional[int] = None,
+                 engine_factory: Callable[[], GameEngine] = GameEngine,
+                 clock: Callable[[], float] = time.monotonic,
+                 store: Optional[SessionStore] = None,
+                 level_loader: Optional[Callable[[int], Optional[dict]]] = None,
+                 on_evict: Optional[Callable[[str], object]] = None):
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.engine_factory = engine_factory
+        self.clock = clock
+        self.store = store
+        self.level_loader = level_loader
+        self.on_evict = on_evict
+        # 세션 ID → (엔진, 마지막 사용 시각, 저장소 리비전)
+        self._sessions: "OrderedDict[str, Tuple[GameEngine, float, int]]" = OrderedDict()
+        # 세션 ID → 추정 메모리 (바이트)
+        self._sizes: Dict[str, int] = {}
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+        self.evicted = 0
+
+    def create(self, session_id: Optional[str] = None) -> Tuple[str, GameEngine]:
+        """새 세션 생성 (기존 세션이 있으면 새 엔진으로 교체)"""
+        session_id = session_id or uuid.uuid4().hex
+        engine = self.engine_factory()
+        revision = 0
+        if self.store is not None:
+            revision = self.store.save(session_id, _serialize(engine))
+        self._put(session_id, engine, revision)
+        return session_id, engine
+
+    def get(self, session_id: Optional[str]) -> Optional[GameEngine]:
+        """세션의 엔진 반환 (없거나 만료되면 None)"""
+        if not session_id:
+            return None
+        record = self.store.load(session_id) if self.store is not None else None
+        with self._lock:
+            now = self.clock()
+            self._evict_expired(now)
+            entry = self._sessions.get(session_id)
+            if self.store is not None and record is None:
+                # 저장소에서 만료됨
+                if self._discard(session_id) and self.on_evict is not None:
+                    self.on_evict(session_id)
+                return None
+            if entry is not None and (record is None or entry[2] == record[0]):
+                engine = entry[0]
+                self._sessions[session_id] = (engine, now, entry[2])
+                self._sessions.move_to_end(session_id)
+                self._account(session_id, engine)
+                self._evict_overflow()
+                return engine
+            if self.store is None:
+                return None
+
+        # 다른 워커가 갱신했거나 이 워커에 없는 세션: 저장된 상태로 엔진 복원
+        revision, data = record
+        engine = self._rebuild(data)
+        self._put(session_id, engine, revision)
+        return engine
+
+    def save(self, session_id: Optional[str], engine: GameEngine):
+        """엔진 상태를 저장소에 기록 (저장소가 없으면 세션 크기만 다시 계산)
+
+        이 엔진을 읽은 뒤 다른 워커가 세션을 갱신했으면 로컬 엔진을 버리고
+        SessionConflictError를 발생시킵니다.
+        """
+        if not session_id:
+            return
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if self.store is None:
+                if entry is not None and entry[0] is engine:
+                    self._account(session_id, engine)
+                    self._evict_overflow()
+                return
+        if entry is None or entry[0] is not engine:
+            raise SessionConflictError(session_id)
+        try:
+            revision = self.store.save(session_id, _serialize(engine), expected_revision=entry[2])
+        except SessionConflictError:
+            with self._lock:
+                self._discard(session_id)
+            raise
+        with self._lock:
+            if session_id in self._sessions:
+                self._sessions[session_id] = (engine, self.clock(), revision)
+                self._account(session_id, engine)
+                self._evict_overflow()
+
+    def get_or_create(self, session_id: Optional[str]) -> Tuple[str, GameEngine]:
+        """세션 엔진을 반환하고, 없으면 새로 생성"""
+        engine = self.get(session_id)
+        if engine is not None:
+            return session_id, engine
+        return self.create(session_id)
+
+    def remove(self, session_id: str) -> bool:
+        """세션 제거"""
+        stored = self.store.delete(session_id) if self.store is not None else False
+        with self._lock:
+            removed = self._discard(session_id) or stored
+        if self.on_evict is not None:
+            self.on_evict(session_id)
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """세션 통계"""
+        with self._lock:
+            stats = {
+                "active_sessions": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "memory_bytes": self.total_bytes,
+                "max_memory_bytes": self.max_bytes,
+                "evicted_sessions": self.evicted
+            }
+        if self.store is not None:
+            stats["stored_sessions"] = self.store.count()
+        return stats
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def _put(self, session_id: str, engine: GameEngine, revision: int):
+        with self._lock:
+            now = self.clock()
+            self._evict_expired(now)
+            self._sessions[session_id] = (engine, now, revision)
+            self._sessions.move_to_end(session_id)
+            self._account(session_id, engine)
+            self._evict_overflow()
+
+    def _rebuild(self, data: bytes) -> GameEngine:
+        state = json.loads(data)
+        level = None
+        if state.get("level_id") is not None and self.level_loader is not None:
+            level = self.level_loader(state["level_id"])
+        engine = self.engine_factory()
+        engine.load_session(level, state)
+        return engine
+
+    def _evict_expired(self, now: float):
+        """TTL이 지난 세션 제거 (가장 오래 사용되지 않은 세션부터 확인)"""
+        while self._sessions:
+            session_id, (_, last_access, _) = next(iter(self._sessions.items()))
+            if now - last_access < self.ttl_seconds:
+                break
+            self._evict(session_id)
+
+    def _evict_overflow(self):
+        """최대 세션 수나 메모리 예산을 넘으면 LRU 세션 제거 (가장 최근 세션은 유지)"""
+        while len(self._sessions) > 1 and (
+            len(self._sessions) > self.max_sessions
+            or (self.max_bytes is not None and self.total_bytes > self.max_bytes)
+        ):
+            self._evict(next(iter(self._sessions)))
+
+    def _evict(self, session_id: str):
+        self._discard(session_id)
+        self.evicted += 1
+        if self.store is None and self.on_evict is not None:
+            self.on_evict(session_id)
+
+    def _account(self, session_id: str, engine: GameEngine):
+        """세션의 추정 메모리 갱신"""
+        size = engine.memory_estimate()
+        self.total_bytes += size - self._sizes.get(session_id, 0)
+        self._sizes[session_id] = size
+
+    def _discard(self, session_id: str) -> bool:
+        self.total_bytes -= self._sizes.pop(session_id, 0)
+        return self._sessions.pop(session_id, None) is not None
+
+
+def _serialize(engine: GameEngine) -> bytes:
+    return json.dumps(engine.export_session(), separators=(",", ":")).encode("utf-8")
@@ -0,0 +1,175 @@
+"""
+Session Store - 여러 워커 프로세스가 공유하는 세션 상태 저장소
+"""
+from typing import Dict, Optional, Tuple, Union
+from abc import ABC, abstractmethod
+from pathlib import Path
+import sqlite3
+import threading
+import time
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    session_id TEXT PRIMARY KEY,
+    revision INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_updated_at ON sessions (updated_at);
+"""
+
+PURGE_EVERY = 1000  # 이 횟수만큼 저장할 때마다 만료된 세션 삭제
+
+
+class SessionConflictError(RuntimeError):
+    """다른 워커가 먼저 세션을 갱신함"""
+
+
+class SessionStore(ABC):
+    """세션 ID → (리비전, 직렬화된 상태) 저장소 인터페이스
+
+    저장할 때마다 리비전이 1씩 증가하며, `expected_revision`을 주면 저장된
+    리비전이 같을 때만 기록합니다(낙관적 동시성 제어).
+    """
+
+    def __init__(self, ttl_seconds: float = 1800):
+        self.ttl_seconds = ttl_seconds
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        """(리비전, 상태) 반환 (없거나 만료되면 None)"""
+
+    @abstractmethod
+    def save(self, session_id: str, data: bytes,
+             expected_revision: Optional[int] = None) -> int:
+        """상태 저장 후 새 리비전 반환 (리비전이 다르면 SessionConflictError)"""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """세션 삭제 (있었으면 True)"""
+
+    @abstractmethod
+    def count(self) -> int:
+        """저장된 세션 수"""
+
+    def close(self):
+        pass
+
+
+class MemorySessionStore(SessionStore):
+    """프로세스 메모리 저장소 (단일 프로세스, 테스트용)"""
+
+    def __init__(self, ttl_seconds: float = 1800):
+        super().__init__(ttl_seconds)
+        self._entries: Dict[str, Tuple[int, bytes, float]] = {}
+        self._lock = threading.Lock()
+        self._saves = 0
+
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        with self._lock:
+            entry = self._entries.get(session_id)
+        if entry is None or time.time() - entry[2] >= self.ttl_seconds:
+            return None
+        return entry[0], entry[1]
+
+    def save(self, session_id: str, data: bytes,
+             expected_revision: Optional[int] = None) -> int:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(session_id)
+            revision = entry[0] if entry else 0
+            if expected_revision is not None and expected_revision != revision:
+                raise SessionConflictError(session_id)
+            self._entries[session_id] = (revision + 1, data, now)
+            self._saves += 1
+            if self._saves % PURGE_EVERY == 0:
+                expired = [sid for sid, (_, _, updated) in self._entries.items()
+                           if now - updated >= self.ttl_seconds]
+                for sid in expired:
+                    del self._entries[sid]
+        return revision + 1
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            return self._entries.pop(session_id, None) is not None
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+class SqliteSessionStore(SessionStore):
+    """SQLite(WAL) 저장소
+
+    같은 파일을 여는 모든 워커 프로세스가 세션을 공유합니다. 스레드마다
+    연결을 하나씩 열고, 리비전 확인과 기록은 한 트랜잭션에서 수행합니다.
+    """
+
+    def __init__(self, path: Union[str, Path], ttl_seconds: float = 1800):
+        super().__init__(ttl_seconds)
+        self.path = str(path)
+        Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        self._saves = 0
+        self._conn().executescript(SCHEMA)
+
+    def _conn(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    def load(self, session_id: str) -> Optional[Tuple[int, bytes]]:
+        row = self._conn().execute(
+            "SELECT revision, data FROM sessions WHERE session_id = ? AND updated_at > ?",
+            (session_id, time.time() - self.ttl_seconds)
+        ).fetchone()
+        return (row[0], bytes(row[1])) if row else None
+
+    def save(self, session_id: str, data: bytes,
+             expected_revision: Optional[int] = None) -> int:
+        conn = self._conn()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT revision FROM sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+            revision = row[0] if row else 0
+            if expected_revision is not None and expected_revision != revision:
+                raise SessionConflictError(session_id)
+            conn.execute(
+                "INSERT INTO sessions (session_id, revision, data, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (session_id) DO UPDATE SET revision = excluded.revision, "
+                "data = excluded.data, updated_at = excluded.updated_at",
+                (session_id, revision + 1, data, now)
+            )
+            self._saves += 1
+            if self._saves % PURGE_EVERY == 0:
+                conn.execute("DELETE FROM sessions WHERE updated_at <= ?", (now - self.ttl_seconds,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return revision + 1
+
+    def delete(self, session_id: str) -> bool:
+        return self._conn().execute(
+            "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+        ).rowcount > 0
+
+    def count(self) -> int:
+        return self._conn().execute(
+            "SELECT COUNT(*) FROM sessions WHERE updated_at > ?",
+            (time.time() - self.ttl_seconds,)
+        ).fetchone()[0]
+
+    def close(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
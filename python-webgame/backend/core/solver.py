@@ -0,0 +1,488 @@
+"""
+Level Solver - 레벨 풀이 및 최소 이동 수 계산
+"""
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+from dataclasses import dataclass
+import time
+
+from backend.core.game_engine import (
+    GameEngine, CellType, BeamColor, Direction, BEAM_COLORS, CELL_CODES, COLOR_INDEX, COLOR_RGB,
+    DIRECTION_DX, DIRECTION_DY, DIRECTION_INDEX, EMPTY_CODE, MAX_GRID_SIZE, TRANSITION_TABLE,
+    WALL_CODE
+)
+
+Placement = Tuple[int, int, str]  # (x, y, piece_type)
+
+
+@dataclass
+class Solution:
+    """풀이 결과"""
+    moves: int
+    placements: List[Placement]
+    nodes: int = 0
+
+
+@dataclass
+class SolveResult:
+    """탐색 결과 (solution이 None이면 탐색 한도 안에 해가 없음)"""
+    solution: Optional[Solution]
+    nodes: int
+    complete: bool  # 탐색 한도에 걸리지 않고 끝까지 탐색했는지
+
+
+class SearchLimitExceeded(Exception):
+    """노드 탐색 또는 시간 한도 초과"""
+
+
+ORDER_DEPTH = 3  # 수 정렬을 적용할 최소 남은 깊이
+
+
+class LevelSolver:
+    """GameEngine 기반 반복 심화(IDA*) 풀이기
+
+    최소 해의 모든 조각은 최종 보드에서 빛을 받습니다. 조각들을 최종 보드의
+    추적 순서(빔이 셀에 처음 도달하는 순서)대로 놓으면, 매 단계 새 조각은
+    현재 보드에서 빛이 지나고 추적 순서상 직전 조각보다 뒤에 있는 셀에
+    놓이며 그 앞의 추적 결과는 바뀌지 않습니다. 이 표준 순서만 탐색하여
+    같은 배치 집합의 순열을 한 번만 방문하고, 실패한 상태는 남은 깊이와 함께
+    메모해 반복 심화 단계 사이에서 재사용합니다.
+
+    빛이 닿지 않는 타겟의 네 방향 시선이 모두 벽이나 경계에서 끝나면 새
+    조각이 그 시선 위에 놓여야만 타겟에 빛이 닿습니다. 서로 겹치지 않는
+    시선 수를 남은 수의 하한으로 쓰고, 마지막 한 수는 모든 시선의 교집합
+    셀로 제한합니다.
+
+    마지막 두 수는 추적 없이 먼저 걸러냅니다. 맞지 않은 순색(백색, 빨강,
+    초록, 파랑) 타겟을 맞히려면 마지막 조각에서 나온 새 빔이 타겟의 시선을
+    따라 들어와야 하므로, 조각의 출력 방향에서 색상과 무관하게 빔이 닿을 수
+    있는 셀(도달 범위)로 이를 판정합니다.
+
+    남은 깊이가 ORDER_DEPTH 이상인 노드(전체의 극히 일부)에서는 각 수를 먼저
+    놓아 보고 맞힌 타겟이 많은 수부터 탐색합니다. 하한 증명에는 영향이 없지만
+    마지막 반복 심화 단계에서 해를 빨리 찾습니다.
+    """
+
+    def __init__(self, level_data: dict, max_nodes: int = 200000,
+                 time_limit: Optional[float] = None):
+        self.level_data = level_data
+        self.max_nodes = max_nodes
+        self.time_limit = time_limit
+        self.engine = GameEngine()
+        self.engine.track_changes = False
+        self.nodes = 0
+        self._deadline: Optional[float] = None
+        # (배치 집합, 마지막 배치 셀) → 실패가 확인된 최대 남은 깊이
+        self._failed: Dict[Tuple[FrozenSet, Optional[int]], int] = {}
+        self._rays: Dict[int, List[List[int]]] = {}
+
+    def solve(self, placed: Optional[Dict[Tuple[int, int], str]] = None,
+              max_depth: Optional[int] = None,
+              available_pieces: Optional[Dict[str, int]] = None) -> SolveResult:
+        """최소 배치 수 풀이 탐색
+
+        `placed`로 이미 놓인 조각({(x, y): piece_type})에서 시작할 수 있으며,
+        반환되는 해는 그 이후에 추가로 놓을 조각만 담습니다.
+        `available_pieces`를 주면 레벨 값 대신 이를 남은 조각 수로 사용합니다.
+        """
+        engine = self.engine
+        level_data = self.level_data
+        if available_pieces is not None:
+            inventory = dict(available_pieces)
+            for piece_type in (placed or {}).values():
+                inventory[piece_type] = inventory.get(piece_type, 0) + 1
+            level_data = dict(level_data, available_pieces=inventory)
+        engine.start_new_game(level_data)
+        for (x, y), piece_type in (placed or {}).items():
+            if not engine.perform_action("place", x, y, piece_type):
+                raise ValueError(f"Cannot place {piece_type} at ({x}, {y})")
+
+        if max_depth is None:
+            max_depth = sum(engine.available_pieces.values())
+        self.nodes = 0
+        self._failed = {}
+        self._rays = self._target_rays()
+        self._deadline = time.monotonic() + self.time_limit if self.time_limit else None
+        path: List[Placement] = []
+        try:
+            for depth in range(max_depth + 1):
+                if self._search(depth, path, None):
+                    solution = Solution(moves=len(path), placements=list(path), nodes=self.nodes)
+                    return SolveResult(solution=solution, nodes=self.nodes, complete=True)
+        except SearchLimitExceeded:
+            return SolveResult(solution=None, nodes=self.nodes, complete=False)
+        return SolveResult(solution=None, nodes=self.nodes, complete=True)
+
+    def _search(self, depth: int, path: List[Placement],
+                last_cell: Optional[int]) -> bool:
+        """깊이 제한 탐색"""
+        engine = self.engine
+        self.nodes += 1
+        if self.nodes > self.max_nodes:
+            raise SearchLimitExceeded()
+        if self._deadline and self.nodes % 256 == 0 and time.monotonic() > self._deadline:
+            raise SearchLimitExceeded()
+
+        engine.calculate_light_paths()
+        if engine.check_victory():
+            return True
+        if depth == 0:
+            return False
+
+        # 하위 탐색은 배치 집합과 마지막 배치 셀(표준 순서 제약)로 결정됨
+        key = (frozenset(engine.current_state.placed_pieces.items()), last_cell)
+        if self._failed.get(key, -1) >= depth:
+            return False
+
+        lit = engine.lit_cells()
+        sights = self._closed_sights(lit)
+        if _disjoint_count(sights) > depth:
+            return False
+        allowed = set.intersection(*sights) if depth == 1 and sights else None
+
+        width = engine.current_state.grid.width
+        moves = self._candidate_moves(lit, last_cell, allowed)
+        if depth == 2 and sights:
+            moves = self._second_last_moves(moves, lit, sights)
+        elif depth == 1:
+            moves = self._last_moves(moves)
+        if depth >= ORDER_DEPTH:
+            moves = self._order_moves(moves)
+        for x, y, piece_type in moves:
+            engine.perform_action("place", x, y, piece_type)
+            path.append((x, y, piece_type))
+            found = self._search(depth - 1, path, y * width + x)
+            if found:
+                return True
+            path.pop()
+            engine.perform_action("remove", x, y)
+
+        self._failed[key] = depth
+        return False
+
+    def _candidate_moves(self, lit: Dict[int, int], last_cell: Optional[int],
+                         allowed: Optional[Set[int]]) -> List[Placement]:
+        """추적 순서상 `last_cell` 뒤에서 빛이 지나는 빈 셀 × 남은 조각 종류"""
+        engine = self.engine
+        board = engine.current_state.grid
+        pieces = sorted(p for p, count in engine.available_pieces.items() if count > 0)
+        moves = []
+        after_last = last_cell is None
+        for index, mask in lit.items():
+            if not after_last:
+                after_last = index == last_cell
+                continue
+            if board.cells[index] != EMPTY_CODE:
+                continue
+            if allowed is not None and index not in allowed:
+                continue
+            y, x = divmod(index, board.width)
+            for piece_type in pieces:
+                if changes_beam(piece_type, mask):
+                    moves.append((x, y, piece_type))
+        return moves
+
+    def _second_last_moves(self, moves: List[Placement], lit: Dict[int, int],
+                           sights: List[Set[int]]) -> List[Placement]:
+        """다음 수 하나로 닫힌 시선을 모두 채울 수 없는 수 제외
+
+        새 조각이 올라가지 않은 닫힌 시선은 그대로 닫혀 있으므로 마지막 수는
+        그 교집합에 놓여야 합니다. 그 셀은 추적 순서상 새 조각 뒤에서 빛을
+        받아야 하므로 지금 새 조각 뒤에 있거나 새 조각의 도달 범위에 있어야
+        합니다.
+        """
+        width = self.engine.current_state.grid.width
+        order = {index: position for position, index in enumerate(lit)}
+        reach: Dict[int, Set[int]] = {}
+        kept = []
+        for move in moves:
+            cell = move[1] * width + move[0]
+            rest = [sight for sight in sights if cell not in sight]
+            if rest:
+                common = set.intersection(*rest)
+                if max((order.get(index, -1) for index in common), default=-1) < order[cell]:
+                    if cell not in reach:
+                        reach[cell] = self._reach(cell, range(len(DIRECTION_DX)))
+                    if common.isdisjoint(reach[cell]):
+                        continue
+            kept.append(move)
+        return kept
+
+    def _last_moves(self, moves: List[Placement]) -> List[Placement]:
+        """맞지 않은 순색 타겟마다 새 빔을 보낼 수 있는 수만 남김
+
+        새 조각은 지금 들어오는 빔을 출력 방향으로 내보냅니다. 그 빔이 새
+        조각으로 되돌아올 수 없으면 타겟에는 이 출력이 시선을 따라 곧바로
+        들어오거나, 타겟 시선 끝의 조각을 거쳐 들어와야 합니다.
+        """
+        if not moves:
+            return moves
+        width = self.engine.current_state.grid.width
+        needs = self._unhit_sights()
+        if not needs:
+            return moves
+        incoming = self._incoming_beams({y * width + x for x, y, _ in moves})
+        reach: Dict[Tuple[int, FrozenSet[int]], Set[int]] = {}
+        kept = []
+        for x, y, piece_type in moves:
+            cell = y * width + x
+            code = CELL_CODES[CellType(piece_type)] << 2
+            outputs = {
+                output
+                for direction, color in incoming[cell]
+                for output in TRANSITION_TABLE[(code | direction) * len(BEAM_COLORS) + color]
+            }
+            directions = frozenset(direction for direction, _ in outputs)
+            if (cell, directions) not in reach:
+                reached = self._reach(cell, directions)
+                if cell in reached:
+                    # 되돌아오는 빔은 어느 방향으로든 나갈 수 있음
+                    reached = self._reach(cell, range(len(DIRECTION_DX)))
+                reach[(cell, directions)] = reached
+            reached = reach[(cell, directions)]
+            looped = cell in reached
+            if all(
+                not ends.isdisjoint(reached) or cell in sight and (looped or any(
+                    direction == sight[cell] and _RGB[color] & ~required == 0
+                    for direction, color in outputs
+                ))
+                for sight, ends, required in needs
+            ):
+                kept.append((x, y, piece_type))
+        return kept
+
+    def _unhit_sights(self) -> List[Tuple[Dict[int, int], Set[int], int]]:
+        """맞지 않은 순색 타겟별 (시선 셀 → 타겟 쪽 방향, 시선 끝 조각 셀, 요구 RGB)"""
+        cells = self.engine.current_state.grid.cells
+        needs = []
+        for index, targets in self.engine._target_index.items():
+            required = [
+                COLOR_RGB[target.required_color] for target in targets
+                if not target.is_hit and target.required_color in _PURE_COLORS
+            ]
+            if not required:
+                continue
+            sight: Dict[int, int] = {}
+            ends: Set[int] = set()
+            for d, ray in enumerate(self._rays[index]):
+                for cell in ray:
+                    code = cells[cell]
+                    if code != EMPTY_CODE:
+                        if code != WALL_CODE:
+                            ends.add(cell)
+                        break
+                    sight[cell] = _OPPOSITE[d]
+            needs.extend((sight, ends, rgb) for rgb in required)
+        return needs
+
+    def _incoming_beams(self, indices: Set[int]) -> Dict[int, Set[Tuple[int, int]]]:
+        """셀별로 들어오는 빔의 (방향, 색상) 인덱스"""
+        engine = self.engine
+        width = engine.current_state.grid.width
+        incoming: Dict[int, Set[Tuple[int, int]]] = {index: set() for index in indices}
+        for i, emitter in enumerate(engine.current_state.emitters):
+            if not emitter.active:
+                continue
+            for path_data in engine._emitter_paths[i]:
+                color = COLOR_INDEX[BeamColor(path_data["color"])]
+                px, py = path_data["start"]
+                for x, y in path_data["path"]:
+                    beams = incoming.get(y * width + x)
+                    if beams is not None:
+                        beams.add((DIRECTION_INDEX[(x - px, y - py)], color))
+                    px, py = x, y
+        return incoming
+
+    def _reach(self, start: int, directions: Iterable[int]) -> Set[int]:
+        """`start`에서 주어진 방향으로 나간 빔이 색상과 무관하게 닿을 수 있는 셀"""
+        board = self.engine.current_state.grid
+        cells, width, height = board.cells, board.width, board.height
+        reached: Set[int] = set()
+        visited: Set[Tuple[int, int]] = set()
+        stack = [(start, d) for d in directions]
+        while stack:
+            index, d = stack.pop()
+            y, x = divmod(index, width)
+            while True:
+                x += DIRECTION_DX[d]
+                y += DIRECTION_DY[d]
+                if not (0 <= x < width and 0 <= y < height):
+                    break
+                index = y * width + x
+                if (index, d) in visited:
+                    break
+                visited.add((index, d))
+                reached.add(index)
+                code = cells[index]
+                if code != EMPTY_CODE:
+                    stack.extend((index, out) for out in _ANY_COLOR_OUTPUTS[(code << 2) | d])
+                    break
+        return reached
+
+    def _order_moves(self, moves: List[Placement]) -> List[Placement]:
+        """맞힌 타겟 수, 빛이 지나는 셀 수가 많은 순으로 정렬 (같으면 원래 순서)"""
+        engine = self.engine
+        scored = []
+        for order, (x, y, piece_type) in enumerate(moves):
+            engine.perform_action("place", x, y, piece_type)
+            engine.calculate_light_paths()
+            hits = sum(target.is_hit for target in engine.current_state.targets)
+            scored.append((-hits, -len(engine.lit_cells()), order))
+            engine.perform_action("remove", x, y)
+        return [moves[order] for _, _, order in sorted(scored)]
+
+    def _target_rays(self) -> Dict[int, List[List[int]]]:
+        """타겟 셀별 네 방향 시선이 지나는 셀 인덱스 (타겟에서 가까운 순, 경계까지)"""
+        board = self.engine.current_state.grid
+        width, height = board.width, board.height
+        rays = {}
+        for index in self.engine._target_index:
+            ty, tx = divmod(index, width)
+            rays[index] = []
+            for dx, dy in zip(DIRECTION_DX, DIRECTION_DY):
+                ray = []
+                x, y = tx + dx, ty + dy
+                while 0 <= x < width and 0 <= y < height:
+                    ray.append(y * width + x)
+                    x += dx
+                    y += dy
+                rays[index].append(ray)
+        return rays
+
+    def _closed_sights(self, lit: Dict[int, int]) -> List[Set[int]]:
+        """빛이 닿지 않고 네 방향 시선이 모두 벽이나 경계에서 끝나는 타겟의 시선 셀들
+
+        이런 타겟으로 들어오는 빔은 시선 위에 새로 놓인 조각에서만 출발할 수
+        있으므로, 남은 수 중 하나는 반드시 해당 시선 위에 놓여야 합니다.
+        """
+        cells = self.engine.current_state.grid.cells
+        sights = []
+        for index, rays in self._rays.items():
+            if index in lit:
+                continue
+            sight = set()
+            closed = True
+            for ray in rays:
+                for cell in ray:
+                    code = cells[cell]
+                    if code != EMPTY_CODE:
+                        closed = closed and code == WALL_CODE
+                        break
+                    sight.add(cell)
+            if closed:
+                sights.append(sight)
+        return sights
+
+
+def _disjoint_count(sights: List[Set[int]]) -> int:
+    """서로 겹치지 않는 시선 수 (각각 다른 조각이 필요하므로 남은 수의 하한)"""
+    count = 0
+    used: Set[int] = set()
+    for sight in sorted(sights, key=len):
+        if used.isdisjoint(sight):
+            used |= sight
+            count += 1
+    return count
+
+
+_RGB = [COLOR_RGB[color] for color in BEAM_COLORS]
+_PURE_COLORS = {BeamColor.WHITE, BeamColor.RED, BeamColor.GREEN, BeamColor.BLUE}
+_OPPOSITE = [DIRECTION_INDEX[(-dx, -dy)] for dx, dy in zip(DIRECTION_DX, DIRECTION_DY)]
+# (셀 코드 << 2) | 입사 방향 → 어떤 색상으로든 나갈 수 있는 방향들
+_ANY_COLOR_OUTPUTS: Dict[int, Set[int]] = {}
+for _key, _outputs in enumerate(TRANSITION_TABLE):
+    _ANY_COLOR_OUTPUTS.setdefault(_key // len(BEAM_COLORS), set()).update(d for d, _ in _outputs)
+
+_FILTER_COLORS = {
+    CellType.FILTER_RED.value: BeamColor.RED,
+    CellType.FILTER_GREEN.value: BeamColor.GREEN,
+    CellType.FILTER_BLUE.value: BeamColor.BLUE,
+}
+
+
+def changes_beam(piece_type: str, mask: int) -> bool:
+    """셀을 지나는 빔 색상(mask)에 대해 조각이 빛 경로를 바꾸는지"""
+    if piece_type in _FILTER_COLORS:
+        # 같은 색 빔만 지나면 그대로 통과
+        return mask != 1 << COLOR_INDEX[_FILTER_COLORS[piece_type]]
+    if piece_type == CellType.PRISM.value:
+        # 백색광이 아니면 그대로 통과
+        return bool(mask >> COLOR_INDEX[BeamColor.WHITE] & 1)
+    return True
+
+
+def solve_level(level_data: dict, max_nodes: int = 200000,
+                placed: Optional[Dict[Tuple[int, int], str]] = None,
+                time_limit: Optional[float] = None) -> SolveResult:
+    """레벨 풀이"""
+    return LevelSolver(level_data, max_nodes=max_nodes, time_limit=time_limit).solve(placed=placed)
+
+
+PIECE_TYPES = {cell.value for cell in CellType} - {CellType.EMPTY.value, CellType.WALL.value}
+
+
+def _require_int(value, name: str, low: int, high: int) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or not low <= value <= high:
+        raise ValueError(f"{name} must be an integer between {low} and {high}: {value!r}")
+    return value
+
+
+def check_level_data(level_data: dict):
+    """레벨 데이터 형식 검사 (좌표는 격자 안, 방향/색상/조각은 알려진 값)
+
+    잘못된 값이면 ValueError를 발생시킵니다.
+    """
+    if not isinstance(level_data, dict):
+        raise ValueError("level must be an object")
+    size = _require_int(level_data.get("grid_size", 10), "grid_size", 1, MAX_GRID_SIZE)
+    if "min_moves" in level_data:
+        _require_int(level_data["min_moves"], "min_moves", 0, 1 << 31)
+
+    def cells(key: str, fields: Dict[str, type]) -> List[dict]:
+        items = level_data.get(key, [])
+        if not isinstance(items, list):
+            raise ValueError(f"{key} must be a list")
+        for item in items:
+            if not isinstance(item, dict):
+                raise ValueError(f"{key} entries must be objects")
+            _require_int(item.get("x"), f"{key}.x", 0, size - 1)
+            _require_int(item.get("y"), f"{key}.y", 0, size - 1)
+            for field, enum in fields.items():
+                if item.get(field) not in enum.__members__:
+                    raise ValueError(f"{key}.{field} must be one of {', '.join(enum.__members__)}")
+        return items
+
+    cells("walls", {})
+    cells("emitters", {"direction": Direction, "color": BeamColor})
+    cells("targets", {"required_color": BeamColor})
+    pieces = level_data.get("available_pieces", {})
+    if not isinstance(pieces, dict):
+        raise ValueError("available_pieces must be an object")
+    for piece_type, count in pieces.items():
+        if piece_type not in PIECE_TYPES:
+            raise ValueError(f"Unknown piece type: {piece_type}")
+        _require_int(count, f"available_pieces.{piece_type}", 0, size * size)
+
+
+def validate_level(level_data: dict, max_nodes: int = 200000,
+                   time_limit: Optional[float] = None) -> Dict:
+    """레벨 검증: 풀이 가능 여부와 선언된 min_moves의 정확성
+
+    형식이 잘못된 레벨은 풀이 전에 ValueError를 발생시킵니다.
+    """
+    check_level_data(level_data)
+    result = solve_level(level_data, max_nodes=max_nodes, time_limit=time_limit)
+    solution = result.solution
+    min_moves = solution.moves if solution else None
+    return {
+        "level_id": level_data.get("id"),
+        "solvable": solution is not None,
+        "complete": result.complete,
+        "min_moves": min_moves,
+        "declared_min_moves": level_data.get("min_moves"),
+        "valid": solution is not None and min_moves == level_data.get("min_moves"),
+        "solution": [
+            {"x": x, "y": y, "piece_type": piece_type}
+            for x, y, piece_type in (solution.placements if solution else [])
+        ],
+        "nodes": result.nodes
+    }
@@ -0,0 +1,50 @@
+"""
+Trace Cache - 보드 해시별 빛 경로 계산 결과 공유 캐시
+"""
+from typing import Dict, List, Optional, Tuple
+from collections import OrderedDict
+import threading
+
+# (발광기별 경로, 발광기별 점유 마스크, 타겟 히트 여부) - HistoryNode.paths와 같은 형식
+TraceResult = Tuple[Tuple[List, ...], Tuple[Dict[int, int], ...], Tuple[bool, ...]]
+
+
+class TraceCache:
+    """보드 해시(GameEngine.board_hash) → 추적 결과 LRU 캐시
+
+    여러 세션의 엔진이 공유하므로, 같은 레벨에서 같은 배치에 도달한
+    플레이어는 빔을 추적하지 않고 저장된 결과를 사용합니다. 저장된 경로와
+    마스크는 읽기 전용으로 다룹니다.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[int, TraceResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: int) -> Optional[TraceResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return result
+
+    def put(self, key: int, result: TraceResult):
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
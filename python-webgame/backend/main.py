@@ -2,20 +2,40 @@
 Mirror Maze - 빛의 미로 퍼즐 게임
 FastAPI Backend Server
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict
+from contextlib import asynccontextmanager
+import asyncio
 import json
+import os
 from pathlib import Path
 
 from backend.core.game_engine import GameEngine, GameState
+from backend.core.hint_engine import HintEngine
+from backend.core.leaderboard import BOARDS, Leaderboard
 from backend.core.level_manager import LevelManager
+from backend.core.payload_cache import CachedPayload, PayloadCache
+from backend.core.progress_store import ProgressStore
+from backend.core.replay import ReplayStore, ReplayVerifier, encode_action, encode_start
+from backend.core.session_manager import SessionManager
+from backend.core.session_store import MemorySessionStore, SessionConflictError, SqliteSessionStore
+from backend.core.solver import validate_level
+from backend.core.trace_cache import TraceCache
 from backend.models.game_models import Level, Move, PlayerProgress
 
-app = FastAPI(title="Mirror Maze - 빛의 미로")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # 종료 전 대기 중인 진행상황 기록
+    progress_store.flush()
+    if session_store is not None:
+        session_store.close()
+
+app = FastAPI(title="Mirror Maze - 빛의 미로", lifespan=lifespan)
 
 # CORS 설정
 app.add_middleware(
@@ -27,14 +47,76 @@ app.add_middleware(
 )
 
 # Game instances
-game_engine = GameEngine()
-level_manager = LevelManager()
+hint_engine = HintEngine(
+    time_limit=float(os.getenv("MIRROR_MAZE_HINT_TIME_LIMIT", "0.5"))
+)
+
+SESSION_COOKIE = "session_id"
+SESSION_HEADER = "X-Session-ID"
+# 업로드한 레벨을 검증하는 풀이기의 시간 한도 (넘으면 검증되지 않은 레벨로 저장)
+UPLOAD_SOLVE_SECONDS = float(os.getenv("MIRROR_MAZE_UPLOAD_TIME_LIMIT", "5"))
+# 웹소켓에서 연속된 액션을 한 번의 추적으로 묶는 대기 시간
+WS_COALESCE_SECONDS = float(os.getenv("MIRROR_MAZE_WS_COALESCE_MS", "15")) / 1000
 
 # Static files
-app.mount("/static", StaticFiles(directory="static"), name="static")
-app.mount("/assets", StaticFiles(directory="frontend/assets"), name="assets")
-app.mount("/css", StaticFiles(directory="frontend/css"), name="css")
-app.mount("/js", StaticFiles(directory="frontend/js"), name="js")
+BASE_DIR = Path(__file__).resolve().parent.parent
+FRONTEND_DIR = BASE_DIR / "frontend"
+
+DATA_DIR = BASE_DIR / "data"
+
+level_manager = LevelManager(
+    custom_dir=os.getenv("MIRROR_MAZE_CUSTOM_LEVELS", str(DATA_DIR / "custom_levels"))
+)
+# (목록 버전, 커서, 개수, 난이도) → 직렬화된 레벨 목록 페이지
+levels_cache = PayloadCache(max_entries=1024)
+# 레벨 ID → 직렬화/압축된 레벨 데이터 (저장된 레벨은 바뀌지 않으므로 무효화 불필요)
+level_payloads = PayloadCache(max_entries=4096, compress=True)
+LEVEL_CACHE_CONTROL = "public, max-age=3600"
+_index_page: Optional[CachedPayload] = None
+progress_store = ProgressStore(os.getenv("MIRROR_MAZE_DB", str(DATA_DIR / "mirror_maze.db")))
+leaderboard = Leaderboard(progress_store)
+SESSION_TTL = float(os.getenv("MIRROR_MAZE_SESSION_TTL", "1800"))
+# 세션별 액션 로그 (진행상황 저장 시 재생하여 이동 수와 별 개수 검증, 세션과 함께 만료)
+replay_store = ReplayStore(os.getenv("MIRROR_MAZE_REPLAYS", str(DATA_DIR / "replays")),
+                           ttl_seconds=SESSION_TTL)
+replay_verifier = ReplayVerifier(level_manager.get_level)
+
+# 세션 저장소: local(프로세스 메모리의 엔진만 사용), memory, sqlite(여러 워커가 공유)
+SESSION_STORE = os.getenv("MIRROR_MAZE_SESSION_STORE", "local")
+if SESSION_STORE == "sqlite":
+    session_store = SqliteSessionStore(
+        os.getenv("MIRROR_MAZE_SESSION_DB", str(DATA_DIR / "sessions.db")), ttl_seconds=SESSION_TTL
+    )
+elif SESSION_STORE == "memory":
+    session_store = MemorySessionStore(ttl_seconds=SESSION_TTL)
+else:
+    session_store = None
+# 보드 해시 → 빛 경로 추적 결과 (모든 세션이 공유)
+trace_cache = TraceCache(max_entries=int(os.getenv("MIRROR_MAZE_TRACE_CACHE", "4096")))
+
+def _new_engine() -> GameEngine:
+    engine = GameEngine()
+    engine.trace_cache = trace_cache
+    return engine
+
+session_manager = SessionManager(
+    max_sessions=int(os.getenv("MIRROR_MAZE_MAX_SESSIONS", "10000")),
+    max_bytes=int(float(os.getenv("MIRROR_MAZE_SESSION_MEMORY_MB", "512")) * 1024 * 1024),
+    ttl_seconds=SESSION_TTL,
+    engine_factory=_new_engine,
+    store=session_store,
+    level_loader=level_manager.get_level,
+    on_evict=replay_store.delete
+)
+
+for mount_path, directory in [
+    ("/static", BASE_DIR / "static"),
+    ("/assets", FRONTEND_DIR / "assets"),
+    ("/css", FRONTEND_DIR / "css"),
+    ("/js", FRONTEND_DIR / "js"),
+]:
+    if directory.is_dir():
+        app.mount(mount_path, StaticFiles(directory=directory), name=mount_path.strip("/"))
 
 # API Models
 class GameAction(BaseModel):
@@ -43,50 +125,167 @@ class GameAction(BaseModel):
     y: int
     piece_type: Optional[str] = None
     rotation: Optional[int] = None
+    since_version: Optional[int] = None  # 주면 이 버전 이후의 변경분만 응답
+    full: bool = False  # since_version이 있어도 전체 상태 요청
+
+class GameActionBatch(BaseModel):
+    actions: List[GameAction]
+    checkpoint_every: int = 0  # 0이면 마지막에 한 번만 빛 경로 계산
+    since_version: Optional[int] = None
+    full: bool = False
 
 class GameSession(BaseModel):
     session_id: str
     level_id: int
     moves: int
     stars: int
+    player_id: Optional[str] = None  # 없으면 세션 ID를 플레이어 ID로 사용
+    completed: Optional[bool] = None  # 없으면 별이 있을 때 완료로 간주
+    # 플레이 시간은 받지 않고 리플레이 시작 레코드부터 저장 요청까지로 계산
+
+# Session helpers
+def _get_session_id(request: Request) -> Optional[str]:
+    """요청 헤더 또는 쿠키에서 세션 ID 추출"""
+    return request.headers.get(SESSION_HEADER) or request.cookies.get(SESSION_COOKIE)
+
+def _get_engine(request: Request) -> GameEngine:
+    """세션의 게임 엔진 반환"""
+    engine = session_manager.get(_get_session_id(request))
+    if engine is None:
+        raise HTTPException(status_code=404, detail="Session not found")
+    return engine
+
+def _save_engine(request: Request, engine: GameEngine):
+    """바뀐 세션 상태를 세션 저장소에 기록"""
+    _save_session(_get_session_id(request), engine)
+
+def _save_session(session_id: str, engine: GameEngine):
+    """세션 상태 기록 (다른 요청이 먼저 갱신했으면 409)"""
+    try:
+        session_manager.save(session_id, engine)
+    except SessionConflictError:
+        raise HTTPException(status_code=409, detail="Session was modified by another request")
+
+def _start_session_game(request: Request, response: Response, level: dict):
+    """세션 엔진으로 새 게임 시작 (세션이 없으면 생성)"""
+    session_id, engine = session_manager.get_or_create(_get_session_id(request))
+    response.set_cookie(SESSION_COOKIE, session_id, httponly=True, samesite="lax")
+    engine.start_new_game(level)
+    _save_session(session_id, engine)
+    replay_store.append(session_id, encode_start(level["id"]))
+    return session_id, engine
+
+def _action_result(game_engine: GameEngine, since_version: Optional[int] = None,
+                   full: bool = False) -> Dict:
+    """빛 경로를 다시 계산하고 액션 응답 생성 (가능하면 델타)"""
+    light_paths = game_engine.calculate_light_paths()
+    is_complete = game_engine.check_victory()
+    
+    result = {
+        "success": True,
+        "version": game_engine.version,
+        "is_complete": is_complete,
+        "moves": game_engine.current_moves,
+        "stars": game_engine.calculate_stars() if is_complete else 0,
+        "available_pieces": dict(game_engine.available_pieces)
+    }
+    if since_version is not None and not full:
+        delta = game_engine.get_delta(since_version)
+        if delta is not None:
+            result["delta"] = delta
+            return result
+    
+    result["full"] = True
+    result["game_state"] = game_engine.get_current_state().dict()
+    result["light_paths"] = light_paths
+    return result
 
 # Routes
 @app.get("/")
-async def root():
-    """게임 메인 페이지"""
-    with open("frontend/index.html", "r", encoding="utf-8") as f:
-        return HTMLResponse(content=f.read())
+async def root(request: Request):
+    """게임 메인 페이지 (처음 요청 시 한 번 읽어 메모리에서 제공)"""
+    global _index_page
+    if _index_page is None:
+        _index_page = CachedPayload.from_bytes(
+            (FRONTEND_DIR / "index.html").read_bytes(),
+            media_type="text/html; charset=utf-8",
+            compress=True
+        )
+    return _index_page.response(request)
 
 @app.get("/api/levels")
-async def get_levels():
-    """모든 레벨 목록 반환"""
-    return level_manager.get_all_levels()
+async def get_levels(request: Request, cursor: Optional[int] = None,
+                     limit: int = Query(50, ge=1, le=500),
+                     difficulty: Optional[str] = None):
+    """레벨 목록 페이지 반환 (`next_cursor`를 다음 요청의 `cursor`로 사용)
+
+    페이지는 직렬화된 채로 캐시되며 ETag/If-None-Match를 지원합니다.
+    """
+    def build():
+        levels, next_cursor = level_manager.get_levels_page(cursor, limit, difficulty)
+        return {"levels": levels, "next_cursor": next_cursor}
+    
+    level_manager.refresh()
+    key = (level_manager.version, cursor, limit, difficulty)
+    return levels_cache.get(key, build).response(request)
+
+@app.post("/api/levels")
+async def upload_level(level: Dict):
+    """커스텀 레벨 업로드 (풀이기로 검증 후 min_moves 계산)
+
+    풀이기는 시간 한도 안에서 스레드 풀에서 실행되어 이벤트 루프를 막지 않습니다.
+    """
+    try:
+        report = await run_in_threadpool(validate_level, level, time_limit=UPLOAD_SOLVE_SECONDS)
+    except (KeyError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid level data: {e}")
+    if report["complete"] and not report["solvable"]:
+        raise HTTPException(status_code=400, detail="Level is not solvable")
+    if report["solvable"]:
+        level["min_moves"] = report["min_moves"]
+    
+    if not level_manager.save_custom_level(level):
+        raise HTTPException(status_code=400, detail="Failed to save level")
+    levels_cache.clear()
+    return {
+        "status": "saved",
+        "level_id": level["id"],
+        "min_moves": level.get("min_moves"),
+        "verified": report["solvable"]
+    }
 
 @app.get("/api/levels/{level_id}")
-async def get_level(level_id: int):
-    """특정 레벨 데이터 반환"""
-    level = level_manager.get_level(level_id)
-    if not level:
+async def get_level(level_id: int, request: Request):
+    """특정 레벨 데이터 반환 (미리 직렬화된 본문과 ETag)"""
+    payload = level_payloads.get(level_id, lambda: level_manager.get_level(level_id))
+    if payload is None:
         raise HTTPException(status_code=404, detail="Level not found")
-    return level
+    return payload.response(request, LEVEL_CACHE_CONTROL)
 
 @app.post("/api/game/start/{level_id}")
-async def start_game(level_id: int):
+async def start_game(level_id: int, request: Request, response: Response):
     """새 게임 시작"""
     level = level_manager.get_level(level_id)
     if not level:
         raise HTTPException(status_code=404, detail="Level not found")
     
-    game_state = game_engine.start_new_game(level)
+    session_id, engine = _start_session_game(request, response, level)
     return {
         "status": "started",
+        "session_id": session_id,
         "level_id": level_id,
-        "game_state": game_state.dict()
+        "version": engine.version,
+        "game_state": engine.current_state.dict()
     }
 
 @app.post("/api/game/action")
-async def perform_action(action: GameAction):
-    """게임 액션 수행 (거울 배치, 회전, 제거)"""
+async def perform_action(action: GameAction, request: Request):
+    """게임 액션 수행 (거울 배치, 회전, 제거)
+
+    `since_version`을 주면 그 버전 이후 바뀐 셀, 빔 구간, 타겟만 `delta`로
+    응답합니다. 변경 기록이 남아 있지 않거나 `full`이면 전체 상태를 응답합니다.
+    """
+    game_engine = _get_engine(request)
     try:
         result = game_engine.perform_action(
             action.action,
@@ -96,43 +295,200 @@ async def perform_action(action: GameAction):
             action.rotation
         )
         
-        # 빛의 경로 재계산
-        light_paths = game_engine.calculate_light_paths()
-        
-        # 승리 조건 체크
-        is_complete = game_engine.check_victory()
-        
-        return {
-            "success": True,
-            "game_state": game_engine.get_current_state().dict(),
-            "light_paths": light_paths,
-            "is_complete": is_complete,
-            "moves": game_engine.current_moves,
-            "stars": game_engine.calculate_stars() if is_complete else 0
-        }
+        # 빛의 경로 재계산 및 승리 조건 체크
+        response = _action_result(game_engine, action.since_version, action.full)
     except Exception as e:
         return {
             "success": False,
             "error": str(e)
         }
+    _save_engine(request, game_engine)
+    if result:
+        replay_store.append(_get_session_id(request),
+                            encode_action(action.action, action.x, action.y, action.piece_type))
+    return response
+
+@app.post("/api/game/actions")
+async def perform_actions(batch: GameActionBatch, request: Request):
+    """여러 액션을 원자적으로 적용하고 최종 상태 반환 (하나라도 실패하면 모두 취소)"""
+    game_engine = _get_engine(request)
+    result = game_engine.perform_actions(
+        [action.model_dump(exclude={"since_version", "full"}) for action in batch.actions],
+        checkpoint_every=batch.checkpoint_every
+    )
+    if result.failed_index is not None:
+        return {
+            "success": False,
+            "failed_index": result.failed_index,
+            "error": result.error
+        }
+    
+    response = _action_result(game_engine, batch.since_version, batch.full)
+    response["applied"] = result.applied
+    response["checkpoints"] = result.checkpoints
+    _save_engine(request, game_engine)
+    replay_store.append(_get_session_id(request), *(
+        encode_action(action.action, action.x, action.y, action.piece_type)
+        for action in batch.actions
+    ))
+    return response
+
+@app.post("/api/game/undo")
+async def undo_action(request: Request, since_version: Optional[int] = None):
+    """마지막 액션 되돌리기"""
+    game_engine = _get_engine(request)
+    if not game_engine.undo():
+        return {"success": False, "error": "Nothing to undo"}
+    response = _action_result(game_engine, since_version)
+    _save_engine(request, game_engine)
+    replay_store.append(_get_session_id(request), encode_action("undo"))
+    return response
+
+@app.post("/api/game/redo")
+async def redo_action(request: Request, since_version: Optional[int] = None):
+    """되돌린 액션 다시 실행"""
+    game_engine = _get_engine(request)
+    if not game_engine.redo():
+        return {"success": False, "error": "Nothing to redo"}
+    response = _action_result(game_engine, since_version)
+    _save_engine(request, game_engine)
+    replay_store.append(_get_session_id(request), encode_action("redo"))
+    return response
+
+@app.get("/api/game/history")
+async def get_history(request: Request):
+    """현재 게임의 액션 기록"""
+    game_engine = _get_engine(request)
+    return {
+        "moves": game_engine.get_history(),
+        "can_undo": game_engine.can_undo(),
+        "can_redo": game_engine.can_redo()
+    }
+
+@app.websocket("/ws/game")
+async def game_socket(websocket: WebSocket):
+    """웹소켓 게임 채널
+
+    연결 시 전체 상태를 보내고, 이후 받은 액션들을 적용한 뒤 마지막으로
+    보낸 버전 이후의 델타를 보냅니다. 짧은 시간 안에 연달아 온 액션은 한
+    번의 빛 경로 계산과 한 번의 응답으로 묶습니다.
+    """
+    session_id = websocket.query_params.get("session_id") or websocket.cookies.get(SESSION_COOKIE)
+    game_engine = session_manager.get(session_id)
+    await websocket.accept()
+    if game_engine is None or game_engine.current_state is None:
+        await websocket.send_json({"type": "error", "error": "Session not found"})
+        await websocket.close(code=4404)
+        return
+    
+    snapshot = _action_result(game_engine)
+    await websocket.send_json({"type": "snapshot", **snapshot})
+    version = snapshot["version"]
+    
+    queue: "asyncio.Queue[Optional[Dict]]" = asyncio.Queue()
+    
+    async def reader():
+        try:
+            while True:
+                await queue.put(await websocket.receive_json())
+        except (WebSocketDisconnect, ValueError):
+            await queue.put(None)
+    
+    reader_task = asyncio.create_task(reader())
+    try:
+        while True:
+            messages = [await queue.get()]
+            if WS_COALESCE_SECONDS > 0:
+                await asyncio.sleep(WS_COALESCE_SECONDS)
+            while not queue.empty():
+                messages.append(queue.get_nowait())
+            closed = None in messages
+            messages = [m for m in messages if m is not None]
+            
+            errors = []
+            records = []
+            for message in messages:
+                try:
+                    action = GameAction(**message)
+                    if game_engine.perform_action(action.action, action.x, action.y,
+                                                  action.piece_type, action.rotation):
+                        records.append(encode_action(action.action, action.x, action.y,
+                                                     action.piece_type))
+                except Exception as e:
+                    errors.append(str(e))
+            applied = len(records)
+            if not messages:
+                break
+            
+            # 연결이 끊긴 배치라도 적용한 액션은 저장하고 기록 (응답만 생략)
+            try:
+                session_manager.save(session_id, game_engine)
+            except SessionConflictError:
+                if closed:
+                    break
+                # 다른 워커가 세션을 갱신함: 저장된 상태를 다시 읽어 전체 상태 전송
+                game_engine = session_manager.get(session_id)
+                if game_engine is None or game_engine.current_state is None:
+                    await websocket.send_json({"type": "error", "error": "Session not found"})
+                    await websocket.close(code=4404)
+                    break
+                snapshot = _action_result(game_engine)
+                version = snapshot["version"]
+                await websocket.send_json({
+                    "type": "snapshot",
+                    "error": "Session was modified by another request",
+                    **snapshot
+                })
+                continue
+            replay_store.append(session_id, *records)
+            if closed:
+                break
+            
+            result = _action_result(game_engine, version)
+            version = result["version"]
+            await websocket.send_json({
+                "type": "update",
+                "actions": len(messages),
+                "applied": applied,
+                "errors": errors,
+                **result
+            })
+    finally:
+        reader_task.cancel()
 
 @app.post("/api/game/reset/{level_id}")
-async def reset_game(level_id: int):
+async def reset_game(level_id: int, request: Request, response: Response):
     """현재 레벨 리셋"""
     level = level_manager.get_level(level_id)
     if not level:
         raise HTTPException(status_code=404, detail="Level not found")
     
-    game_state = game_engine.start_new_game(level)
+    session_id, engine = _start_session_game(request, response, level)
     return {
         "status": "reset",
+        "session_id": session_id,
         "level_id": level_id,
-        "game_state": game_state.dict()
+        "version": engine.version,
+        "game_state": engine.current_state.dict()
     }
 
 @app.get("/api/game/hint/{level_id}")
-async def get_hint(level_id: int):
-    """레벨 힌트 제공"""
+async def get_hint(level_id: int, request: Request):
+    """레벨 힌트 제공 (현재 보드에서 최단 풀이의 다음 수)
+
+    캐시에 없는 보드의 풀이 탐색은 스레드 풀에서 실행합니다.
+    """
+    game_engine = _get_engine(request)
+    state = game_engine.get_current_state()
+    level = level_manager.get_level(level_id)
+    if level and state and state.level_id == level_id:
+        board = hint_engine.snapshot(game_engine)
+        found, solver_hint = hint_engine.lookup(board[0])
+        if not found:
+            solver_hint = await run_in_threadpool(hint_engine.compute, board, level)
+        if solver_hint:
+            return solver_hint
+    
     hint = game_engine.get_hint()
     if not hint:
         return {"hint": "No hint available"}
@@ -140,30 +496,81 @@ async def get_hint(level_id: int):
 
 @app.post("/api/progress/save")
 async def save_progress(session: GameSession):
-    """게임 진행상황 저장"""
-    # 실제로는 데이터베이스에 저장
+    """게임 진행상황 저장 (백그라운드에서 일괄 기록)
+
+    세션 액션 로그에서 이 레벨의 마지막 게임을 재생하여, 로그가 없거나
+    제출한 이동 수와 별 개수가 재생 결과와 다르면 거부합니다. 플레이 시간은
+    그 게임의 시작 시각부터 지금까지로 계산합니다.
+    """
+    completed = session.completed if session.completed is not None else session.stars > 0
+    log = replay_store.load(session.session_id)
+    replay = replay_verifier.verify(log, session.level_id) if log else None
+    if replay is None:
+        raise HTTPException(status_code=400, detail="No session replay for this level")
+    if not replay.matches(session.moves, session.stars, completed):
+        raise HTTPException(status_code=400, detail="Score does not match the session replay")
+    play_time = replay.play_time()
+    progress_store.save(PlayerProgress(
+        player_id=session.player_id or session.session_id,
+        level_id=session.level_id,
+        completed=completed,
+        stars=session.stars,
+        moves=session.moves,
+        best_moves=session.moves if completed else 0,
+        play_time=play_time
+    ))
+    if completed and session.moves > 0:
+        leaderboard.submit(session.level_id, session.player_id or session.session_id,
+                           session.moves, play_time)
     return {
         "status": "saved",
         "session_id": session.session_id,
         "level_id": session.level_id,
-        "stars": session.stars
+        "stars": session.stars,
+        "verified": True
     }
 
+@app.get("/api/progress/{player_id}")
+async def get_progress(player_id: str):
+    """플레이어의 레벨별 진행상황"""
+    return progress_store.get_progress(player_id)
+
+@app.get("/api/leaderboard/{level_id}")
+async def get_leaderboard(level_id: int, by: str = "moves",
+                          limit: int = Query(10, ge=1, le=100),
+                          player_id: Optional[str] = None):
+    """레벨 순위표 (by=moves: 최소 이동 수, by=time: 최단 시간)
+
+    상위 `limit`명과, `player_id`를 주면 그 플레이어의 순위와 백분위를 반환합니다.
+    """
+    if by not in BOARDS:
+        raise HTTPException(status_code=400, detail=f"by must be one of {', '.join(BOARDS)}")
+    if level_manager.get_level(level_id) is None:
+        raise HTTPException(status_code=404, detail="Level not found")
+    leaderboard.sync()
+    return leaderboard.query(level_id, by, limit, player_id)
+
 @app.get("/api/stats")
-async def get_stats():
-    """게임 통계"""
+async def get_stats(player_id: Optional[str] = None):
+    """게임 통계 (player_id를 주면 해당 플레이어 통계, 미리 집계된 값 조회)"""
     return {
         "total_levels": level_manager.get_total_levels(),
-        "completed_levels": 0,  # DB에서 가져오기
-        "total_stars": 0,  # DB에서 가져오기
-        "total_moves": 0  # DB에서 가져오기
+        **progress_store.get_stats(player_id)
     }
 
 @app.get("/health")
 async def health_check():
     """헬스 체크"""
-    return {"status": "healthy", "game": "Mirror Maze"}
+    return {
+        "status": "healthy",
+        "game": "Mirror Maze",
+        "sessions": session_manager.stats(),
+        "trace_cache": trace_cache.stats()
+    }
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # 여러 워커로 실행할 때는 MIRROR_MAZE_SESSION_STORE=sqlite로 세션을 공유
+    workers = int(os.getenv("MIRROR_MAZE_WORKERS", "1"))
+    uvicorn.run("backend.main:app", host="0.0.0.0", port=8000,
+                workers=workers, reload=workers == 1)
\ No newline at end of file
@@ -1,7 +1,7 @@
 """
 Game Models - 데이터 모델 정의
 """
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import List, Optional, Dict
 from datetime import datetime
 
@@ -24,7 +24,7 @@ class Move(BaseModel):
     x: int
     y: int
     piece_type: Optional[str] = None
-    timestamp: datetime = datetime.now()
+    timestamp: datetime = Field(default_factory=datetime.now)
     
 class PlayerProgress(BaseModel):
     """플레이어 진행상황"""
@@ -0,0 +1,3 @@
+"""
+Mirror Maze 벤치마크 패키지
+"""
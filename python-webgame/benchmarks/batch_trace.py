@@ -0,0 +1,71 @@
+"""
+Batch trace benchmark - 일괄 추적과 엔진 반복 추적의 초당 보드 수 비교
+
+    python -m benchmarks.batch_trace --sizes 10 50 100 --boards 5000
+"""
+import argparse
+import random
+import time
+
+from backend.core.batch_trace import BatchTracer
+from backend.core.game_engine import GameEngine, CellType
+from benchmarks.boards import make_level
+
+PIECES = ["mirror_left", "mirror_right", "splitter", "prism"]
+
+
+def measure(size: int, boards: int, seed: int = 0) -> dict:
+    """무작위 배치 보드들을 두 방식으로 추적한 초당 보드 수"""
+    level = make_level(size, seed=seed)
+    tracer = BatchTracer(level)
+    rng = random.Random(seed)
+    placements = []
+    for _ in range(boards):
+        placed = {}
+        for _ in range(max(1, size // 3)):
+            x, y = rng.randrange(1, size - 1), rng.randrange(size)
+            if tracer.base_board[y, x] == 0:
+                placed[(x, y)] = rng.choice(PIECES)
+        placements.append(placed)
+
+    stacked = tracer.stack(placements)
+    start = time.perf_counter()
+    tracer.trace(stacked)
+    batch_time = time.perf_counter() - start
+
+    engine = GameEngine()
+    engine.track_changes = False
+    engine.start_new_game(level)
+    base = tracer.base_board.tobytes()
+    start = time.perf_counter()
+    for placed in placements:
+        engine.current_state.grid.cells[:] = base
+        for (x, y), piece_type in placed.items():
+            engine.current_state.grid.set(x, y, CellType(piece_type))
+        engine._reset_path_cache()
+        engine.calculate_light_paths()
+    engine_time = time.perf_counter() - start
+
+    return {
+        "size": size,
+        "batch_boards_per_s": boards / batch_time,
+        "engine_boards_per_s": boards / engine_time
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일괄 추적 처리량 측정")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--boards", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'batch/s':>12} {'engine/s':>12} {'speedup':>8}")
+    for size in args.sizes:
+        result = measure(size, args.boards)
+        print(f"{result['size']:>6} {result['batch_boards_per_s']:>12.0f} "
+              f"{result['engine_boards_per_s']:>12.0f} "
+              f"{result['batch_boards_per_s'] / result['engine_boards_per_s']:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+벤치마크용 보드 생성
+"""
+from typing import Dict, List
+import random
+
+
+def make_level(size: int, emitters: int = 4, wall_density: float = 0.02,
+               pieces: Dict[str, int] = None, seed: int = 0) -> dict:
+    """왼쪽 가장자리에 발광기, 오른쪽 가장자리에 타겟이 있는 무작위 레벨"""
+    rng = random.Random(seed)
+    rows = rng.sample(range(size), min(emitters, size))
+    blocked = {(0, y) for y in rows} | {(size - 1, y) for y in rows}
+    walls: List[Dict[str, int]] = []
+    for _ in range(int(size * size * wall_density)):
+        x, y = rng.randrange(1, size - 1), rng.randrange(size)
+        if (x, y) not in blocked:
+            walls.append({"x": x, "y": y})
+    return {
+        "id": 0,
+        "grid_size": size,
+        "min_moves": 1,
+        "walls": walls,
+        "emitters": [
+            {"x": 0, "y": y, "direction": "RIGHT", "color": "WHITE"} for y in rows
+        ],
+        "targets": [
+            {"x": size - 1, "y": y, "required_color": "WHITE"} for y in rows
+        ],
+        "available_pieces": pieces or {
+            "mirror_left": size * size,
+            "mirror_right": size * size,
+            "splitter": size * size,
+            "prism": size * size
+        }
+    }
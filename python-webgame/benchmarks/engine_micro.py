@@ -0,0 +1,155 @@
+"""
+Engine micro benchmark - 엔진 핫 패스별 초당 호출 수와 호출당 할당량 측정
+
+    python -m benchmarks.engine_micro --sizes 10 50 100 --densities 0 0.05 0.2 1
+
+밀도는 빈 셀 중 분할기/프리즘이 놓인 비율이며, 1이면 모든 빈 셀이
+분할기나 프리즘인 연쇄 분기 최악의 보드입니다.
+
+결과는 load_test와 같이 --out 파일(JSON Lines)에 커밋 해시와 함께 추가되며,
+같은 설정의 이전 결과가 있으면 연산별 초당 호출 수 변화를 함께 출력합니다.
+"""
+from typing import Callable, Dict, List, Optional
+import argparse
+import random
+import time
+import tracemalloc
+from pathlib import Path
+
+from backend.core.game_engine import EMPTY_CODE, GameEngine, CellType, LightBeam
+from benchmarks.boards import make_level
+from benchmarks.results_log import RESULTS_DIR, git_commit, save_result
+
+DEFAULT_OUT = RESULTS_DIR / "engine_micro.jsonl"
+
+CASCADE_PIECES = [CellType.SPLITTER, CellType.PRISM]
+
+
+def make_engine(size: int, density: float, seed: int = 0) -> GameEngine:
+    """빈 셀마다 `density` 확률로 분할기나 프리즘을 놓은 보드의 엔진"""
+    engine = GameEngine()
+    engine.track_changes = False
+    engine.start_new_game(make_level(size, seed=seed))
+    rng = random.Random(seed)
+    grid = engine.current_state.grid
+    for y in range(size):
+        for x in range(1, size - 1):
+            if grid.cells[y * size + x] == EMPTY_CODE and rng.random() < density:
+                grid.set(x, y, rng.choice(CASCADE_PIECES))
+    engine._reset_path_cache()
+    engine.calculate_light_paths()
+    return engine
+
+
+def operations(engine: GameEngine) -> Dict[str, Callable[[], object]]:
+    """측정할 호출 (캐시 없이 매번 전부 다시 계산)"""
+    emitter = engine.current_state.emitters[0]
+    coverage = engine._target_coverage()
+
+    def trace_beam():
+        beam = LightBeam(x=emitter.x, y=emitter.y, direction=emitter.direction, color=emitter.color)
+        return engine._trace_beam(beam, {})
+
+    def light_paths():
+        engine._reset_path_cache()
+        return engine.calculate_light_paths()
+
+    return {
+        "_trace_beam": trace_beam,
+        "calculate_light_paths": light_paths,
+        "_check_targets_hit": lambda: engine._check_targets_hit(coverage),
+        "GameState.dict": lambda: engine.get_current_state().dict()
+    }
+
+
+def ops_per_second(func: Callable[[], object], min_time: float) -> float:
+    """`min_time`초 이상 반복 호출한 초당 호출 수 (반복 횟수는 두 배씩 늘림)"""
+    func()
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls / elapsed
+        calls *= 2
+
+
+def allocation_per_call(func: Callable[[], object], calls: int) -> Dict[str, float]:
+    """호출당 최대 할당 바이트와 호출 후 남는 바이트 (반환값 포함, tracemalloc)"""
+    peak = retained = 0
+    tracemalloc.start()
+    try:
+        for _ in range(calls):
+            tracemalloc.reset_peak()
+            before, _ = tracemalloc.get_traced_memory()
+            result = func()
+            after, high = tracemalloc.get_traced_memory()
+            peak += high - before
+            retained += after - before
+            del result
+    finally:
+        tracemalloc.stop()
+    return {"peak_kb": peak / calls / 1024, "retained_kb": retained / calls / 1024}
+
+
+def measure(size: int, density: float, min_time: float = 0.2, alloc_calls: int = 3,
+            seed: int = 0) -> List[dict]:
+    """한 보드에서 연산별 초당 호출 수와 호출당 할당량"""
+    engine = make_engine(size, density, seed)
+    segments = len(engine.calculate_light_paths())
+    results = []
+    for name, func in operations(engine).items():
+        results.append({
+            "size": size,
+            "density": density,
+            "segments": segments,
+            "op": name,
+            "ops_per_s": ops_per_second(func, min_time),
+            **allocation_per_call(func, alloc_calls)
+        })
+    return results
+
+
+def report(results: List[dict], previous: Optional[dict]):
+    old = {(r["size"], r["density"], r["op"]): r for r in (previous or {}).get("results", [])}
+    print(f"{'size':>5} {'density':>7} {'segments':>8} {'op':>22} {'ops/s':>11} "
+          f"{'µs/op':>10} {'peak KB':>9} {'kept KB':>9} {'Δops/s':>7}")
+    for result in results:
+        change = ""
+        before = old.get((result["size"], result["density"], result["op"]))
+        if before:
+            change = f" {(result['ops_per_s'] / before['ops_per_s'] - 1) * 100:>+6.0f}%"
+        print(f"{result['size']:>5} {result['density']:>7.2f} {result['segments']:>8} "
+              f"{result['op']:>22} {result['ops_per_s']:>11.1f} "
+              f"{1e6 / result['ops_per_s']:>10.1f} {result['peak_kb']:>9.1f} "
+              f"{result['retained_kb']:>9.1f}{change}")
+    if previous:
+        print(f"compared with {previous.get('commit') or 'previous run'} ({previous.get('time')})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엔진 핫 패스 마이크로 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--densities", type=float, nargs="+", default=[0, 0.05, 0.2, 1])
+    parser.add_argument("--min-time", type=float, default=0.2, help="연산별 최소 측정 시간(초)")
+    parser.add_argument("--alloc-calls", type=int, default=3, help="할당량을 잴 호출 수")
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="결과를 추가할 JSON Lines 파일")
+    args = parser.parse_args()
+
+    results = [result for size in args.sizes for density in args.densities
+               for result in measure(size, density, args.min_time, args.alloc_calls)]
+    previous = save_result(args.out, {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "config": {"sizes": args.sizes, "densities": args.densities,
+                   "min_time": args.min_time, "alloc_calls": args.alloc_calls},
+        "results": results
+    })
+    report(results, previous)
+    print(f"results appended to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
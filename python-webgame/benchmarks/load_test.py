@@ -0,0 +1,260 @@
+"""
+Load test - 동시 플레이어로 API를 구동하고 엔드포인트별 지연 시간과 처리량 측정
+
+    python -m benchmarks.load_test --players 50 --moves 20
+    python -m benchmarks.load_test --target uvicorn --workers 4
+    python -m benchmarks.load_test --url http://localhost:8000
+
+결과는 --out 파일(JSON Lines)에 커밋 해시와 함께 추가되며, 같은 설정의
+이전 결과가 있으면 p95와 초당 요청 수 변화를 함께 출력합니다.
+"""
+from typing import Dict, List, Optional, Tuple
+import argparse
+import asyncio
+import math
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from benchmarks.results_log import RESULTS_DIR, git_commit, save_result
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+DEFAULT_OUT = RESULTS_DIR / "load_test.jsonl"
+ENDPOINTS = ("start", "action", "hint")
+
+
+def _data_env() -> Dict[str, str]:
+    """측정 중 생기는 세션, 진행상황, 리플레이 파일은 임시 디렉터리에 기록"""
+    data_dir = tempfile.mkdtemp(prefix="mirror-maze-load-")
+    return {
+        "MIRROR_MAZE_DB": os.path.join(data_dir, "mirror_maze.db"),
+        "MIRROR_MAZE_CUSTOM_LEVELS": os.path.join(data_dir, "custom_levels"),
+        "MIRROR_MAZE_REPLAYS": os.path.join(data_dir, "replays"),
+        "MIRROR_MAZE_SESSION_DB": os.path.join(data_dir, "sessions.db"),
+    }
+
+
+def _solutions(level_ids: List[int]) -> Dict[int, List[Tuple[int, int, str]]]:
+    """레벨별 최소 풀이 (플레이어가 놓고 치울 조각 목록)"""
+    from backend.core.level_manager import LevelManager
+    from backend.core.solver import solve_level
+
+    levels = LevelManager()
+    return {level_id: solve_level(levels.get_level(level_id)).solution.placements
+            for level_id in level_ids}
+
+
+class Recorder:
+    """엔드포인트별 요청 지연 시간 기록"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {name: [] for name in ENDPOINTS}
+        self.errors: Dict[str, int] = {name: 0 for name in ENDPOINTS}
+
+    async def request(self, name: str, client: httpx.AsyncClient, method: str, url: str,
+                      **kwargs) -> Optional[dict]:
+        start = time.perf_counter()
+        data = None
+        try:
+            response = await client.request(method, url, **kwargs)
+            if response.status_code == 200:
+                data = response.json()
+        except (httpx.HTTPError, ValueError):  # 연결 오류, JSON이 아닌 응답
+            pass
+        self.latencies[name].append(time.perf_counter() - start)
+        if not isinstance(data, dict) or not data.get("success", True):
+            self.errors[name] += 1
+            return None
+        return data
+
+
+async def _player(client: httpx.AsyncClient, recorder: Recorder, rng: random.Random,
+                  solutions: Dict[int, List[Tuple[int, int, str]]], moves: int,
+                  hint_every: int, full: bool):
+    """레벨을 시작하고 풀이 조각을 모두 놓았다가 다시 치우기를 반복하는 플레이어"""
+    level_id = rng.choice(sorted(solutions))
+    started = await recorder.request("start", client, "POST", f"/api/game/start/{level_id}")
+    if started is None:
+        return
+    headers = {"X-Session-ID": started["session_id"]}
+    version = started["version"]
+
+    placements = solutions[level_id]
+    cycle = [{"action": "place", "x": x, "y": y, "piece_type": piece_type}
+             for x, y, piece_type in placements]
+    cycle += [{"action": "remove", "x": x, "y": y} for x, y, _ in placements]
+    for i in range(moves):
+        if hint_every and i % hint_every == hint_every - 1:
+            await recorder.request("hint", client, "GET", f"/api/game/hint/{level_id}",
+                                   headers=headers)
+        body = dict(cycle[i % len(cycle)], since_version=version, full=full)
+        result = await recorder.request("action", client, "POST", "/api/game/action",
+                                        json=body, headers=headers)
+        if result is not None:
+            version = result["version"]
+
+
+async def _drive(client: httpx.AsyncClient, args,
+                 solutions: Dict[int, List[Tuple[int, int, str]]]) -> Tuple[Recorder, float]:
+    recorder = Recorder()
+    semaphore = asyncio.Semaphore(args.concurrency)
+
+    async def run(index: int):
+        async with semaphore:
+            await _player(client, recorder, random.Random(args.seed + index), solutions,
+                          args.moves, args.hint_every, args.full)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(run(i) for i in range(args.players)))
+    return recorder, time.perf_counter() - start
+
+
+def percentile(values: List[float], q: float) -> float:
+    """정렬된 값의 백분위수 (nearest-rank)"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, math.ceil(q / 100 * len(values)) - 1))
+    return values[index]
+
+
+def summarize(recorder: Recorder, duration: float) -> Dict[str, dict]:
+    """엔드포인트별 p50/p95/p99(ms)와 초당 요청 수"""
+    summary = {}
+    for name, latencies in recorder.latencies.items():
+        if not latencies:
+            continue
+        latencies = sorted(latencies)
+        summary[name] = {
+            "requests": len(latencies),
+            "errors": recorder.errors[name],
+            "rps": len(latencies) / duration,
+            "p50_ms": percentile(latencies, 50) * 1000,
+            "p95_ms": percentile(latencies, 95) * 1000,
+            "p99_ms": percentile(latencies, 99) * 1000,
+        }
+    total = sum(len(latencies) for latencies in recorder.latencies.values())
+    summary["total"] = {"requests": total, "rps": total / duration, "duration_s": duration}
+    return summary
+
+
+async def run_asgi(args, solutions) -> Tuple[Recorder, float]:
+    """같은 프로세스의 앱을 ASGI로 직접 호출 (네트워크와 서버 오버헤드 제외)"""
+    from backend.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://load-test") as client:
+        return await _drive(client, args, solutions)
+
+
+async def run_http(url: str, args, solutions) -> Tuple[Recorder, float]:
+    limits = httpx.Limits(max_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30) as client:
+        return await _drive(client, args, solutions)
+
+
+def start_uvicorn(port: int, workers: int, env: Dict[str, str]) -> subprocess.Popen:
+    """로컬 uvicorn 서버 실행 후 /health가 응답할 때까지 대기"""
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "backend.main:app", "--host", "127.0.0.1",
+         "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=BASE_DIR, env={**os.environ, **env}
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("uvicorn exited (is uvicorn installed?)")
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=1).status_code == 200:
+                return process
+        except httpx.HTTPError:
+            pass
+        time.sleep(0.2)
+    process.terminate()
+    raise RuntimeError("uvicorn did not start within 30s")
+
+
+def report(summary: Dict[str, dict], previous: Optional[dict]):
+    print(f"{'endpoint':>8} {'requests':>9} {'errors':>7} {'rps':>9} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'Δp95':>7} {'Δrps':>7}")
+    for name in ENDPOINTS:
+        stats = summary.get(name)
+        if stats is None:
+            continue
+        change = ""
+        old = (previous or {}).get("results", {}).get(name)
+        if old:
+            change = (f" {(stats['p95_ms'] / old['p95_ms'] - 1) * 100:>+6.0f}%"
+                      f" {(stats['rps'] / old['rps'] - 1) * 100:>+6.0f}%")
+        print(f"{name:>8} {stats['requests']:>9} {stats['errors']:>7} {stats['rps']:>9.1f} "
+              f"{stats['p50_ms']:>8.2f} {stats['p95_ms']:>8.2f} {stats['p99_ms']:>8.2f}{change}")
+    total = summary["total"]
+    print(f"total {total['requests']} requests in {total['duration_s']:.2f}s "
+          f"({total['rps']:.1f} req/s)")
+    if previous:
+        print(f"compared with {previous.get('commit') or 'previous run'} ({previous.get('time')})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mirror Maze API 부하 테스트")
+    parser.add_argument("--target", choices=["asgi", "uvicorn"], default="asgi",
+                        help="asgi: 같은 프로세스에서 직접 호출, uvicorn: 로컬 서버 실행")
+    parser.add_argument("--url", help="이미 실행 중인 서버 주소 (--target 무시)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn 워커 수")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--players", type=int, default=50, help="시뮬레이션할 플레이어 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시에 플레이하는 최대 플레이어 수")
+    parser.add_argument("--moves", type=int, default=20, help="플레이어당 액션 수")
+    parser.add_argument("--hint-every", type=int, default=10, help="이 액션 수마다 힌트 요청 (0이면 없음)")
+    parser.add_argument("--full", action="store_true", help="델타 대신 전체 상태 응답 요청")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 3, 4])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", type=Path, default=DEFAULT_OUT, help="결과를 추가할 JSON Lines 파일")
+    args = parser.parse_args()
+
+    env = _data_env()
+    if args.workers > 1:
+        env["MIRROR_MAZE_SESSION_STORE"] = "sqlite"
+    for key, value in env.items():
+        os.environ.setdefault(key, value)
+    solutions = _solutions(args.levels)
+
+    target = "url" if args.url else args.target
+    server = None
+    try:
+        if args.url:
+            recorder, duration = asyncio.run(run_http(args.url, args, solutions))
+        elif args.target == "uvicorn":
+            server = start_uvicorn(args.port, args.workers, env)
+            recorder, duration = asyncio.run(
+                run_http(f"http://127.0.0.1:{args.port}", args, solutions))
+        else:
+            recorder, duration = asyncio.run(run_asgi(args, solutions))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    summary = summarize(recorder, duration)
+    config = {
+        "target": target, "workers": args.workers if target == "uvicorn" else 1,
+        "players": args.players, "concurrency": args.concurrency, "moves": args.moves,
+        "hint_every": args.hint_every, "full": args.full, "levels": args.levels,
+    }
+    previous = save_result(args.out, {
+        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": git_commit(),
+        "config": config,
+        "results": summary
+    })
+    report(summary, previous)
+    print(f"results appended to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
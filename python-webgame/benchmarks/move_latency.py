@@ -0,0 +1,66 @@
+"""
+Move latency benchmark - 보드 크기별 이동 지연 시간 측정
+
+    python -m benchmarks.move_latency --sizes 10 100 500 1000
+"""
+import argparse
+import random
+import time
+
+from backend.core.game_engine import GameEngine
+from benchmarks.boards import make_level
+
+
+def measure(size: int, moves: int, seed: int = 0) -> dict:
+    """빔 위의 셀에 거울을 놓고 치우는 이동의 평균 지연 시간(ms)"""
+    engine = GameEngine()
+    engine.start_new_game(make_level(size, seed=seed))
+    engine.calculate_light_paths()
+    rng = random.Random(seed)
+
+    move_times = []
+    placed = None
+    for _ in range(moves):
+        if placed:
+            action, (x, y), placed = ("remove", placed, None)
+        else:
+            path = rng.choice(engine.calculate_light_paths())["path"]
+            x, y = rng.choice(path)
+            action, placed = "place", (x, y)
+
+        start = time.perf_counter()
+        ok = engine.perform_action(action, x, y, "mirror_left")
+        engine.calculate_light_paths()
+        engine.check_victory()
+        move_times.append(time.perf_counter() - start)
+        if not ok:
+            placed = None
+
+    start = time.perf_counter()
+    engine.get_current_state().dict()
+    dict_time = time.perf_counter() - start
+
+    move_times.sort()
+    return {
+        "size": size,
+        "mean_ms": sum(move_times) / len(move_times) * 1000,
+        "p95_ms": move_times[int(len(move_times) * 0.95) - 1] * 1000,
+        "state_dict_ms": dict_time * 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="보드 크기별 이동 지연 시간 측정")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 1000])
+    parser.add_argument("--moves", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'size':>6} {'mean ms':>10} {'p95 ms':>10} {'dict() ms':>10}")
+    for size in args.sizes:
+        result = measure(size, args.moves)
+        print(f"{result['size']:>6} {result['mean_ms']:>10.3f} "
+              f"{result['p95_ms']:>10.3f} {result['state_dict_ms']:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""
+Results log - 벤치마크 결과를 JSON Lines 파일에 커밋 해시와 함께 추가
+"""
+from typing import Optional
+import json
+import subprocess
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def git_commit() -> Optional[str]:
+    """현재 커밋 해시 (git 저장소가 아니면 None)"""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_result(path: Path, record: dict) -> Optional[dict]:
+    """결과를 JSON Lines 파일에 추가하고 같은 설정의 직전 결과 반환"""
+    previous = None
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if entry.get("config") == record["config"]:
+                    previous = entry
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+    return previous
@@ -11,10 +11,27 @@ class MirrorMazeGame {
         this.currentAction = 'place'; // place, rotate, remove
         this.moves = 0;
         this.lightPaths = [];
+        this.version = null;
         this.availablePieces = {};
         this.soundEnabled = true;
+        this.sessionId = sessionStorage.getItem('mirrorMazeSession');
+        this.playerId = localStorage.getItem('mirrorMazePlayer');
+        if (!this.playerId) {
+            this.playerId = Math.random().toString(36).slice(2) + Date.now().toString(36);
+            localStorage.setItem('mirrorMazePlayer', this.playerId);
+        }
         
         this.apiUrl = 'http://localhost:8000/api';
+        this.wsUrl = 'ws://localhost:8000/ws/game';
+        this.socket = null;
+    }
+    
+    apiHeaders(extra = {}) {
+        const headers = {...extra};
+        if (this.sessionId) {
+            headers['X-Session-ID'] = this.sessionId;
+        }
+        return headers;
     }
     
     async init() {
@@ -24,8 +41,18 @@ class MirrorMazeGame {
     
     async loadLevels() {
         try {
-            const response = await fetch(`${this.apiUrl}/levels`);
-            this.levels = await response.json();
+            // 커서 기반 페이지를 끝까지 이어서 로드
+            const levels = [];
+            let cursor = null;
+            do {
+                const params = new URLSearchParams({limit: 100});
+                if (cursor !== null) params.set('cursor', cursor);
+                const response = await fetch(`${this.apiUrl}/levels?${params}`);
+                const page = await response.json();
+                levels.push(...page.levels);
+                cursor = page.next_cursor;
+            } while (cursor !== null);
+            this.levels = levels;
             this.renderLevelSelect();
         } catch (error) {
             console.error('Failed to load levels:', error);
@@ -80,12 +107,17 @@ class MirrorMazeGame {
     async startLevel(levelId) {
         try {
             const response = await fetch(`${this.apiUrl}/game/start/${levelId}`, {
-                method: 'POST'
+                method: 'POST',
+                headers: this.apiHeaders()
             });
             const data = await response.json();
             
+            this.sessionId = data.session_id;
+            sessionStorage.setItem('mirrorMazeSession', this.sessionId);
             this.levelId = levelId;
             this.gameState = data.game_state;
+            this.version = data.version;
+            this.lightPaths = [];
             this.moves = 0;
             
             // 레벨 데이터 로드
@@ -93,6 +125,7 @@ class MirrorMazeGame {
             this.currentLevel = await levelResponse.json();
             
             this.availablePieces = {...this.currentLevel.available_pieces};
+            this.connectSocket();
             
             // UI 전환
             this.switchScreen('game-screen');
@@ -221,7 +254,13 @@ class MirrorMazeGame {
         
         // 키보드 단축키
         document.addEventListener('keydown', (e) => {
-            if (e.key === 'r' || e.key === 'R') {
+            if ((e.ctrlKey || e.metaKey) && (e.key === 'z' || e.key === 'Z')) {
+                e.preventDefault();
+                this.stepHistory(e.shiftKey ? 'redo' : 'undo');
+            } else if ((e.ctrlKey || e.metaKey) && (e.key === 'y' || e.key === 'Y')) {
+                e.preventDefault();
+                this.stepHistory('redo');
+            } else if (e.key === 'r' || e.key === 'R') {
                 this.currentAction = 'rotate';
                 this.updateActionButtons();
             } else if (e.key === 'Delete' || e.key === 'Backspace') {
@@ -255,42 +294,43 @@ class MirrorMazeGame {
     async handleCanvasClick(event) {
         const canvas = document.getElementById('game-canvas');
         const rect = canvas.getBoundingClientRect();
-        const x = Math.floor((event.clientX - rect.left) / 50);
-        const y = Math.floor((event.clientY - rect.top) / 50);
+        const cellSize = window.renderer ? window.renderer.cellSize : 50;
+        const gridSize = window.renderer ? window.renderer.gridSize : 10;
+        const x = Math.floor((event.clientX - rect.left) / cellSize);
+        const y = Math.floor((event.clientY - rect.top) / cellSize);
+        
+        if (x < 0 || x >= gridSize || y < 0 || y >= gridSize) return;
         
-        if (x < 0 || x >= 10 || y < 0 || y >= 10) return;
+        // 웹소켓이 열려 있으면 액션만 보내고 결과는 onSocketMessage에서 처리
+        if (this.socket && this.socket.readyState === WebSocket.OPEN) {
+            this.socket.send(JSON.stringify({
+                action: this.currentAction,
+                x: x,
+                y: y,
+                piece_type: this.selectedTool
+            }));
+            return;
+        }
         
         try {
             const response = await fetch(`${this.apiUrl}/game/action`, {
                 method: 'POST',
-                headers: {
+                headers: this.apiHeaders({
                     'Content-Type': 'application/json'
-                },
+                }),
                 body: JSON.stringify({
                     action: this.currentAction,
                     x: x,
                     y: y,
-                    piece_type: this.selectedTool
+                    piece_type: this.selectedTool,
+                    since_version: this.version
                 })
             });
             
             const data = await response.json();
             
             if (data.success) {
-                this.gameState = data.game_state;
-                this.lightPaths = data.light_paths;
-                this.moves = data.moves;
-                
-                // 도구 카운트 업데이트
-                if (this.currentAction === 'place' && this.selectedTool) {
-                    this.availablePieces[this.selectedTool]--;
-                } else if (this.currentAction === 'remove') {
-                    // 제거된 조각 복구
-                    const removedPiece = data.removed_piece;
-                    if (removedPiece && this.availablePieces[removedPiece] !== undefined) {
-                        this.availablePieces[removedPiece]++;
-                    }
-                }
+                this.applyActionResult(data);
                 
                 this.updateUI();
                 this.updateTools();
@@ -310,12 +350,72 @@ class MirrorMazeGame {
         }
     }
     
+    connectSocket() {
+        if (this.socket) {
+            this.socket.close();
+        }
+        const socket = new WebSocket(`${this.wsUrl}?session_id=${encodeURIComponent(this.sessionId)}`);
+        socket.addEventListener('message', (e) => this.onSocketMessage(JSON.parse(e.data)));
+        socket.addEventListener('close', () => {
+            if (this.socket === socket) this.socket = null;
+        });
+        this.socket = socket;
+    }
+    
+    onSocketMessage(data) {
+        if (data.type === 'error') {
+            console.error('Game socket error:', data.error);
+            return;
+        }
+        
+        this.applyActionResult(data);
+        this.updateUI();
+        this.updateTools();
+        this.render();
+        
+        if (data.type === 'update') {
+            if (data.is_complete) {
+                this.showVictory(data.stars);
+            }
+            if (this.soundEnabled && data.applied > 0) {
+                this.playSound('place');
+            }
+        }
+    }
+    
+    applyActionResult(data) {
+        // 델타 응답이면 바뀐 셀, 빔 구간, 타겟만 반영
+        if (data.delta) {
+            const delta = data.delta;
+            delta.cells.forEach(({x, y, cell}) => {
+                this.gameState.grid[y][x] = cell;
+            });
+            delta.targets.forEach(({index, is_hit}) => {
+                this.gameState.targets[index].is_hit = is_hit;
+            });
+            const removed = new Set(delta.paths_removed);
+            this.lightPaths = this.lightPaths
+                .filter(path => !removed.has(path.id))
+                .concat(delta.paths_added);
+        } else {
+            this.gameState = data.game_state;
+            this.lightPaths = data.light_paths;
+        }
+        this.version = data.version;
+        this.moves = data.moves;
+        // 도구 카운트는 서버 값으로 갱신
+        if (data.available_pieces) {
+            this.availablePieces = {...data.available_pieces};
+        }
+    }
+    
     handleCanvasHover(event) {
         // 호버 효과 구현
         const canvas = document.getElementById('game-canvas');
         const rect = canvas.getBoundingClientRect();
-        const x = Math.floor((event.clientX - rect.left) / 50);
-        const y = Math.floor((event.clientY - rect.top) / 50);
+        const cellSize = window.renderer ? window.renderer.cellSize : 50;
+        const x = Math.floor((event.clientX - rect.left) / cellSize);
+        const y = Math.floor((event.clientY - rect.top) / cellSize);
         
         // 호버 위치를 렌더러에 전달
         if (window.renderer) {
@@ -328,18 +428,20 @@ class MirrorMazeGame {
         // 빛 경로 계산 및 확인
         const response = await fetch(`${this.apiUrl}/game/action`, {
             method: 'POST',
-            headers: {
+            headers: this.apiHeaders({
                 'Content-Type': 'application/json'
-            },
+            }),
             body: JSON.stringify({
                 action: 'check',
                 x: 0,
-                y: 0
+                y: 0,
+                since_version: this.version
             })
         });
         
         const data = await response.json();
-        this.lightPaths = data.light_paths;
+        if (!data.success) return;
+        this.applyActionResult(data);
         this.render();
         
         if (data.is_complete) {
@@ -347,13 +449,35 @@ class MirrorMazeGame {
         }
     }
     
+    async stepHistory(direction) {
+        // 되돌리기/다시 실행 (서버가 캐시한 빛 경로를 델타로 받음)
+        try {
+            const params = this.version !== null ? `?since_version=${this.version}` : '';
+            const response = await fetch(`${this.apiUrl}/game/${direction}${params}`, {
+                method: 'POST',
+                headers: this.apiHeaders()
+            });
+            const data = await response.json();
+            if (!data.success) return;
+            
+            this.applyActionResult(data);
+            this.updateUI();
+            this.updateTools();
+            this.render();
+        } catch (error) {
+            console.error(`Failed to ${direction}:`, error);
+        }
+    }
+    
     async resetLevel() {
         await this.startLevel(this.levelId);
     }
     
     async showHint() {
         try {
-            const response = await fetch(`${this.apiUrl}/game/hint/${this.levelId}`);
+            const response = await fetch(`${this.apiUrl}/game/hint/${this.levelId}`, {
+                headers: this.apiHeaders()
+            });
             const data = await response.json();
             
             const hintDisplay = document.getElementById('hint-display');
@@ -377,6 +501,18 @@ class MirrorMazeGame {
             moves: this.moves
         };
         localStorage.setItem('mirrorMazeProgress', JSON.stringify(progress));
+        fetch(`${this.apiUrl}/progress/save`, {
+            method: 'POST',
+            headers: this.apiHeaders({'Content-Type': 'application/json'}),
+            body: JSON.stringify({
+                session_id: this.sessionId,
+                player_id: this.playerId,
+                level_id: this.levelId,
+                moves: this.moves,
+                stars: stars,
+                completed: true
+            })
+        }).catch(error => console.error('Failed to save progress:', error));
         
         // 승리 화면 표시
         document.getElementById('victory-screen').classList.add('active');
@@ -18,6 +18,12 @@ class GameRenderer {
     updateGameState(gameState, lightPaths) {
         this.gameState = gameState;
         this.lightPaths = lightPaths || [];
+        
+        // 레벨별 보드 크기에 맞춰 셀 크기 조정
+        if (gameState && gameState.grid && gameState.grid.length !== this.gridSize) {
+            this.gridSize = gameState.grid.length;
+            this.cellSize = this.canvas.width / this.gridSize;
+        }
     }
     
     setHoverPosition(x, y) {
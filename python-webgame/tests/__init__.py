@@ -0,0 +1,3 @@
+"""
+Mirror Maze 테스트 패키지
+"""
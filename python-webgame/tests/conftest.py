@@ -0,0 +1,53 @@
+"""
+테스트 공통 설정
+"""
+import os
+import tempfile
+
+import pytest
+
+# 테스트 중 진행상황 DB, 커스텀 레벨, 리플레이 로그는 임시 디렉터리에 생성
+DATA_DIR = tempfile.mkdtemp()
+os.environ.setdefault("MIRROR_MAZE_DB", os.path.join(DATA_DIR, "mirror_maze.db"))
+os.environ.setdefault("MIRROR_MAZE_CUSTOM_LEVELS", os.path.join(DATA_DIR, "custom_levels"))
+os.environ.setdefault("MIRROR_MAZE_REPLAYS", os.path.join(DATA_DIR, "replays"))
+
+
+@pytest.fixture
+def play_level():
+    """최단 풀이대로 레벨을 실제로 플레이하고 마지막 액션 응답을 반환하는 함수
+
+    detour=True이면 첫 조각을 놓았다 치우는 두 수를 더합니다.
+    """
+    from backend.core.level_manager import LevelManager
+    from backend.core.solver import solve_level
+
+    def play(client, level_id: int, detour: bool = False) -> dict:
+        session_id = client.post(f"/api/game/start/{level_id}").json()["session_id"]
+        headers = {"X-Session-ID": session_id}
+        placements = solve_level(LevelManager().get_level(level_id)).solution.placements
+        actions = [{"action": "place", "x": x, "y": y, "piece_type": p} for x, y, p in placements]
+        if detour:
+            actions[:0] = [actions[0], {"action": "remove", "x": actions[0]["x"], "y": actions[0]["y"]}]
+        for action in actions:
+            result = client.post("/api/game/action", json=action, headers=headers).json()
+        return dict(result, session_id=session_id)
+
+    return play
+
+
+@pytest.fixture(scope="session")
+def level_report():
+    """내장 레벨 검증 결과를 반환하는 함수 (레벨마다 한 번만 풀이)"""
+    from backend.core.level_manager import LevelManager
+    from backend.core.solver import validate_level
+
+    manager = LevelManager()
+    reports = {}
+
+    def report(level_id: int) -> dict:
+        if level_id not in reports:
+            reports[level_id] = validate_level(manager.get_level(level_id))
+        return reports[level_id]
+
+    return report
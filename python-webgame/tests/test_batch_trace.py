@@ -0,0 +1,73 @@
+"""
+일괄 추적 테스트
+"""
+import random
+
+import numpy as np
+import pytest
+
+from backend.core.batch_trace import BatchTracer
+from backend.core.game_engine import GameEngine, CellType
+from backend.core.level_manager import LevelManager
+from backend.core.solver import solve_level
+
+LEVELS = LevelManager()
+PIECES = [cell.value for cell in CellType if cell not in (CellType.EMPTY, CellType.WALL)]
+
+
+def random_placements(level, count, seed):
+    """빈 셀에 무작위 조각을 놓은 배치 목록"""
+    rng = random.Random(seed)
+    size = level["grid_size"]
+    blocked = {(w["x"], w["y"]) for w in level["walls"]}
+    placements = []
+    for _ in range(count):
+        placed = {}
+        for _ in range(rng.randint(0, 8)):
+            cell = (rng.randrange(size), rng.randrange(size))
+            if cell not in blocked:
+                placed[cell] = rng.choice(PIECES)
+        placements.append(placed)
+    return placements
+
+
+def engine_hits(level, placed):
+    """GameEngine으로 계산한 타겟 히트 여부"""
+    engine = GameEngine()
+    engine.start_new_game(level)
+    for (x, y), piece_type in placed.items():
+        engine.current_state.grid.set(x, y, CellType(piece_type))
+    engine.calculate_light_paths()
+    return [target.is_hit for target in engine.current_state.targets]
+
+
+class TestBatchTracer:
+    """일괄 추적 테스트 클래스"""
+
+    @pytest.mark.parametrize("level_id", sorted(LEVELS.get_level_ids()))
+    def test_matches_engine(self, level_id):
+        """엔진과 같은 타겟 히트 결과 테스트"""
+        level = LEVELS.get_level(level_id)
+        tracer = BatchTracer(level)
+        placements = random_placements(level, 100, level_id)
+        hits = tracer.trace(tracer.stack(placements))
+        assert hits.shape == (100, len(level["targets"]))
+        for placed, row in zip(placements, hits):
+            assert row.tolist() == engine_hits(level, placed)
+
+    def test_solution_is_solved(self):
+        """풀이 배치만 완료로 판정되는지 테스트"""
+        level = LEVELS.get_level(4)
+        solution = solve_level(level).solution
+        placed = {(x, y): piece_type for x, y, piece_type in solution.placements}
+        tracer = BatchTracer(level)
+        solved = tracer.solved(tracer.stack([{}, placed]))
+        assert solved.tolist() == [False, True]
+
+    def test_chunked_trace(self):
+        """보드를 나눠 추적해도 결과가 같은지 테스트"""
+        level = LEVELS.get_level(5)
+        placements = random_placements(level, 50, 0)
+        whole = BatchTracer(level).trace(BatchTracer(level).stack(placements))
+        chunked = BatchTracer(level, max_states=4 * 100 * 7)
+        assert np.array_equal(chunked.trace(chunked.stack(placements)), whole)
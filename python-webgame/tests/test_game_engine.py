@@ -0,0 +1,533 @@
+"""
+게임 엔진 테스트
+"""
+import pytest
+
+from backend.core.game_engine import (
+    GameEngine, CellType, BeamColor, Direction, PATH_SNAPSHOTS, TRANSITIONS
+)
+from backend.core.level_manager import LevelManager
+from backend.core.trace_cache import TraceCache
+
+
+def make_level(**overrides):
+    """테스트용 레벨 데이터"""
+    level = {
+        "id": 100,
+        "grid_size": 10,
+        "min_moves": 1,
+        "walls": [],
+        "emitters": [
+            {"x": 0, "y": 2, "direction": "RIGHT", "color": "WHITE"},
+            {"x": 0, "y": 7, "direction": "RIGHT", "color": "WHITE"}
+        ],
+        "targets": [
+            {"x": 9, "y": 2, "required_color": "WHITE"},
+            {"x": 5, "y": 0, "required_color": "WHITE"}
+        ],
+        "available_pieces": {"mirror_left": 2, "mirror_right": 2, "splitter": 1}
+    }
+    level.update(overrides)
+    return level
+
+
+def full_trace(engine):
+    """캐시 없이 전체 경로를 다시 계산"""
+    engine._reset_path_cache()
+    return engine.calculate_light_paths()
+
+
+class TestLightPaths:
+    """빛 경로 계산 테스트 클래스"""
+
+    @pytest.fixture
+    def engine(self):
+        engine = GameEngine()
+        engine.start_new_game(make_level())
+        return engine
+
+    def test_straight_beam_hits_target(self, engine):
+        """직선 빔 타겟 히트 테스트"""
+        engine.calculate_light_paths()
+        assert engine.current_state.targets[0].is_hit
+        assert not engine.current_state.targets[1].is_hit
+
+    def test_mirror_redirects_beam(self, engine):
+        """거울 반사 테스트"""
+        assert engine.perform_action("place", 5, 2, "mirror_right")
+        engine.calculate_light_paths()
+        assert not engine.current_state.targets[0].is_hit
+        assert engine.current_state.targets[1].is_hit
+
+    def test_only_affected_emitters_are_retraced(self, engine):
+        """변경된 셀을 지나는 빔만 재추적하는지 테스트"""
+        engine.calculate_light_paths()
+        traced = []
+        original = engine._trace_beam
+
+        def counting_trace(beam, *args, **kwargs):
+            traced.append((beam.x, beam.y))
+            return original(beam, *args, **kwargs)
+
+        engine._trace_beam = counting_trace
+        engine.perform_action("place", 4, 7, "mirror_left")
+        engine.calculate_light_paths()
+        assert traced == [(0, 7)]
+
+        traced.clear()
+        engine.perform_action("place", 4, 4, "mirror_left")
+        engine.calculate_light_paths()
+        assert traced == []
+
+    def test_incremental_matches_full_trace(self, engine):
+        """증분 계산과 전체 계산 결과 일치 테스트"""
+        actions = [
+            ("place", 5, 2, "mirror_right"),
+            ("place", 3, 7, "splitter"),
+            ("rotate", 5, 2, None),
+            ("remove", 3, 7, None),
+            ("place", 6, 7, "mirror_left"),
+        ]
+        for action, x, y, piece in actions:
+            engine.perform_action(action, x, y, piece)
+            incremental = engine.calculate_light_paths()
+            hits = [t.is_hit for t in engine.current_state.targets]
+            assert incremental == full_trace(engine)
+            assert hits == [t.is_hit for t in engine.current_state.targets]
+
+    def test_lit_cells_skip_inactive_emitters(self, engine):
+        """빛이 지나는 셀에 비활성 발광기 경로 제외 테스트"""
+        engine.calculate_light_paths()
+        assert 2 * 10 + 5 in engine.lit_cells() and 7 * 10 + 5 in engine.lit_cells()
+        engine.current_state.emitters[1].active = False
+        assert 7 * 10 + 5 not in engine.lit_cells()
+
+    def test_prism_splits_white_light(self):
+        """프리즘 색 분리 테스트"""
+        engine = GameEngine()
+        engine.start_new_game(make_level(
+            emitters=[{"x": 0, "y": 4, "direction": "RIGHT", "color": "WHITE"}],
+            targets=[
+                {"x": 3, "y": 0, "required_color": "RED"},
+                {"x": 9, "y": 4, "required_color": "GREEN"},
+                {"x": 3, "y": 9, "required_color": "BLUE"}
+            ],
+            available_pieces={"prism": 1}
+        ))
+        engine.perform_action("place", 3, 4, "prism")
+        engine.calculate_light_paths()
+        assert all(t.is_hit for t in engine.current_state.targets)
+
+    def test_filter_changes_beam_color(self):
+        """필터 통과 후 색상 변경 테스트"""
+        engine = GameEngine()
+        engine.start_new_game(make_level(
+            emitters=[{"x": 0, "y": 2, "direction": "RIGHT", "color": "WHITE"}],
+            targets=[
+                {"x": 2, "y": 2, "required_color": "WHITE"},
+                {"x": 8, "y": 2, "required_color": "RED"}
+            ],
+            available_pieces={"filter_red": 1}
+        ))
+        engine.perform_action("place", 5, 2, "filter_red")
+        paths = engine.calculate_light_paths()
+        assert [p["color"] for p in paths] == ["white", "red"]
+        assert all(t.is_hit for t in engine.current_state.targets)
+
+    def test_color_mixing_hits_target(self):
+        """빨강과 초록 빔이 만나 노랑 타겟 히트 테스트"""
+        engine = GameEngine()
+        engine.start_new_game(make_level(
+            emitters=[
+                {"x": 0, "y": 4, "direction": "RIGHT", "color": "RED"},
+                {"x": 6, "y": 9, "direction": "UP", "color": "GREEN"}
+            ],
+            targets=[
+                {"x": 6, "y": 4, "required_color": "YELLOW"},
+                {"x": 3, "y": 4, "required_color": "RED"},
+                {"x": 3, "y": 4, "required_color": "GREEN"}
+            ]
+        ))
+        engine.calculate_light_paths()
+        assert [t.is_hit for t in engine.current_state.targets] == [True, True, False]
+
+    def test_mirror_loop_terminates(self):
+        """거울 루프에서 추적 종료 테스트"""
+        engine = GameEngine()
+        engine.start_new_game(make_level(
+            emitters=[{"x": 0, "y": 2, "direction": "RIGHT", "color": "WHITE"}],
+            available_pieces={"mirror_left": 2, "mirror_right": 2, "splitter": 1}
+        ))
+        for x, y, piece in [(2, 2, "splitter"), (6, 2, "mirror_left"),
+                            (6, 6, "mirror_right"), (2, 6, "mirror_left")]:
+            engine.perform_action("place", x, y, piece)
+        paths = engine.calculate_light_paths()
+        assert sum(len(p["path"]) for p in paths) < 4 * 100
+
+    def test_splitter_cascade_is_bounded(self):
+        """분할기로 가득 찬 보드에서 작업량 상한 테스트"""
+        size = 10
+        engine = GameEngine()
+        engine.start_new_game(make_level(
+            emitters=[{"x": 0, "y": 0, "direction": "RIGHT", "color": "WHITE"}],
+            available_pieces={"splitter": size * size}
+        ))
+        for y in range(size):
+            for x in range(size):
+                if (x, y) != (0, 0):
+                    engine.perform_action("place", x, y, "splitter")
+        paths = engine.calculate_light_paths()
+        states = sum(len(p["path"]) for p in paths)
+        assert states <= 4 * size * size * len(BeamColor)
+
+
+class TestTransitions:
+    """전이 테이블 테스트 클래스"""
+
+    def test_table_covers_every_state(self):
+        """모든 (셀, 방향, 색상) 조합 포함 테스트"""
+        assert len(TRANSITIONS) == len(CellType) * len(Direction) * len(BeamColor)
+
+    def test_piece_rules(self):
+        """조각별 전이 규칙 테스트"""
+        white = BeamColor.WHITE
+        assert TRANSITIONS[(CellType.MIRROR_LEFT, Direction.RIGHT, white)] == [(Direction.DOWN, white)]
+        assert TRANSITIONS[(CellType.MIRROR_RIGHT, Direction.RIGHT, white)] == [(Direction.UP, white)]
+        assert TRANSITIONS[(CellType.WALL, Direction.UP, white)] == []
+        assert TRANSITIONS[(CellType.FILTER_RED, Direction.LEFT, white)] == [(Direction.LEFT, BeamColor.RED)]
+        assert TRANSITIONS[(CellType.FILTER_RED, Direction.LEFT, BeamColor.BLUE)] == []
+        assert TRANSITIONS[(CellType.PRISM, Direction.RIGHT, white)] == [
+            (Direction.UP, BeamColor.RED),
+            (Direction.RIGHT, BeamColor.GREEN),
+            (Direction.DOWN, BeamColor.BLUE),
+        ]
+
+
+class TestGameSetup:
+    """게임 시작 테스트 클래스"""
+
+    def test_available_pieces_are_copied(self):
+        """레벨 데이터의 조각 수가 변경되지 않는지 테스트"""
+        level = LevelManager().get_level(1)
+        count = level["available_pieces"]["mirror_left"]
+        engine = GameEngine()
+        engine.start_new_game(level)
+        engine.perform_action("place", 2, 4, "mirror_left")
+        assert level["available_pieces"]["mirror_left"] == count
+        assert engine.current_state.grid[4][2] == CellType.MIRROR_LEFT
+
+    def test_state_dict_grid(self):
+        """보드 직렬화 형식 테스트"""
+        engine = GameEngine()
+        state = engine.start_new_game(make_level(walls=[{"x": 3, "y": 1}]))
+        engine.perform_action("place", 5, 2, "mirror_right")
+        grid = state.dict()["grid"]
+        expected = [["empty"] * 10 for _ in range(10)]
+        expected[1][3] = "wall"
+        expected[2][5] = "mirror_right"
+        assert grid == expected
+        assert len(state.grid.cells) == 100
+
+    def test_level_grid_size(self):
+        """레벨별 보드 크기 테스트"""
+        engine = GameEngine()
+        state = engine.start_new_game(make_level(
+            grid_size=500,
+            emitters=[{"x": 0, "y": 250, "direction": "RIGHT", "color": "WHITE"}],
+            targets=[{"x": 499, "y": 250, "required_color": "WHITE"}]
+        ))
+        assert (state.grid.width, state.grid.height) == (500, 500)
+        paths = engine.calculate_light_paths()
+        assert len(paths[0]["path"]) == 499
+        assert engine.check_victory()
+
+    def test_invalid_grid_size(self):
+        """허용 범위를 벗어난 보드 크기 테스트"""
+        with pytest.raises(ValueError):
+            GameEngine().start_new_game(make_level(grid_size=5000))
+
+
+class TestStateDelta:
+    """버전별 변경분 테스트 클래스"""
+
+    @pytest.fixture
+    def engine(self):
+        engine = GameEngine()
+        engine.start_new_game(make_level())
+        return engine
+
+    def _apply(self, paths, delta):
+        removed = set(delta["paths_removed"])
+        return [p for p in paths if p["id"] not in removed] + delta["paths_added"]
+
+    def test_delta_rebuilds_light_paths(self, engine):
+        """델타 적용 결과가 전체 경로와 같은지 테스트"""
+        version = engine.version
+        paths = []
+        for x, y, piece_type in [(5, 2, "mirror_right"), (3, 7, "splitter")]:
+            engine.perform_action("place", x, y, piece_type)
+            full = engine.calculate_light_paths()
+            delta = engine.get_delta(version)
+            paths = self._apply(paths, delta)
+            version = delta["version"]
+            assert sorted(p["id"] for p in paths) == sorted(p["id"] for p in full)
+
+    def test_delta_contains_only_changes(self, engine):
+        """바뀐 셀, 구간, 타겟만 포함되는지 테스트"""
+        engine.calculate_light_paths()
+        version = engine.version
+        engine.perform_action("place", 5, 2, "mirror_right")
+        engine.calculate_light_paths()
+        delta = engine.get_delta(version)
+        assert delta["cells"] == [{"x": 5, "y": 2, "cell": "mirror_right"}]
+        # 아래쪽 이미터의 빔은 다시 추적되지 않음
+        assert all(p["id"].startswith("0-") for p in delta["paths_added"])
+        assert all(i.startswith("0-") for i in delta["paths_removed"])
+        assert delta["targets"] == [{"index": 0, "is_hit": False}, {"index": 1, "is_hit": True}]
+
+    def test_merged_delta_cancels_out(self, engine):
+        """여러 버전에 걸친 변경이 합쳐지는지 테스트"""
+        engine.calculate_light_paths()
+        version = engine.version
+        engine.perform_action("place", 5, 2, "mirror_right")
+        engine.calculate_light_paths()
+        engine.perform_action("remove", 5, 2)
+        engine.calculate_light_paths()
+        delta = engine.get_delta(version)
+        assert delta["version"] == version + 2
+        assert delta["cells"] == [{"x": 5, "y": 2, "cell": "empty"}]
+        assert delta["paths_added"] == [] and delta["paths_removed"] == []
+        assert delta["targets"] == [{"index": 0, "is_hit": True}, {"index": 1, "is_hit": False}]
+
+    def test_unknown_version_needs_snapshot(self, engine):
+        """기록에 없는 버전은 None 테스트"""
+        engine.calculate_light_paths()
+        old_version = engine.version
+        engine.start_new_game(make_level())
+        engine.calculate_light_paths()
+        assert engine.get_delta(old_version) is None
+        assert engine.get_delta(engine.version + 1) is None
+        assert engine.get_delta(engine.version)["cells"] == []
+
+
+class TestActionBatch:
+    """액션 일괄 적용 테스트 클래스"""
+
+    @pytest.fixture
+    def engine(self):
+        engine = GameEngine()
+        engine.start_new_game(make_level())
+        engine.calculate_light_paths()
+        return engine
+
+    def test_batch_matches_single_actions(self, engine):
+        """일괄 적용 결과가 하나씩 적용한 결과와 같은지 테스트"""
+        actions = [
+            {"action": "place", "x": 5, "y": 2, "piece_type": "mirror_right"},
+            {"action": "place", "x": 3, "y": 7, "piece_type": "splitter"},
+            {"action": "rotate", "x": 5, "y": 2},
+        ]
+        result = engine.perform_actions(actions)
+        assert result.applied == 3 and result.failed_index is None
+        batched = engine.calculate_light_paths()
+
+        single = GameEngine()
+        single.start_new_game(make_level())
+        for action in actions:
+            single.perform_action(action["action"], action["x"], action["y"], action.get("piece_type"))
+        assert batched == single.calculate_light_paths()
+
+    def test_failed_batch_rolls_back(self, engine):
+        """실패 시 전체 롤백 테스트"""
+        before = engine.calculate_light_paths()
+        cells = bytes(engine.current_state.grid.cells)
+        available = dict(engine.available_pieces)
+        result = engine.perform_actions([
+            {"action": "place", "x": 5, "y": 2, "piece_type": "mirror_right"},
+            {"action": "place", "x": 4, "y": 2, "piece_type": "mirror_left"},
+            {"action": "place", "x": 5, "y": 2, "piece_type": "mirror_left"},
+        ], checkpoint_every=1)
+        assert result.failed_index == 2 and result.applied == 0
+        assert len(result.checkpoints) == 2
+        assert bytes(engine.current_state.grid.cells) == cells
+        assert engine.available_pieces == available
+        assert engine.current_state.placed_pieces == {}
+        assert engine.calculate_light_paths() == before
+        assert engine.current_state.targets[0].is_hit
+
+
+class TestHistory:
+    """되돌리기/다시 실행 테스트 클래스"""
+
+    @pytest.fixture
+    def engine(self):
+        engine = GameEngine()
+        engine.start_new_game(make_level())
+        engine.calculate_light_paths()
+        return engine
+
+    def _snapshot(self, engine):
+        state = engine.current_state
+        return (bytes(state.grid.cells), dict(state.placed_pieces),
+                dict(engine.available_pieces), engine.current_moves,
+                [t.is_hit for t in state.targets])
+
+    def test_undo_redo_restores_state(self, engine):
+        """되돌리기/다시 실행 후 상태 복원 테스트"""
+        snapshots = [self._snapshot(engine)]
+        for action, x, y, piece_type in [("place", 5, 2, "mirror_right"),
+                                         ("rotate", 5, 2, None),
+                                         ("place", 3, 7, "splitter"),
+                                         ("remove", 5, 2, None)]:
+            assert engine.perform_action(action, x, y, piece_type)
+            engine.calculate_light_paths()
+            snapshots.append(self._snapshot(engine))
+
+        for expected in reversed(snapshots[:-1]):
+            assert engine.undo()
+            assert self._snapshot(engine) == expected
+        assert not engine.undo()
+        for expected in snapshots[1:]:
+            assert engine.redo()
+            assert self._snapshot(engine) == expected
+        assert not engine.redo()
+
+    def test_undo_uses_cached_paths(self, engine, monkeypatch):
+        """캐시된 노드로 되돌릴 때 재추적하지 않는지 테스트"""
+        before = engine.calculate_light_paths()
+        engine.perform_action("place", 5, 2, "mirror_right")
+        engine.calculate_light_paths()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("re-traced")
+        monkeypatch.setattr(engine, "_trace_beam", fail)
+        version = engine.version
+        assert engine.undo()
+        assert engine.calculate_light_paths() == before
+        delta = engine.get_delta(version)
+        assert delta["cells"] == [{"x": 5, "y": 2, "cell": "empty"}]
+        assert delta["targets"] == [{"index": 0, "is_hit": True}, {"index": 1, "is_hit": False}]
+
+    def test_untraced_node_is_retraced(self, engine):
+        """경로가 캐시되지 않은 노드는 다시 추적되는지 테스트"""
+        engine.perform_action("place", 5, 2, "mirror_right")
+        engine.perform_action("place", 3, 7, "splitter")
+        assert engine.undo()
+        expected = GameEngine()
+        expected.start_new_game(make_level())
+        expected.perform_action("place", 5, 2, "mirror_right")
+        assert engine.calculate_light_paths() == expected.calculate_light_paths()
+
+    def test_cached_paths_are_bounded(self, engine):
+        """경로를 보관하는 노드 수 제한과 오래된 노드로 되돌리기 테스트"""
+        snapshots = [self._snapshot(engine)]
+        for i in range(PATH_SNAPSHOTS + 10):
+            action = "place" if i % 2 == 0 else "remove"
+            assert engine.perform_action(action, 3, 7, "splitter")
+            engine.calculate_light_paths()
+            snapshots.append(self._snapshot(engine))
+        assert sum(node.paths is not None for node in engine._history) == PATH_SNAPSHOTS
+
+        for expected in reversed(snapshots[:-1]):
+            assert engine.undo()
+            engine.calculate_light_paths()
+            assert self._snapshot(engine) == expected
+
+    def test_new_action_clears_redo(self, engine):
+        """새 액션 후 다시 실행 불가 테스트"""
+        engine.perform_action("place", 5, 2, "mirror_right")
+        engine.undo()
+        engine.perform_action("place", 4, 2, "mirror_left")
+        assert not engine.can_redo()
+        assert [m.action for m in engine.get_history()] == ["place"]
+        assert engine.get_history()[0].piece_type == "mirror_left"
+
+
+class TestBoardHash:
+    """보드 해시 테스트 클래스"""
+
+    def _engine(self, **overrides):
+        engine = GameEngine()
+        engine.start_new_game(make_level(**overrides))
+        return engine
+
+    def test_same_board_same_hash(self):
+        """다른 순서로 같은 배치에 도달하면 같은 해시인지 테스트"""
+        a, b = self._engine(), self._engine()
+        a.perform_action("place", 5, 2, "mirror_right")
+        a.perform_action("place", 3, 7, "splitter")
+        b.perform_action("place", 3, 7, "splitter")
+        b.perform_action("place", 4, 4, "mirror_left")
+        b.perform_action("remove", 4, 4)
+        b.perform_action("place", 5, 2, "mirror_left")
+        assert a.board_hash != b.board_hash
+        b.perform_action("rotate", 5, 2)
+        assert a.board_hash == b.board_hash
+
+    def test_hash_follows_undo_and_rollback(self):
+        """되돌리기와 일괄 액션 롤백 후 해시 복원 테스트"""
+        engine = self._engine()
+        start = engine.board_hash
+        engine.perform_action("place", 5, 2, "mirror_right")
+        placed = engine.board_hash
+        assert placed != start
+        engine.undo()
+        assert engine.board_hash == start
+        engine.redo()
+        assert engine.board_hash == placed
+        result = engine.perform_actions([
+            {"action": "place", "x": 3, "y": 7, "piece_type": "splitter"},
+            {"action": "place", "x": 3, "y": 7, "piece_type": "splitter"},
+        ])
+        assert result.failed_index == 1
+        assert engine.board_hash == placed
+
+    def test_levels_hash_differently(self):
+        """레벨 ID나 배치가 다르면 다른 해시인지 테스트"""
+        assert self._engine().board_hash != self._engine(id=101).board_hash
+        assert self._engine().board_hash != self._engine(walls=[{"x": 4, "y": 4}]).board_hash
+
+
+class TestTraceCache:
+    """엔진 간 추적 결과 공유 테스트 클래스"""
+
+    def _engine(self, cache):
+        engine = GameEngine()
+        engine.trace_cache = cache
+        engine.start_new_game(make_level())
+        return engine
+
+    def test_shared_position_is_not_retraced(self, monkeypatch):
+        """다른 엔진이 추적한 배치는 추적 없이 같은 결과를 쓰는지 테스트"""
+        cache = TraceCache()
+        first = self._engine(cache)
+        first.calculate_light_paths()
+        first.perform_action("place", 5, 2, "mirror_right")
+        expected = first.calculate_light_paths()
+
+        second = self._engine(cache)
+        second.calculate_light_paths()
+        version = second.version
+        second.perform_action("place", 5, 2, "mirror_right")
+
+        def fail(*args, **kwargs):
+            raise AssertionError("re-traced")
+        monkeypatch.setattr(second, "_trace_beam", fail)
+        assert second.calculate_light_paths() == expected
+        assert [t.is_hit for t in second.current_state.targets] == [False, True]
+        assert cache.stats()["hits"] == 2
+
+        delta = second.get_delta(version)
+        assert delta["cells"] == [{"x": 5, "y": 2, "cell": "mirror_right"}]
+        assert all(p["id"].startswith("0-") for p in delta["paths_added"])
+
+    def test_cache_is_bounded(self):
+        """최대 항목 수를 넘으면 오래된 결과 제거 테스트"""
+        cache = TraceCache(max_entries=2)
+        engine = self._engine(cache)
+        engine.calculate_light_paths()
+        for x in (4, 5, 6):
+            engine.perform_action("place", x, 2, "mirror_right")
+            engine.calculate_light_paths()
+            engine.perform_action("remove", x, 2)
+        assert cache.stats()["entries"] == 2
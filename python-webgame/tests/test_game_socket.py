@@ -0,0 +1,80 @@
+"""
+웹소켓 게임 채널 테스트
+"""
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend import main
+from backend.core.replay import split_games
+from backend.main import app
+
+
+class TestGameSocket:
+    """웹소켓 게임 채널 테스트 클래스"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def _start(self, client, level_id=1):
+        return client.post(f"/api/game/start/{level_id}").json()["session_id"]
+
+    def test_snapshot_then_delta(self, client):
+        """연결 시 전체 상태, 이후 델타 응답 테스트"""
+        sid = self._start(client)
+        with client.websocket_connect(f"/ws/game?session_id={sid}") as ws:
+            snapshot = ws.receive_json()
+            assert snapshot["type"] == "snapshot" and snapshot["full"]
+            assert len(snapshot["game_state"]["grid"]) == 10
+
+            ws.send_json({"action": "place", "x": 5, "y": 4, "piece_type": "mirror_left"})
+            update = ws.receive_json()
+            assert update["type"] == "update" and update["applied"] == 1
+            assert update["delta"]["from_version"] == snapshot["version"]
+            assert update["delta"]["cells"] == [{"x": 5, "y": 4, "cell": "mirror_left"}]
+            assert update["available_pieces"]["mirror_left"] == (
+                snapshot["available_pieces"]["mirror_left"] - 1
+            )
+
+    def test_burst_is_coalesced(self, client, monkeypatch):
+        """연속 액션이 한 번의 응답으로 묶이는지 테스트"""
+        monkeypatch.setattr(main, "WS_COALESCE_SECONDS", 0.2)
+        sid = self._start(client)
+        with client.websocket_connect(f"/ws/game?session_id={sid}") as ws:
+            ws.receive_json()
+            ws.send_json({"action": "place", "x": 5, "y": 4, "piece_type": "mirror_left"})
+            ws.send_json({"action": "remove", "x": 5, "y": 4})
+            ws.send_json({"action": "place", "x": 5, "y": 2, "piece_type": "mirror_left"})
+            update = ws.receive_json()
+            assert update["actions"] == 3 and update["applied"] == 3
+            cells = {(c["x"], c["y"]): c["cell"] for c in update["delta"]["cells"]}
+            assert cells == {(5, 4): "empty", (5, 2): "mirror_left"}
+
+    def test_invalid_action_reports_error(self, client):
+        """잘못된 액션 오류 보고 테스트"""
+        sid = self._start(client)
+        with client.websocket_connect(f"/ws/game?session_id={sid}") as ws:
+            ws.receive_json()
+            ws.send_json({"action": "place"})
+            update = ws.receive_json()
+            assert update["applied"] == 0 and len(update["errors"]) == 1
+
+    def test_unknown_session(self, client):
+        """세션 없이 연결 시 오류 테스트"""
+        with client.websocket_connect("/ws/game?session_id=unknown") as ws:
+            assert ws.receive_json()["type"] == "error"
+
+    def test_actions_before_disconnect_are_kept(self, client, monkeypatch):
+        """연결 종료와 같은 배치의 액션도 로그에 기록되는지 테스트"""
+        monkeypatch.setattr(main, "WS_COALESCE_SECONDS", 0.2)
+        sid = self._start(client)
+        with client.websocket_connect(f"/ws/game?session_id={sid}") as ws:
+            ws.receive_json()
+            ws.send_json({"action": "place", "x": 5, "y": 4, "piece_type": "mirror_left"})
+            ws.send({"type": "websocket.disconnect", "code": 1000})
+            time.sleep(0.5)  # 테스트 클라이언트는 블록을 나가면 서버 처리를 취소하므로 안에서 대기
+            games = split_games(main.replay_store.load(sid))
+        assert [event.action for event in games[-1]] == ["start", "place"]
+        assert main.session_manager.get(sid).current_moves == 1
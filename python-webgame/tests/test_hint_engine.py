@@ -0,0 +1,78 @@
+"""
+힌트 엔진 테스트
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.core.game_engine import GameEngine
+from backend.core.hint_engine import HintEngine
+from backend.core.level_manager import LevelManager
+from backend.main import app
+
+
+LEVELS = LevelManager()
+
+
+class TestHintEngine:
+    """HintEngine 테스트 클래스"""
+
+    @pytest.fixture
+    def engine(self):
+        engine = GameEngine()
+        engine.start_new_game(LEVELS.get_level(1))
+        return engine
+
+    def test_hint_is_next_move_of_shortest_solution(self, engine):
+        """최단 풀이의 다음 수 힌트 테스트"""
+        hints = HintEngine()
+        hint = hints.get_hint(engine, LEVELS.get_level(1))
+        assert hint["move"] == {"action": "place", "x": 2, "y": 4, "piece_type": "mirror_left"}
+        assert hint["moves_left"] == 3
+        assert hint["hint"] == "Place a mirror_left at (2, 4)"
+
+    def test_following_hints_solves_level(self, engine):
+        """힌트만 따라가면 클리어되는지 테스트"""
+        hints = HintEngine()
+        level = LEVELS.get_level(4)
+        engine.start_new_game(level)
+        for _ in range(level["min_moves"]):
+            move = hints.get_hint(engine, level)["move"]
+            assert engine.perform_action(move["action"], move["x"], move["y"], move["piece_type"])
+        engine.calculate_light_paths()
+        assert engine.check_victory()
+        # 첫 풀이 이후의 보드는 모두 캐시에서 응답
+        assert hints.stats()["misses"] == 1
+
+    def test_repeated_requests_hit_cache(self, engine):
+        """같은 보드의 반복 요청 캐시 테스트"""
+        hints = HintEngine()
+        other = GameEngine()
+        other.start_new_game(LEVELS.get_level(1))
+        first = hints.get_hint(engine, LEVELS.get_level(1))
+        assert hints.get_hint(other, LEVELS.get_level(1)) is first
+        assert hints.stats() == {"entries": 3, "hits": 1, "misses": 1}
+
+    def test_incomplete_search_is_not_cached(self, engine):
+        """탐색 한도에 걸린 결과는 캐시하지 않는지 테스트"""
+        hints = HintEngine(max_nodes=1)
+        assert hints.get_hint(engine, LEVELS.get_level(1)) is None
+        assert hints.stats()["entries"] == 0
+        hints.max_nodes = 20000
+        assert hints.get_hint(engine, LEVELS.get_level(1))["moves_left"] == 3
+
+    def test_suggests_removing_wrong_piece(self, engine):
+        """더 놓아서 풀 수 없는 보드에서 제거 힌트 테스트"""
+        engine.perform_action("place", 2, 4, "mirror_right")
+        hint = HintEngine().get_hint(engine, LEVELS.get_level(1))
+        assert hint["move"] == {"action": "remove", "x": 2, "y": 4}
+
+
+class TestHintApi:
+    """힌트 API 테스트 클래스"""
+
+    def test_hint_endpoint(self):
+        """힌트 엔드포인트 테스트"""
+        client = TestClient(app)
+        session_id = client.post("/api/game/start/1").json()["session_id"]
+        response = client.get("/api/game/hint/1", headers={"X-Session-ID": session_id})
+        assert response.json()["hint"] == "Place a mirror_left at (2, 4)"
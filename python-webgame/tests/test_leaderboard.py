@@ -0,0 +1,140 @@
+"""
+리더보드 테스트
+"""
+import random
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.core.leaderboard import Leaderboard, LevelLeaderboard
+from backend.core.progress_store import ProgressStore
+from backend.main import app, progress_store
+from backend.models.game_models import PlayerProgress
+
+
+class TestLevelLeaderboard:
+    """레벨 순위표 테스트 클래스"""
+
+    def test_ties_share_rank(self):
+        """같은 점수는 같은 순위 테스트"""
+        board = LevelLeaderboard()
+        board.submit("a", 3, 40)
+        board.submit("b", 3, 40)
+        board.submit("c", 2, 90)
+        board.submit("d", 5)
+        assert [(e["player_id"], e["rank"]) for e in board.top(4, "moves")] == [
+            ("c", 1), ("a", 2), ("b", 2), ("d", 4)
+        ]
+        assert board.rank("b", "moves") == (2, 1)
+        assert board.rank("d", "time") is None
+        assert board.total("time") == 3
+
+    def test_only_personal_best_counts(self):
+        """개인 최고 기록만 유지 테스트"""
+        board = LevelLeaderboard()
+        assert board.submit("a", 5, 60)
+        assert not board.submit("a", 6, 70)
+        assert board.submit("a", 6, 30)
+        assert board.records["a"] == (5, 30)
+        assert board.total("moves") == board.total("time") == 1
+
+    def test_matches_brute_force(self):
+        """무작위 기록의 순위가 전체 정렬 결과와 같은지 테스트"""
+        rng = random.Random(7)
+        board = LevelLeaderboard()
+        best = {}
+        for _ in range(2000):
+            player = f"p{rng.randrange(300)}"
+            moves, play_time = rng.randint(1, 20), rng.randint(5, 200)
+            board.submit(player, moves, play_time)
+            old = best.get(player, (moves, play_time))
+            best[player] = (min(old[0], moves), min(old[1], play_time))
+
+        scores = sorted(best.values())
+        for player, score in best.items():
+            better = sum(1 for other in scores if other < score)
+            worse = sum(1 for other in scores if other > score)
+            assert board.rank(player, "moves") == (better + 1, worse)
+
+
+class TestLeaderboard:
+    """전체 순위표 테스트 클래스"""
+
+    def test_query(self):
+        """상위 목록과 플레이어 순위 조회 테스트"""
+        leaderboard = Leaderboard()
+        for i in range(10):
+            leaderboard.submit(1, f"p{i}", moves=i + 1, play_time=100 - i)
+        result = leaderboard.query(1, "moves", limit=3, player_id="p7")
+        assert result["total"] == 10
+        assert [e["player_id"] for e in result["top"]] == ["p0", "p1", "p2"]
+        assert result["player"]["rank"] == 8
+        assert result["player"]["percentile"] == 20.0
+        assert leaderboard.query(1, "time", limit=1)["top"][0]["player_id"] == "p9"
+        assert leaderboard.query(2)["total"] == 0
+        with pytest.raises(ValueError):
+            leaderboard.query(1, "stars")
+
+    def test_sync_from_store(self, tmp_path):
+        """다른 프로세스가 저장한 기록을 저장소에서 읽어오는지 테스트"""
+        store = ProgressStore(tmp_path / "progress.db")
+        leaderboard = Leaderboard(store)
+        for player_id, moves, play_time in [("a", 4, 30), ("b", 3, 0), ("a", 5, 20)]:
+            store.save(PlayerProgress(
+                player_id=player_id, level_id=1, completed=True, stars=3,
+                moves=moves, best_moves=moves, play_time=play_time
+            ))
+        store.save(PlayerProgress(
+            player_id="c", level_id=1, completed=False, stars=0, moves=1, best_moves=0, play_time=5
+        ))
+        store.flush()
+        assert leaderboard.sync(force=True) == 2
+        assert leaderboard.sync(force=True) == 0
+        result = leaderboard.query(1, player_id="a")
+        assert [e["player_id"] for e in result["top"]] == ["b", "a"]
+        assert result["player"]["moves"] == 4 and result["player"]["time"] == 20
+
+        reloaded = Leaderboard(store)
+        assert reloaded.query(1, "time")["top"] == [
+            {"rank": 1, "player_id": "a", "moves": 4, "time": 20}
+        ]
+        store.close()
+
+
+class TestLeaderboardApi:
+    """리더보드 API 테스트 클래스"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_saved_progress_is_ranked(self, client, play_level):
+        """저장한 진행상황이 순위에 반영되는지 테스트"""
+        for player_id, detour in [("lb-a", True), ("lb-b", False)]:
+            game = play_level(client, 3, detour=detour)
+            response = client.post("/api/progress/save", json={
+                "session_id": game["session_id"], "player_id": player_id,
+                "level_id": 3, "moves": game["moves"], "stars": game["stars"]
+            })
+            assert response.json()["verified"]
+        progress_store.flush()
+        result = client.get("/api/leaderboard/3", params={"player_id": "lb-a", "limit": 100}).json()
+        ranked = [e["player_id"] for e in result["top"]]
+        assert ranked.index("lb-b") < ranked.index("lb-a")
+        assert result["player"]["rank"] == ranked.index("lb-a") + 1
+
+    def test_unverified_score_is_not_ranked(self, client):
+        """리플레이 로그가 없는 점수는 거부되고 순위에 없는지 테스트"""
+        response = client.post("/api/progress/save", json={
+            "session_id": "no-such-session", "player_id": "lb-cheat",
+            "level_id": 3, "moves": 1, "stars": 3
+        })
+        assert response.status_code == 400
+        progress_store.flush()
+        result = client.get("/api/leaderboard/3", params={"player_id": "lb-cheat"}).json()
+        assert result["player"] is None
+
+    def test_invalid_requests(self, client):
+        """없는 레벨과 잘못된 순위 기준 테스트"""
+        assert client.get("/api/leaderboard/99999").status_code == 404
+        assert client.get("/api/leaderboard/1", params={"by": "stars"}).status_code == 400
@@ -0,0 +1,41 @@
+"""
+레벨 생성기 테스트
+"""
+import pytest
+
+from backend.core.level_generator import (
+    LevelGenerator, estimate_difficulty, generate_levels
+)
+from backend.core.solver import validate_level
+
+
+class TestLevelGenerator:
+    """레벨 생성기 테스트 클래스"""
+
+    @pytest.mark.parametrize("difficulty", ["Easy", "Medium"])
+    def test_generated_level_is_valid(self, difficulty):
+        """생성된 레벨의 풀이 가능 여부와 min_moves 테스트"""
+        level = LevelGenerator().generate(difficulty, seed=1)
+        assert level["difficulty"] == difficulty
+        assert validate_level(level)["valid"]
+        walls = {(w["x"], w["y"]) for w in level["walls"]}
+        assert all((t["x"], t["y"]) not in walls for t in level["targets"])
+
+    def test_same_seed_same_level(self):
+        """시드 재현성 테스트"""
+        generator = LevelGenerator()
+        assert generator.generate("Medium", seed=3) == generator.generate("Medium", seed=3)
+
+    def test_estimate_matches_builtin_levels(self, level_report):
+        """기본 레벨의 추정 난이도 순서 테스트"""
+        scores = {}
+        for level_id in (2, 3, 5):
+            report = level_report(level_id)
+            scores[level_id] = estimate_difficulty(report["min_moves"], report["nodes"])
+        assert scores[2][0] == "Easy" and scores[5][0] == "Expert"
+        assert scores[2][1] < scores[3][1] < scores[5][1]
+
+    def test_process_pool(self):
+        """프로세스 풀 생성 테스트"""
+        levels = generate_levels(3, "Easy", workers=2, seed=10)
+        assert [level["seed"] for level in levels] == [10, 11, 12]
@@ -0,0 +1,111 @@
+"""
+레벨 관리자 테스트
+"""
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.core.level_manager import LevelManager, INDEX_FILE
+from backend.main import app, level_manager
+
+
+def make_custom_level(name="커스텀"):
+    """테스트용 커스텀 레벨"""
+    return {
+        "name": name, "difficulty": "Easy", "description": "테스트", "grid_size": 5,
+        "min_moves": 0, "walls": [],
+        "emitters": [{"x": 0, "y": 0, "direction": "RIGHT", "color": "WHITE"}],
+        "targets": [{"x": 4, "y": 0, "required_color": "WHITE"}],
+        "available_pieces": {}
+    }
+
+
+class TestLevelManager:
+    """레벨 관리자 테스트 클래스"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        return LevelManager(custom_dir=tmp_path / "custom", cache_size=3)
+
+    def test_builtin_levels_are_lazy(self, manager):
+        """인덱스만 읽고 레벨은 요청 시 파싱하는지 테스트"""
+        assert manager.get_level_ids() == list(range(1, 9))
+        assert len(manager._cache) == 0
+        assert manager.get_all_levels()[0]["name"] == "첫 번째 빛"
+        assert manager.get_level(1)["grid_size"] == 10
+        assert list(manager._cache) == [1]
+        assert manager.get_level(99) is None
+
+    def test_cache_is_bounded(self, manager):
+        """LRU 캐시 크기 제한 테스트"""
+        for level_id in range(1, 9):
+            manager.get_level(level_id)
+        assert list(manager._cache) == [6, 7, 8]
+        assert manager.get_level(1)["id"] == 1
+
+    def test_custom_level_persists(self, manager, tmp_path):
+        """커스텀 레벨이 재시작 후에도 유지되는지 테스트"""
+        assert manager.save_custom_level(make_custom_level())
+        reopened = LevelManager(custom_dir=tmp_path / "custom")
+        assert reopened.get_total_levels() == 9
+        assert reopened.get_level(9)["name"] == "커스텀"
+        assert reopened.save_custom_level(make_custom_level("두 번째"))
+        assert reopened.get_level(10)["id"] == 10
+
+    def test_torn_index_line_is_ignored(self, manager, tmp_path):
+        """덜 기록된 인덱스 줄 무시 테스트"""
+        manager.save_custom_level(make_custom_level())
+        with open(tmp_path / "custom" / INDEX_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"id": 10, "name": "broken"})[:12])
+        reopened = LevelManager(custom_dir=tmp_path / "custom")
+        assert reopened.get_level_ids() == list(range(1, 10))
+
+    def test_memory_only_custom_level(self):
+        """저장 디렉터리가 없을 때 메모리 보관 테스트"""
+        manager = LevelManager(cache_size=1)
+        manager.save_custom_level(make_custom_level())
+        for level_id in range(1, 9):
+            manager.get_level(level_id)
+        assert manager.get_level(9)["name"] == "커스텀"
+
+    def test_levels_page(self, manager):
+        """커서 페이지와 난이도 필터 테스트"""
+        levels, cursor = manager.get_levels_page(limit=3)
+        assert [l["id"] for l in levels] == [1, 2, 3] and cursor == 3
+        levels, cursor = manager.get_levels_page(after=cursor, limit=5)
+        assert [l["id"] for l in levels] == [4, 5, 6, 7, 8] and cursor is None
+        levels, _ = manager.get_levels_page(difficulty="Hard")
+        assert [l["id"] for l in levels] == [5, 6]
+
+        version = manager.version
+        manager.save_custom_level(make_custom_level())
+        assert manager.version == version + 1
+        levels, _ = manager.get_levels_page(after=8, difficulty="Easy")
+        assert [l["id"] for l in levels] == [9]
+
+
+class TestLevelsApi:
+    """레벨 목록 API 테스트 클래스"""
+
+    def test_pagination_and_etag(self):
+        """페이지 응답, ETag, 업로드 후 무효화 테스트"""
+        client = TestClient(app)
+        first = client.get("/api/levels", params={"limit": 4})
+        data = first.json()
+        assert [l["id"] for l in data["levels"]] == [1, 2, 3, 4]
+        assert data["next_cursor"] == 4
+        etag = first.headers["etag"]
+
+        cached = client.get("/api/levels", params={"limit": 4}, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+        rest = client.get("/api/levels", params={"limit": 4, "cursor": 4}).json()
+        assert [l["id"] for l in rest["levels"]][:4] == [5, 6, 7, 8]
+
+        level = dict(LevelManager().get_level(2))
+        level.pop("id")
+        assert client.post("/api/levels", json=level).status_code == 200
+        changed = client.get("/api/levels", params={"difficulty": "Easy", "limit": 500})
+        assert changed.headers["etag"] != etag
+        assert level_manager.get_total_levels() in [l["id"] for l in changed.json()["levels"]]
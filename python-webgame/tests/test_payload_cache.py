@@ -0,0 +1,61 @@
+"""
+직렬화 응답 캐시 테스트
+"""
+import gzip
+
+from fastapi.testclient import TestClient
+
+from backend.core.payload_cache import CachedPayload, PayloadCache
+from backend.main import app
+
+
+class TestPayloadCache:
+    """직렬화 응답 캐시 테스트 클래스"""
+
+    def test_payload_is_built_once(self):
+        """같은 키는 한 번만 직렬화되는지 테스트"""
+        cache = PayloadCache(max_entries=2)
+        calls = []
+        build = lambda: calls.append(1) or {"a": 1}
+        first = cache.get("k", build)
+        assert cache.get("k", build) is first and len(calls) == 1
+        assert first.body == b'{"a":1}'
+        assert cache.get("missing", lambda: None) is None
+
+    def test_compressed_variants(self):
+        """큰 본문만 압축하고 인코딩별 ETag가 다른지 테스트"""
+        small = CachedPayload.from_json({"a": 1}, compress=True)
+        assert small.encoded == {}
+        large = CachedPayload.from_json({"walls": [{"x": i, "y": i} for i in range(100)]}, compress=True)
+        assert gzip.decompress(large.encoded["gzip"]) == large.body
+        assert large.etag.startswith('"') and large.etag.endswith('"')
+
+
+class TestStaticPayloadApi:
+    """미리 직렬화된 응답 API 테스트 클래스"""
+
+    def test_level_etag_and_gzip(self):
+        """레벨 응답의 ETag, 304, gzip 테스트"""
+        client = TestClient(app)
+        plain = client.get("/api/levels/5", headers={"Accept-Encoding": "identity"})
+        assert plain.json()["id"] == 5
+        assert "content-encoding" not in plain.headers
+        assert plain.headers["cache-control"] == "public, max-age=3600"
+
+        zipped = client.get("/api/levels/5", headers={"Accept-Encoding": "gzip"})
+        assert zipped.headers["content-encoding"] == "gzip"
+        assert zipped.json() == plain.json()
+        assert zipped.headers["etag"] != plain.headers["etag"]
+
+        not_modified = client.get("/api/levels/5", headers={
+            "Accept-Encoding": "gzip", "If-None-Match": zipped.headers["etag"]
+        })
+        assert not_modified.status_code == 304
+        assert client.get("/api/levels/999").status_code == 404
+
+    def test_index_page_from_memory(self):
+        """메인 페이지 캐시 응답 테스트"""
+        client = TestClient(app)
+        first = client.get("/")
+        assert first.status_code == 200 and "text/html" in first.headers["content-type"]
+        assert client.get("/", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
@@ -0,0 +1,112 @@
+"""
+진행상황 저장소 테스트
+"""
+import sqlite3
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.core.progress_store import ProgressStore
+from backend.main import app, progress_store
+from backend.models.game_models import PlayerProgress
+
+
+def make_progress(**overrides):
+    """테스트용 진행상황"""
+    progress = {
+        "player_id": "p1", "level_id": 1, "completed": True, "stars": 2,
+        "moves": 5, "best_moves": 5, "play_time": 30
+    }
+    progress.update(overrides)
+    return PlayerProgress(**progress)
+
+
+class TestProgressStore:
+    """진행상황 저장소 테스트 클래스"""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = ProgressStore(tmp_path / "progress.db")
+        yield store
+        store.close()
+
+    def test_best_result_is_kept(self, store):
+        """최고 기록 병합 테스트"""
+        store.save(make_progress(stars=2, moves=5, best_moves=5))
+        store.save(make_progress(stars=3, moves=3, best_moves=3))
+        store.save(make_progress(stars=1, moves=9, best_moves=9))
+        store.flush()
+        [progress] = store.get_progress("p1")
+        assert progress.stars == 3 and progress.best_moves == 3
+        assert progress.moves == 9 and progress.play_time == 90
+
+    def test_aggregates_match_rows(self, store):
+        """증분 집계가 전체 행 집계와 같은지 테스트"""
+        for i in range(200):
+            store.save(make_progress(player_id=f"p{i % 7}", level_id=i % 5 + 1,
+                                     stars=i % 4, completed=i % 4 > 0, moves=i))
+        store.flush()
+        rows = [p for i in range(7) for p in store.get_progress(f"p{i}")]
+        stats = store.get_stats()
+        assert stats["players"] == 7
+        assert stats["completed_levels"] == sum(p.completed for p in rows)
+        assert stats["total_stars"] == sum(p.stars for p in rows)
+        assert stats["total_moves"] == sum(range(200))
+        player = store.get_stats("p3")
+        assert player["total_stars"] == sum(p.stars for p in store.get_progress("p3"))
+
+    def test_locked_batch_does_not_stop_writer(self, tmp_path, monkeypatch):
+        """잠금으로 실패한 묶음 이후에도 쓰기 스레드가 계속 동작하는지 테스트"""
+        connect = ProgressStore._connect
+
+        def quick_timeout(self):
+            conn = connect(self)
+            conn.execute("PRAGMA busy_timeout=50")
+            return conn
+
+        monkeypatch.setattr(ProgressStore, "_connect", quick_timeout)
+        store = ProgressStore(tmp_path / "progress.db")
+        try:
+            store.save(make_progress(player_id="warmup"))
+            store.flush()
+            other = sqlite3.connect(tmp_path / "progress.db", isolation_level=None)
+            other.execute("BEGIN IMMEDIATE")
+            store.save(make_progress(player_id="lost"))
+            store.flush()
+            other.execute("ROLLBACK")
+            other.close()
+
+            store.save(make_progress(player_id="kept"))
+            store.flush()
+            assert store.get_progress("kept") and not store.get_progress("lost")
+        finally:
+            store.close()
+
+    def test_data_survives_reopen(self, store, tmp_path):
+        """다시 열었을 때 데이터 유지 테스트"""
+        store.save(make_progress())
+        store.close()
+        reopened = ProgressStore(tmp_path / "progress.db")
+        try:
+            assert reopened.get_stats("p1")["total_stars"] == 2
+        finally:
+            reopened.close()
+
+
+class TestProgressApi:
+    """진행상황 API 테스트 클래스"""
+
+    def test_save_then_stats(self, play_level):
+        """저장 후 통계 조회 테스트"""
+        client = TestClient(app)
+        game = play_level(client, 2)
+        response = client.post("/api/progress/save", json={
+            "session_id": game["session_id"], "player_id": "api-player",
+            "level_id": 2, "moves": game["moves"], "stars": game["stars"]
+        })
+        assert response.json()["status"] == "saved"
+        progress_store.flush()
+        stats = client.get("/api/stats", params={"player_id": "api-player"}).json()
+        assert stats["completed_levels"] == 1 and stats["total_stars"] == 3
+        assert client.get("/api/stats").json()["total_levels"] >= 8
+        assert client.get("/api/progress/api-player").json()[0]["best_moves"] == game["moves"]
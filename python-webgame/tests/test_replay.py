@@ -0,0 +1,212 @@
+"""
+리플레이 로그 테스트
+"""
+import os
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.core.level_manager import LevelManager
+from backend.core.replay import (
+    MAGIC, ReplayStore, ReplayVerifier, decode, encode_action, encode_start, split_games, verify_logs
+)
+from backend.core.solver import solve_level
+from backend.main import app, progress_store, replay_store
+
+LEVELS = LevelManager()
+
+
+def _solution(level_id):
+    return solve_level(LEVELS.get_level(level_id)).solution
+
+
+def _log(level_id, placements, *extra):
+    records = [encode_start(level_id)]
+    records += [encode_action("place", x, y, piece_type) for x, y, piece_type in placements]
+    return MAGIC + b"".join(records) + b"".join(extra)
+
+
+class TestReplayFormat:
+    """로그 인코딩 테스트 클래스"""
+
+    def test_roundtrip(self):
+        """인코딩한 이벤트를 그대로 읽는지 테스트"""
+        data = MAGIC + encode_start(300, started_at=1700000000) + b"".join([
+            encode_action("place", 5, 4, "mirror_left"),
+            encode_action("rotate", 5, 4),
+            encode_action("undo"),
+            encode_action("redo"),
+            encode_action("remove", 200, 7),
+        ])
+        events = list(decode(data))
+        assert [e.action for e in events] == ["start", "place", "rotate", "undo", "redo", "remove"]
+        assert events[0].level_id == 300 and events[0].started_at == 1700000000
+        assert events[1][:4] == ("place", 5, 4, "mirror_left")
+        assert events[5][:3] == ("remove", 200, 7)
+
+    def test_compact_records(self):
+        """액션은 3바이트, 되돌리기는 1바이트인지 테스트"""
+        assert len(encode_action("place", 9, 9, "prism")) == 3
+        assert len(encode_action("rotate", 9, 9)) == 3
+        assert len(encode_action("undo")) == 1
+
+    def test_truncated_record_ignored(self):
+        """덜 기록된 마지막 레코드 무시 테스트"""
+        data = _log(1, [(5, 4, "mirror_left")])
+        games = split_games(data[:-1])
+        assert len(games) == 1 and len(games[0]) == 1
+
+    def test_unknown_piece_code_is_error(self):
+        """잘못된 조각 코드는 잘린 로그로 취급하지 않고 오류 테스트"""
+        data = _log(1, [(5, 4, "mirror_left")])
+        bad = data[:-3] + bytes([data[-3] & 0xF0 | 0x0E]) + data[-2:]
+        with pytest.raises(ValueError):
+            list(decode(bad))
+        assert ReplayVerifier(LEVELS.get_level).verify(bad).error is not None
+
+    def test_rejects_other_data(self):
+        """헤더가 없는 데이터 거부 테스트"""
+        with pytest.raises(ValueError):
+            list(decode(b"not a log"))
+
+
+class TestReplayVerifier:
+    """재생 검증 테스트 클래스"""
+
+    def test_replay_solution(self):
+        """풀이 로그 재생 결과 테스트"""
+        solution = _solution(4)
+        result = ReplayVerifier(LEVELS.get_level).verify(_log(4, solution.placements))
+        assert result.complete
+        assert result.moves == solution.moves
+        assert result.stars == 3
+        assert result.matches(solution.moves, 3, completed=True)
+        assert not result.matches(solution.moves - 1, 3)
+
+    def test_undo_redo_replayed(self):
+        """되돌리기/다시 실행 포함 로그 재생 테스트"""
+        solution = _solution(4)
+        data = _log(4, solution.placements, encode_action("undo"), encode_action("undo"),
+                    encode_action("redo"), encode_action("redo"))
+        result = ReplayVerifier(LEVELS.get_level).verify(data)
+        assert result.complete and result.moves == solution.moves
+
+        result = ReplayVerifier(LEVELS.get_level).verify(data + encode_action("undo"))
+        assert not result.complete and result.stars == 0
+
+    def test_impossible_action_is_error(self):
+        """불가능한 액션이 있는 로그 테스트"""
+        data = _log(1, [(5, 4, "mirror_left"), (5, 4, "mirror_left")])
+        result = ReplayVerifier(LEVELS.get_level).verify(data)
+        assert result.error is not None
+        assert not result.matches(result.moves, 0)
+
+    def test_verifies_last_game_of_level(self):
+        """같은 세션의 여러 게임 중 해당 레벨의 마지막 게임 검증 테스트"""
+        solution = _solution(4)
+        data = _log(4, solution.placements) + encode_start(1) + encode_action("place", 5, 4, "mirror_left")
+        verifier = ReplayVerifier(LEVELS.get_level)
+        assert verifier.verify(data).level_id == 1
+        assert verifier.verify(data, level_id=4).complete
+        assert verifier.verify(data, level_id=2) is None
+
+    def test_play_time_from_start_record(self):
+        """시작 레코드 시각으로 플레이 시간 계산 테스트"""
+        data = _log(4, _solution(4).placements).replace(encode_start(4), encode_start(4, 1000), 1)
+        result = ReplayVerifier(LEVELS.get_level).verify(data)
+        assert result.started_at == 1000
+        assert result.play_time(now=1090) == 90
+        assert result.play_time(now=1000) == 1
+
+    def test_verify_many(self):
+        """여러 로그 일괄 검증 테스트"""
+        solution = _solution(4)
+        logs = [(_log(4, solution.placements), 4)] * 50 + [(_log(4, solution.placements[:-1]), 4)]
+        results = verify_logs(logs, workers=1)
+        assert sum(result.complete for result in results) == 50
+
+
+class TestReplayStore:
+    """로그 파일 저장소 테스트 클래스"""
+
+    def test_delete_and_purge(self, tmp_path):
+        """세션 로그 삭제와 오래된 로그 정리 테스트"""
+        store = ReplayStore(tmp_path)
+        for session_id in ("a", "b", "c"):
+            store.append(session_id, encode_start(1))
+        assert store.delete("a") and not store.delete("a")
+        old = time.time() - 100
+        os.utime(tmp_path / "b.mmr", (old, old))
+        assert store.purge(60) == 1
+        assert store.load("b") is None and store.load("c") is not None
+
+    def test_expired_logs_removed_on_start(self, tmp_path):
+        """시작할 때 TTL이 지난 로그 정리 테스트"""
+        ReplayStore(tmp_path).append("old", encode_start(1))
+        old = time.time() - 100
+        os.utime(tmp_path / "old.mmr", (old, old))
+        assert ReplayStore(tmp_path, ttl_seconds=60).load("old") is None
+
+
+class TestReplayApi:
+    """세션 로그 기록 및 점수 검증 API 테스트 클래스"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def _play(self, client, level_id):
+        session_id = client.post(f"/api/game/start/{level_id}").json()["session_id"]
+        response = None
+        for x, y, piece_type in _solution(level_id).placements:
+            response = client.post("/api/game/action", json={
+                "action": "place", "x": x, "y": y, "piece_type": piece_type
+            }).json()
+        return session_id, response
+
+    def test_actions_are_recorded(self, client):
+        """세션 액션이 로그에 기록되는지 테스트"""
+        session_id, _ = self._play(client, 4)
+        client.post("/api/game/undo")
+        client.post("/api/game/action", json={"action": "remove", "x": 0, "y": 0})  # 실패: 기록 안 함
+        games = split_games(replay_store.load(session_id))
+        actions = [event.action for event in games[-1]]
+        assert actions == ["start"] + ["place"] * _solution(4).moves + ["undo"]
+
+    def test_honest_score_is_verified(self, client):
+        """재생 결과와 같은 점수 저장 테스트"""
+        session_id, result = self._play(client, 4)
+        assert result["is_complete"]
+        response = client.post("/api/progress/save", json={
+            "session_id": session_id, "player_id": "replay-player", "level_id": 4,
+            "moves": result["moves"], "stars": result["stars"]
+        })
+        assert response.status_code == 200
+        assert response.json()["verified"]
+
+    def test_tampered_score_is_rejected(self, client):
+        """재생 결과와 다른 점수 거부 테스트"""
+        session_id, result = self._play(client, 4)
+        response = client.post("/api/progress/save", json={
+            "session_id": session_id, "player_id": "replay-player", "level_id": 4,
+            "moves": result["moves"] - 1, "stars": 3
+        })
+        assert response.status_code == 400
+
+    def test_play_time_comes_from_replay(self, client):
+        """제출한 플레이 시간 대신 리플레이 시작 시각을 순위에 쓰는지 테스트"""
+        solution = _solution(4)
+        replay_store.append("timed-session", encode_start(4, time.time() - 120), *[
+            encode_action("place", x, y, piece_type) for x, y, piece_type in solution.placements
+        ])
+        response = client.post("/api/progress/save", json={
+            "session_id": "timed-session", "player_id": "timed-player", "level_id": 4,
+            "moves": solution.moves, "stars": 3, "play_time": 1
+        })
+        assert response.status_code == 200
+        progress_store.flush()
+        player = client.get("/api/leaderboard/4", params={
+            "by": "time", "player_id": "timed-player"
+        }).json()["player"]
+        assert 120 <= player["time"] < 180
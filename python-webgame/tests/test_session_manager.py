@@ -0,0 +1,229 @@
+"""
+세션 관리자 테스트
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.core.game_engine import HISTORY_NODE_BYTES
+from backend.core.session_manager import SessionManager
+from backend.core.session_store import MemorySessionStore, SessionConflictError
+from backend.main import app, session_manager
+
+
+class FakeClock:
+    """테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSessionManager:
+    """SessionManager 테스트 클래스"""
+
+    def test_sessions_are_isolated(self):
+        """세션마다 별도의 엔진 사용 테스트"""
+        manager = SessionManager()
+        sid_a, engine_a = manager.create()
+        sid_b, engine_b = manager.create()
+        assert sid_a != sid_b
+        assert engine_a is not engine_b
+        assert manager.get(sid_a) is engine_a
+
+    def test_lru_eviction(self):
+        """최대 세션 수 초과 시 LRU 제거 테스트"""
+        manager = SessionManager(max_sessions=2)
+        sid_a, _ = manager.create()
+        sid_b, _ = manager.create()
+        manager.get(sid_a)  # a를 최근 사용으로 갱신
+        sid_c, _ = manager.create()
+        assert sid_a in manager
+        assert sid_b not in manager
+        assert sid_c in manager
+        assert manager.stats()["evicted_sessions"] == 1
+
+    def test_memory_budget_eviction(self):
+        """추정 메모리가 예산을 넘으면 LRU 제거 테스트"""
+        manager = SessionManager(max_bytes=300_000)
+        sessions = []
+        for _ in range(3):
+            sid, engine = manager.create()
+            engine.start_new_game({"id": 0, "grid_size": 400})
+            manager.save(sid, engine)
+            sessions.append(sid)
+        assert [sid in manager for sid in sessions] == [False, False, True]
+        assert manager.stats()["memory_bytes"] == engine.memory_estimate() > 400 * 400
+        assert manager.stats()["evicted_sessions"] == 2
+
+        manager.remove(sessions[2])
+        assert manager.stats()["memory_bytes"] == 0
+
+    def test_history_counts_toward_memory(self):
+        """히스토리와 캐시된 빛 경로가 세션 크기에 포함되는지 테스트"""
+        manager = SessionManager()
+        sid, engine = manager.create()
+        engine.start_new_game({
+            "id": 0, "grid_size": 50,
+            "emitters": [{"x": 0, "y": 10, "direction": "RIGHT", "color": "WHITE"}],
+            "available_pieces": {"splitter": 10}
+        })
+        engine.calculate_light_paths()
+        manager.save(sid, engine)
+        before = manager.stats()["memory_bytes"]
+        for x in range(5, 15):
+            engine.perform_action("place", x, 10, "splitter")
+            engine.calculate_light_paths()
+        manager.save(sid, engine)
+        assert manager.stats()["memory_bytes"] > before + 10 * HISTORY_NODE_BYTES
+
+    def test_on_evict_callback(self):
+        """세션이 없어질 때 on_evict 호출 테스트"""
+        clock = FakeClock()
+        gone = []
+        manager = SessionManager(max_sessions=2, ttl_seconds=10, clock=clock, on_evict=gone.append)
+        sid_a, _ = manager.create()
+        sid_b, _ = manager.create()
+        sid_c, _ = manager.create()
+        assert gone == [sid_a]
+        manager.remove(sid_b)
+        clock.now = 30
+        manager.get(sid_c)
+        assert gone == [sid_a, sid_b, sid_c]
+
+    def test_on_evict_skipped_for_shared_sessions(self):
+        """저장소가 있으면 로컬 캐시에서 밀려나도 on_evict를 호출하지 않는지 테스트"""
+        gone = []
+        manager = SessionManager(max_sessions=1, store=MemorySessionStore(), on_evict=gone.append)
+        sid_a, _ = manager.create()
+        manager.create()
+        assert gone == [] and manager.get(sid_a) is not None
+
+    def test_idle_ttl_eviction(self):
+        """유휴 시간 초과 세션 제거 테스트"""
+        clock = FakeClock()
+        manager = SessionManager(ttl_seconds=10, clock=clock)
+        sid, _ = manager.create()
+        clock.now = 5
+        assert manager.get(sid) is not None
+        clock.now = 14
+        assert manager.get(sid) is not None
+        clock.now = 30
+        assert manager.get(sid) is None
+        assert len(manager) == 0
+
+
+class TestSessionApi:
+    """세션별 API 동작 테스트 클래스"""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def _start(self, client, level_id=1):
+        response = client.post(f"/api/game/start/{level_id}")
+        assert response.status_code == 200
+        return response.json()["session_id"]
+
+    def test_players_do_not_share_state(self, client):
+        """동시 플레이어 간 상태 분리 테스트"""
+        sid_a = self._start(client)
+        sid_b = self._start(TestClient(app))
+        assert sid_a != sid_b
+
+        response = client.post(
+            "/api/game/action",
+            json={"action": "place", "x": 5, "y": 4, "piece_type": "mirror_left"},
+            headers={"X-Session-ID": sid_a}
+        )
+        assert response.json()["success"]
+
+        engine_a = session_manager.get(sid_a)
+        engine_b = session_manager.get(sid_b)
+        assert (5, 4) in engine_a.current_state.placed_pieces
+        assert engine_b.current_state.placed_pieces == {}
+        assert engine_b.available_pieces == engine_a.available_pieces | {
+            "mirror_left": engine_a.available_pieces["mirror_left"] + 1
+        }
+
+    def test_action_without_session(self, client):
+        """세션 없이 액션 요청 시 404 테스트"""
+        response = client.post(
+            "/api/game/action",
+            json={"action": "place", "x": 5, "y": 4, "piece_type": "mirror_left"},
+            headers={"X-Session-ID": "unknown"}
+        )
+        assert response.status_code == 404
+
+    def test_start_conflict_is_409(self, client, monkeypatch):
+        """게임 시작 저장이 다른 워커와 충돌하면 409 테스트"""
+        sid = self._start(client)
+
+        def conflict(session_id, engine):
+            raise SessionConflictError(session_id)
+
+        monkeypatch.setattr(session_manager, "save", conflict)
+        response = client.post("/api/game/start/1", headers={"X-Session-ID": sid})
+        assert response.status_code == 409
+
+    def test_action_delta_response(self, client):
+        """since_version 요청 시 델타 응답 테스트"""
+        response = client.post("/api/game/start/1")
+        sid, version = response.json()["session_id"], response.json()["version"]
+        headers = {"X-Session-ID": sid}
+
+        data = client.post(
+            "/api/game/action",
+            json={"action": "place", "x": 5, "y": 4, "piece_type": "mirror_left",
+                  "since_version": version},
+            headers=headers
+        ).json()
+        assert data["success"] and "game_state" not in data
+        assert data["delta"]["from_version"] == version
+        assert {"x": 5, "y": 4, "cell": "mirror_left"} in data["delta"]["cells"]
+
+        data = client.post(
+            "/api/game/action",
+            json={"action": "check", "x": 0, "y": 0, "since_version": version - 1},
+            headers=headers
+        ).json()
+        assert data["full"] and data["game_state"]["grid"][4][5] == "mirror_left"
+
+    def test_batch_actions(self, client):
+        """일괄 액션 API 테스트"""
+        sid = self._start(client)
+        headers = {"X-Session-ID": sid}
+        data = client.post(
+            "/api/game/actions",
+            json={"actions": [
+                {"action": "place", "x": 5, "y": 4, "piece_type": "mirror_left"},
+                {"action": "place", "x": 5, "y": 7, "piece_type": "mirror_right"},
+            ]},
+            headers=headers
+        ).json()
+        assert data["success"] and data["applied"] == 2
+        assert data["game_state"]["grid"][7][5] == "mirror_right"
+
+        data = client.post(
+            "/api/game/actions",
+            json={"actions": [{"action": "remove", "x": 5, "y": 4},
+                              {"action": "remove", "x": 0, "y": 0}]},
+            headers=headers
+        ).json()
+        assert not data["success"] and data["failed_index"] == 1
+        assert (5, 4) in session_manager.get(sid).current_state.placed_pieces
+
+    def test_undo_redo_api(self, client):
+        """되돌리기/다시 실행 API 테스트"""
+        sid = self._start(client)
+        headers = {"X-Session-ID": sid}
+        client.post("/api/game/action",
+                    json={"action": "place", "x": 5, "y": 4, "piece_type": "mirror_left"},
+                    headers=headers)
+        data = client.post("/api/game/undo", headers=headers).json()
+        assert data["success"] and data["game_state"]["grid"][4][5] == "empty"
+        assert client.post("/api/game/redo", headers=headers).json()["moves"] == 1
+        history = client.get("/api/game/history", headers=headers).json()
+        assert [m["action"] for m in history["moves"]] == ["place"]
+        assert history["can_undo"] and not history["can_redo"]
@@ -0,0 +1,164 @@
+"""
+세션 저장소 테스트 (여러 워커 프로세스가 세션을 공유하는 경우)
+"""
+import pytest
+
+from backend.core.game_engine import GameEngine
+from backend.core.level_manager import LevelManager
+from backend.core.session_manager import SessionManager
+from backend.core.session_store import (
+    MemorySessionStore, SessionConflictError, SessionStore, SqliteSessionStore
+)
+
+LEVELS = LevelManager()
+
+
+def _workers(store, count=2):
+    """같은 저장소를 쓰는 워커별 세션 관리자"""
+    return [SessionManager(store=store, level_loader=LEVELS.get_level) for _ in range(count)]
+
+
+def _snapshot(engine):
+    engine.calculate_light_paths()
+    state = engine.current_state
+    return (
+        bytes(state.grid.cells), dict(state.placed_pieces), dict(engine.available_pieces),
+        engine.current_moves, [t.is_hit for t in state.targets]
+    )
+
+
+class TestSessionExport:
+    """엔진 상태 직렬화/복원 테스트 클래스"""
+
+    def test_roundtrip_restores_board_and_history(self):
+        """배치, 회전, 되돌리기 후 복원 테스트"""
+        engine = GameEngine()
+        engine.start_new_game(LEVELS.get_level(1))
+        engine.perform_action("place", 5, 4, "mirror_left")
+        engine.perform_action("rotate", 5, 4)
+        engine.perform_action("place", 3, 3, "mirror_right")
+        engine.perform_action("remove", 3, 3)
+        engine.undo()
+
+        restored = GameEngine()
+        restored.load_session(LEVELS.get_level(1), engine.export_session())
+        assert _snapshot(restored) == _snapshot(engine)
+        assert restored.version == engine.version
+        assert restored.get_history() == engine.get_history()
+        assert restored.can_redo()
+
+        restored.redo()
+        engine.redo()
+        assert _snapshot(restored) == _snapshot(engine)
+
+    def test_roundtrip_after_history_trim(self, monkeypatch):
+        """히스토리 루트가 잘린 뒤에도 루트 배치로 복원 테스트"""
+        monkeypatch.setattr("backend.core.game_engine.MAX_HISTORY", 3)
+        engine = GameEngine()
+        engine.start_new_game(LEVELS.get_level(1))
+        engine.perform_action("place", 5, 4, "mirror_left")
+        for _ in range(5):
+            engine.perform_action("rotate", 5, 4)
+
+        restored = GameEngine()
+        restored.load_session(LEVELS.get_level(1), engine.export_session())
+        assert _snapshot(restored) == _snapshot(engine)
+        while engine.undo():
+            assert restored.undo()
+            assert _snapshot(restored) == _snapshot(engine)
+        assert not restored.can_undo()
+
+
+class TestSharedSessions:
+    """저장소를 공유하는 세션 관리자 테스트 클래스"""
+
+    @pytest.fixture(params=["memory", "sqlite"])
+    def store(self, request, tmp_path):
+        if request.param == "memory":
+            store = MemorySessionStore()
+        else:
+            store = SqliteSessionStore(tmp_path / "sessions.db")
+        yield store
+        store.close()
+
+    def test_other_worker_sees_updates(self, store):
+        """한 워커의 변경을 다른 워커가 읽는지 테스트"""
+        worker_a, worker_b = _workers(store)
+        sid, engine_a = worker_a.create()
+        engine_a.start_new_game(LEVELS.get_level(1))
+        engine_a.perform_action("place", 5, 4, "mirror_left")
+        worker_a.save(sid, engine_a)
+
+        engine_b = worker_b.get(sid)
+        assert _snapshot(engine_b) == _snapshot(engine_a)
+
+        assert engine_b.undo()
+        worker_b.save(sid, engine_b)
+        engine_a = worker_a.get(sid)
+        assert engine_a.current_state.placed_pieces == {}
+        assert engine_a.can_redo()
+
+    def test_unchanged_session_reuses_local_engine(self, store):
+        """리비전이 같으면 로컬 엔진을 그대로 사용하는지 테스트"""
+        (worker,) = _workers(store, 1)
+        sid, engine = worker.create()
+        engine.start_new_game(LEVELS.get_level(1))
+        worker.save(sid, engine)
+        assert worker.get(sid) is engine
+
+    def test_stale_engine_conflicts(self, store):
+        """다른 워커가 먼저 저장하면 충돌 테스트"""
+        worker_a, worker_b = _workers(store)
+        sid, engine_a = worker_a.create()
+        engine_a.start_new_game(LEVELS.get_level(1))
+        worker_a.save(sid, engine_a)
+
+        engine_b = worker_b.get(sid)
+        engine_b.perform_action("place", 5, 4, "mirror_left")
+        worker_b.save(sid, engine_b)
+
+        engine_a.perform_action("place", 3, 3, "mirror_right")
+        with pytest.raises(SessionConflictError):
+            worker_a.save(sid, engine_a)
+        assert worker_a.get(sid).current_state.placed_pieces == engine_b.current_state.placed_pieces
+
+    def test_incomplete_store_cannot_be_created(self):
+        """추상 메서드를 구현하지 않은 저장소는 생성 시 실패하는지 테스트"""
+        class LoadOnlyStore(SessionStore):
+            def load(self, session_id):
+                return None
+
+        with pytest.raises(TypeError):
+            LoadOnlyStore()
+
+    def test_removed_session_is_gone_everywhere(self, store):
+        """세션 제거 테스트"""
+        worker_a, worker_b = _workers(store)
+        sid, _ = worker_a.create()
+        assert worker_b.get(sid) is not None
+        worker_a.remove(sid)
+        assert worker_b.get(sid) is None
+
+
+class TestSharedCustomLevels:
+    """같은 커스텀 레벨 디렉터리를 쓰는 레벨 관리자 테스트 클래스"""
+
+    def test_levels_saved_by_other_worker(self, tmp_path):
+        """다른 워커가 저장한 레벨 조회와 ID 중복 방지 테스트"""
+        manager_a = LevelManager(custom_dir=tmp_path)
+        manager_b = LevelManager(custom_dir=tmp_path)
+        level = dict(LEVELS.get_level(1), name="A")
+        assert manager_a.save_custom_level(dict(level))
+        assert manager_b.save_custom_level(dict(level, name="B"))
+
+        assert manager_a.refresh()
+        ids = manager_a.get_level_ids()
+        assert len(set(ids)) == len(ids) == LEVELS.get_total_levels() + 2
+        newest = max(ids)
+        assert manager_a.get_level(newest)["name"] == "B"
+
+        version = manager_b.version
+        assert not manager_b.refresh()
+        assert manager_b.version == version
+        page, _ = manager_b.get_levels_page(after=newest - 2)
+        assert [summary["name"] for summary in page] == ["A", "B"]
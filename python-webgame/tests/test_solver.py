@@ -0,0 +1,92 @@
+"""
+레벨 풀이기 테스트
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from backend.core.game_engine import GameEngine
+from backend.core.level_manager import LevelManager
+from backend.core.solver import solve_level, validate_level
+from backend import main
+from backend.main import app
+
+
+LEVELS = LevelManager()
+
+
+class TestLevelSolver:
+    """LevelSolver 테스트 클래스"""
+
+    @pytest.mark.parametrize("level_id", sorted(LEVELS.get_level_ids()))
+    def test_builtin_level_min_moves(self, level_id, level_report):
+        """내장 레벨이 풀리고 min_moves가 정확한지 테스트"""
+        report = level_report(level_id)
+        assert report["complete"]
+        assert report["solvable"]
+        assert report["min_moves"] == report["declared_min_moves"]
+
+    def test_solution_wins_game(self):
+        """풀이를 실제로 적용하면 승리하는지 테스트"""
+        level = LEVELS.get_level(4)
+        solution = solve_level(level).solution
+        engine = GameEngine()
+        engine.start_new_game(level)
+        for x, y, piece_type in solution.placements:
+            assert engine.perform_action("place", x, y, piece_type)
+        engine.calculate_light_paths()
+        assert engine.check_victory()
+
+    def test_unsolvable_level(self):
+        """풀 수 없는 레벨 테스트"""
+        level = dict(LEVELS.get_level(1), available_pieces={"mirror_left": 1})
+        report = validate_level(level)
+        assert report["complete"]
+        assert not report["solvable"]
+
+    def test_search_from_placed_pieces(self):
+        """이미 놓인 조각에서 이어서 풀이 테스트"""
+        result = solve_level(LEVELS.get_level(1), placed={(2, 4): "mirror_left"})
+        assert result.solution.placements == [(2, 6, "mirror_left"), (8, 6, "mirror_right")]
+
+
+class TestLevelUpload:
+    """커스텀 레벨 업로드 테스트 클래스"""
+
+    def test_upload_sets_min_moves(self):
+        """업로드 시 min_moves 계산 테스트"""
+        level = dict(LEVELS.get_level(3), min_moves=99)
+        level.pop("id")
+        response = TestClient(app).post("/api/levels", json=level)
+        assert response.status_code == 200
+        assert response.json()["min_moves"] == 3
+
+    def test_upload_rejects_unsolvable(self):
+        """풀 수 없는 레벨 업로드 거부 테스트"""
+        level = dict(LEVELS.get_level(1), available_pieces={})
+        response = TestClient(app).post("/api/levels", json=level)
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("change", [
+        {"grid_size": "10"},
+        {"walls": [{"x": 10, "y": 0}]},
+        {"walls": [{"x": -1, "y": 3}]},
+        {"targets": [{"x": 9, "y": 4, "required_color": "PINK"}]},
+        {"emitters": [{"x": 0, "y": 4, "direction": "LEFT", "color": "WHITE", "active": True},
+                      {"x": 0, "y": 5.5, "direction": "RIGHT", "color": "WHITE"}]},
+        {"available_pieces": {"wall": 3}},
+        {"available_pieces": {"mirror_left": -1}},
+    ])
+    def test_upload_rejects_malformed(self, change):
+        """형식이 잘못된 레벨 업로드 400 응답 테스트"""
+        level = dict(LEVELS.get_level(1), **change)
+        response = TestClient(app).post("/api/levels", json=level)
+        assert response.status_code == 400
+
+    def test_upload_search_is_time_limited(self, monkeypatch):
+        """풀이 시간 한도를 넘으면 검증되지 않은 레벨로 저장하는지 테스트"""
+        monkeypatch.setattr(main, "UPLOAD_SOLVE_SECONDS", 1e-9)
+        level = dict(LEVELS.get_level(5))
+        level.pop("id")
+        response = TestClient(app).post("/api/levels", json=level)
+        assert response.status_code == 200
+        assert not response.json()["verified"]